@@ -0,0 +1,189 @@
+# Benchmark setup
+import asyncio
+import time
+from email.utils import formatdate
+
+from rich import print
+
+import storm.core.application as application_module
+from storm.common.decorators import Controller, Get, Module, Raw
+from storm.common.enums.content_type import ContentType
+from storm.common.enums.http_headers import HttpHeaders
+from storm.core.adapters.http_request import HttpRequest, HttpRequestEnums
+from storm.core.adapters.http_response import HttpResponse, RawResponse
+from storm.core.application import StormApplication
+
+
+class EagerHttpRequest(HttpRequest):
+    """
+    The previous HttpRequest: headers, query parameters and cookies are parsed in the
+    constructor whether the handler reads them or not. Kept here as a baseline.
+    """
+
+    def __init__(self, scope, receive, send):
+        super().__init__(scope, receive, send)
+        self.headers = self._parse_headers(scope.get(HttpRequestEnums.HEADERS, []))
+        self.query_params = self._parse_query_params(scope.get(HttpRequestEnums.QUERY_STRING, b""))
+        self.cookies = self._parse_cookies(self.headers.get(HttpRequestEnums.COOKIE, ""))
+
+
+class PerRequestHeadersHttpResponse(HttpResponse):
+    """
+    The previous HttpResponse: the default headers and the Date header are formatted and
+    encoded on every response. Kept here as a baseline.
+    """
+
+    @staticmethod
+    def from_request(request, content=None, status_code=200, headers=None):
+        headers = headers or {}
+        headers[HttpHeaders.X_POWERED_BY] = "Storm"
+        headers[HttpHeaders.DATE] = formatdate(timeval=None, usegmt=True)
+        headers[HttpHeaders.CONNECTION] = "keep-alive"
+        headers[HttpHeaders.KEEP_ALIVE] = "timeout=5"
+        return PerRequestHeadersHttpResponse(content=content, status_code=status_code, headers=headers, content_type=ContentType.JSON)
+
+
+HEALTH_RESPONSE = RawResponse("ok", content_type=ContentType.PLAIN)
+
+
+@Controller("/")
+class HealthController:
+    @Get("/health")
+    async def health(self):
+        return "ok"
+
+    @Get("/health/raw")
+    @Raw()
+    async def raw_health(self):
+        return HEALTH_RESPONSE
+
+
+async def bare_asgi_app(scope, receive, send):
+    """
+    The same health check written against ASGI directly, the upper bound for @Raw routes.
+    """
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain"), (b"content-length", b"2")]})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+@Module(controllers=[HealthController])
+class BenchmarkModule:
+    pass
+
+
+def make_scope(path="/health"):
+    """
+    Builds the scope of a minimal browser-like GET, as sent by uvicorn.
+    """
+    return {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "root_path": "",
+        "query_string": b"utm_source=newsletter&utm_medium=email&utm_campaign=launch&ref=home",
+        "headers": [
+            (b"host", b"example.com"),
+            (b"user-agent", b"Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"),
+            (b"accept", b"text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"),
+            (b"accept-encoding", b"gzip, deflate, br"),
+            (b"accept-language", b"en-US,en;q=0.9"),
+            (b"cookie", b"session=4f9c2a; theme=dark; _ga=GA1.2.1234567890.1700000000; _gid=GA1.2.987654321.1700000000"),
+            (b"connection", b"keep-alive"),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+
+
+def benchmark_asgi(app, request_class, response_class=HttpResponse, n_requests=20000, path="/health"):
+    """
+    Sends minimal GET requests through the whole ASGI entry point.
+
+    :param request_class: The HttpRequest class used by the application
+    :param response_class: The HttpResponse class used by the application
+    :param path: The path of the requests
+    :return: The average time per request, in microseconds
+    """
+    application_module.HttpRequest = request_class
+    application_module.HttpResponse = response_class
+    scope = make_scope(path)
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    async def run():
+        for _ in range(n_requests):
+            await app(scope, receive, send)
+
+    try:
+        start_time = time.perf_counter()
+        asyncio.run(run())
+        end_time = time.perf_counter()
+    finally:
+        application_module.HttpRequest = HttpRequest
+        application_module.HttpResponse = HttpResponse
+
+    return (end_time - start_time) / n_requests * 1_000_000
+
+
+def benchmark_headers(response_class, n_responses=100000):
+    """
+    Builds a response for a minimal GET and encodes its headers, as done before sending.
+
+    :param response_class: The HttpResponse class used by the application
+    :return: The average time per response, in microseconds
+    """
+    request = HttpRequest(make_scope(), None, None)
+    start_time = time.perf_counter()
+    for _ in range(n_responses):
+        response_class.from_request(request, "ok").encode_headers()
+    end_time = time.perf_counter()
+    return (end_time - start_time) / n_responses * 1_000_000
+
+
+if __name__ == "__main__":
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+
+    app = StormApplication(BenchmarkModule)
+    app._load_routes()
+
+    table = Table(title="ASGI Minimal GET (20,000 requests)")
+    table.add_column("Variant", style="cyan")
+    table.add_column("Time (µs/req)", justify="right", style="green")
+
+    variants = (
+        ("eager parsing, per-request headers", EagerHttpRequest, PerRequestHeadersHttpResponse),
+        ("lazy parsing, per-request headers", HttpRequest, PerRequestHeadersHttpResponse),
+        ("lazy parsing, pre-encoded headers", HttpRequest, HttpResponse),
+    )
+    for label, request_class, response_class in variants:
+        print(f"Benchmarking the ASGI entry point ({label})...")
+        benchmark_asgi(app, request_class, response_class, n_requests=2000)  # warm up
+        table.add_row(label, f"{benchmark_asgi(app, request_class, response_class):.2f}")
+
+    for label, target, path in (("@Raw route", app, "/health/raw"), ("bare ASGI app", bare_asgi_app, "/health")):
+        print(f"Benchmarking the ASGI entry point ({label})...")
+        benchmark_asgi(target, HttpRequest, n_requests=2000, path=path)  # warm up
+        table.add_row(label, f"{benchmark_asgi(target, HttpRequest, path=path):.2f}")
+
+    console.print(table)
+
+    table = Table(title="Response headers (100,000 responses)")
+    table.add_column("Variant", style="cyan")
+    table.add_column("Time (µs/response)", justify="right", style="green")
+
+    for label, response_class in (("per-request headers", PerRequestHeadersHttpResponse), ("pre-encoded headers", HttpResponse)):
+        print(f"Benchmarking the response headers ({label})...")
+        benchmark_headers(response_class, n_responses=10000)  # warm up
+        table.add_row(label, f"{benchmark_headers(response_class):.2f}")
+
+    console.print(table)
@@ -0,0 +1,64 @@
+# Benchmark setup
+import time
+
+from rich import print
+
+from storm.common.serializer.json_codec import JSON_CODECS, create_json_codec, set_json_codec
+from storm.core.adapters.http_response import HttpResponse
+
+PAYLOAD = {
+    "users": [
+        {"id": i, "name": f"user-{i}", "email": f"user-{i}@example.com", "active": i % 2 == 0, "score": i * 1.5, "tags": ["a", "b"]}
+        for i in range(100)
+    ],
+    "total": 100,
+    "page": 1,
+}
+
+
+def benchmark_codec(codec, n_iterations=2000):
+    """
+    Encodes and decodes a list payload with a codec, and encodes it through a response.
+
+    :return: A tuple (dumps, loads, response) of average times, in microseconds
+    """
+    encoded = codec.dumps(PAYLOAD)
+    results = []
+    for operation in (lambda: codec.dumps(PAYLOAD), lambda: codec.loads(encoded)):
+        start_time = time.perf_counter()
+        for _ in range(n_iterations):
+            operation()
+        results.append((time.perf_counter() - start_time) / n_iterations * 1_000_000)
+
+    # Content-Length and ETag, as for a JSON response (the body is then sent as is)
+    start_time = time.perf_counter()
+    for _ in range(n_iterations):
+        response = HttpResponse()
+        response.update_content(PAYLOAD)
+        response.set_etag()
+    results.append((time.perf_counter() - start_time) / n_iterations * 1_000_000)
+    return tuple(results)
+
+
+if __name__ == "__main__":
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+
+    table = Table(title="JSON codecs (100 users payload)")
+    table.add_column("Codec", style="cyan")
+    table.add_column("dumps (µs)", justify="right", style="green")
+    table.add_column("loads (µs)", justify="right", style="green")
+    table.add_column("response (µs)", justify="right", style="green")
+
+    for name in JSON_CODECS:
+        try:
+            codec = set_json_codec(create_json_codec(name))
+        except ImportError:
+            print(f"Skipping the {name} codec (not installed)")
+            continue
+        print(f"Benchmarking the {name} codec...")
+        table.add_row(name, *(f"{value:.2f}" for value in benchmark_codec(codec)))
+
+    console.print(table)
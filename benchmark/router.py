@@ -1,8 +1,16 @@
 # Benchmark setup
+import asyncio
+import random
+import re
 import time
 
 from rich import print
 
+from storm.common.enums.versioning_type import VersioningType
+from storm.common.exceptions.http import NotFoundException
+from storm.core.adapters.http_request import HttpRequest
+from storm.core.adapters.http_response import HttpResponse, route_miss_response
+from storm.core.appliction_config import ApplicationConfig
 from storm.core.context import AppContext
 from storm.core.router.router import Router
 from storm.core.settings import get_settings
@@ -40,6 +48,201 @@ def benchmark_router(router_class, n_static=5000, n_dynamic=5000, n_requests=100
     return end_time - start_time
 
 
+class LinearScanRouter:
+    """
+    The previous dynamic route resolution: every `(specificity, path, regex, handler)`
+    tuple is tried in order until one regex matches. Kept here as a baseline.
+    """
+
+    def __init__(self):
+        self.static_routes = {}
+        self.dynamic_routes = []
+
+    def add_route(self, method, path, handler, version=None):
+        if ":" in path:
+            specificity = len([segment for segment in path.split("/") if not segment.startswith(":")])
+            path_regex = re.compile(re.sub(r":(\w+)", r"(?P<\1>[^/]+)", path) + r"/?$")
+            self.dynamic_routes.append((specificity, path, path_regex, handler))
+        else:
+            self.static_routes[path] = handler
+
+    def resolve(self, method, path):
+        if path in self.static_routes:
+            return self.static_routes[path], {}
+        for _specificity, _path, path_regex, route_handler in self.dynamic_routes:
+            match = path_regex.match(path)
+            if match:
+                return route_handler, match.groupdict()
+        raise ValueError(f"No route found for {method} {path}")
+
+
+def benchmark_route_scale(router_class, n_routes, n_requests=2000, miss_ratio=0.5):
+    """
+    Resolves a mix of hits and misses against `n_routes` parameterised routes.
+
+    :return: The average resolve time per request, in microseconds
+    """
+    router = router_class()
+    for i in range(n_routes):
+        router.add_route("GET", f"/api/resource{i}/:id/items/:item_id", handler)
+    if isinstance(router, LinearScanRouter):
+        router.dynamic_routes.sort(key=lambda route: route[:2], reverse=True)
+    else:
+        router.compile()
+
+    rng = random.Random(42)
+    paths = []
+    for _ in range(n_requests):
+        if rng.random() < miss_ratio:
+            paths.append(f"/api/unknown{rng.randrange(n_routes)}/1/items/2")
+        else:
+            paths.append(f"/api/resource{rng.randrange(n_routes)}/1/items/2")
+
+    start_time = time.perf_counter()
+    for path in paths:
+        try:
+            router.resolve("GET", path)
+        except ValueError:
+            pass
+    end_time = time.perf_counter()
+
+    return (end_time - start_time) / n_requests * 1_000_000
+
+
+def benchmark_registration(n_routes):
+    """
+    Registers `n_routes` parameterised routes and compiles the route table.
+
+    :return: The total cold start time, in milliseconds
+    """
+    start_time = time.perf_counter()
+    router = Router()
+    for i in range(n_routes):
+        router.add_route("GET", f"/api/resource{i}/:id/items/:item_id", handler)
+    router.compile()
+    end_time = time.perf_counter()
+
+    return (end_time - start_time) * 1000
+
+
+def make_request(path, headers=None):
+    """
+    Builds an HttpRequest from a minimal ASGI scope.
+    """
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "headers": [(key.encode("latin-1"), value.encode("latin-1")) for key, value in (headers or {}).items()],
+        "query_string": b"",
+    }
+    return HttpRequest(scope, None, None)
+
+
+def benchmark_resolve_cache(cache_size, n_routes=5000, n_hot_paths=300, n_requests=100000):
+    """
+    Resolves full requests (path normalization, version extraction, lookup) where the traffic
+    concentrates on a few hundred concrete URLs.
+
+    :return: A tuple (average time per request in microseconds, cache hit rate)
+    """
+    router = Router(ApplicationConfig(), cache_size=cache_size)
+    for i in range(n_routes):
+        router.add_route("GET", f"/api/resource{i}/:id", handler)
+    router.compile()
+
+    rng = random.Random(42)
+    hot_requests = [make_request(f"/api/resource{rng.randrange(n_routes)}/{i}") for i in range(n_hot_paths)]
+    requests = [hot_requests[rng.randrange(n_hot_paths)] for _ in range(n_requests)]
+
+    start_time = time.perf_counter()
+    for request in requests:
+        router.resolve("GET", request.path, request=request)
+    end_time = time.perf_counter()
+
+    hit_rate = router.cache.stats()["hit_rate"] if router.cache else 0.0
+    return (end_time - start_time) / n_requests * 1_000_000, hit_rate
+
+
+def benchmark_versioning(versioning=None, n_routes=1000, n_requests=100000):
+    """
+    Resolves full requests with the given versioning options, bypassing the resolve cache.
+
+    :param versioning: A tuple (options, path template, headers) or None for an unversioned app
+    :return: The average time per request, in microseconds
+    """
+    config = ApplicationConfig()
+    config.set_global_prefix("api")
+    path_template, headers = "/api/resource{i}/{i}", None
+    if versioning:
+        options, path_template, headers = versioning
+        config.enable_versioning(options)
+
+    router = Router(config, cache_size=0)
+    for i in range(n_routes):
+        router.add_route("GET", f"/api/resource{i}/:id", handler, version="1" if versioning else None)
+    router.compile()
+
+    requests = [make_request(path_template.format(i=i % n_routes), headers) for i in range(1000)]
+
+    start_time = time.perf_counter()
+    for i in range(n_requests):
+        request = requests[i % 1000]
+        router.resolve("GET", request.path, request=request)
+    end_time = time.perf_counter()
+
+    return (end_time - start_time) / n_requests * 1_000_000
+
+
+def benchmark_miss_heavy(fast_path, n_routes=1000, n_requests=50000, miss_ratio=0.9):
+    """
+    Answers scanner-like traffic where most requests hit unknown paths, from route lookup to
+    the ASGI send of the 404.
+
+    :param fast_path: True to use `Router.match` and the pre-encoded responses, False for the
+        former ValueError -> NotFoundException -> HttpResponse.from_error round trip
+    :return: The average time per request, in microseconds
+    """
+    router = Router(ApplicationConfig(), cache_size=0)
+    for i in range(n_routes):
+        router.add_route("GET", f"/api/resource{i}/:id", handler)
+    router.compile()
+
+    rng = random.Random(42)
+    requests = []
+    for i in range(1000):
+        if rng.random() < miss_ratio:
+            requests.append(make_request(f"/wp-admin/{rng.randrange(1_000_000)}.php"))
+        else:
+            requests.append(make_request(f"/api/resource{i % n_routes}/{i}"))
+
+    async def send(message):
+        pass
+
+    async def run():
+        for i in range(n_requests):
+            request = requests[i % 1000]
+            if fast_path:
+                route = router.match("GET", request.path, request=request)
+                if not route:
+                    await route_miss_response(route.allowed_methods).send(send)
+                continue
+            try:
+                try:
+                    router.resolve("GET", request.path, request=request)
+                except ValueError as e:
+                    raise NotFoundException(message=f"Cannot GET {request.path}") from e
+            except NotFoundException as exc:
+                await HttpResponse.from_error(exc).send(send)
+
+    start_time = time.perf_counter()
+    asyncio.run(run())
+    end_time = time.perf_counter()
+
+    return (end_time - start_time) / n_requests * 1_000_000
+
+
 if __name__ == "__main__":
     import threading
 
@@ -100,3 +303,63 @@ if __name__ == "__main__":
     table.add_row("Concurrent Stress Test", "100,000", f"{concurrent_time * 1000:.2f}")
 
     console.print(table)
+
+    scale_table = Table(title="Dynamic Route Scaling (50% misses)")
+    scale_table.add_column("Routes", justify="right", style="cyan")
+    scale_table.add_column("Linear scan (µs/req)", justify="right", style="magenta")
+    scale_table.add_column("Radix tree (µs/req)", justify="right", style="green")
+    scale_table.add_column("Speedup", justify="right", style="yellow")
+    scale_table.add_column("Register + compile (ms)", justify="right", style="blue")
+
+    for n_routes in (10_000, 50_000):
+        print(f"Benchmarking route resolution with {n_routes} dynamic routes...")
+        linear_time = benchmark_route_scale(LinearScanRouter, n_routes)
+        tree_time = benchmark_route_scale(Router, n_routes)
+        compile_time = benchmark_registration(n_routes)
+        scale_table.add_row(
+            f"{n_routes:,}",
+            f"{linear_time:.2f}",
+            f"{tree_time:.2f}",
+            f"{linear_time / tree_time:.0f}x",
+            f"{compile_time:.2f}",
+        )
+
+    console.print(scale_table)
+
+    cache_table = Table(title="Resolve Cache (300 hot URLs, 100,000 requests)")
+    cache_table.add_column("Cache", style="cyan")
+    cache_table.add_column("Hit rate", justify="right", style="magenta")
+    cache_table.add_column("Time (µs/req)", justify="right", style="green")
+
+    for label, cache_size in (("off", 0), ("on (1024 entries)", 1024)):
+        print(f"Benchmarking resolve with the cache {label}...")
+        request_time, hit_rate = benchmark_resolve_cache(cache_size)
+        cache_table.add_row(label, f"{hit_rate:.1%}", f"{request_time:.2f}")
+
+    console.print(cache_table)
+
+    versioning_table = Table(title="Version Extraction (100,000 requests, cache off)")
+    versioning_table.add_column("Versioning", style="cyan")
+    versioning_table.add_column("Time (µs/req)", justify="right", style="green")
+
+    versioning_cases = {
+        "none": None,
+        "URI": ({"type": VersioningType.URI}, "/api/v1/resource{i}/{i}", None),
+        "HEADER": ({"type": VersioningType.HEADER, "header": "X-API-Version"}, "/api/resource{i}/{i}", {"x-api-version": "1"}),
+        "MEDIA_TYPE": ({"type": VersioningType.MEDIA_TYPE, "key": "v="}, "/api/resource{i}/{i}", {"accept": "application/json;v=1"}),
+    }
+    for label, versioning in versioning_cases.items():
+        print(f"Benchmarking version extraction ({label})...")
+        versioning_table.add_row(label, f"{benchmark_versioning(versioning):.2f}")
+
+    console.print(versioning_table)
+
+    miss_table = Table(title="Miss-heavy Traffic (90% unknown paths, 50,000 requests)")
+    miss_table.add_column("Negative path", style="cyan")
+    miss_table.add_column("Time (µs/req)", justify="right", style="green")
+
+    for label, fast_path in (("exception + from_error", False), ("RouteMiss + pre-encoded", True)):
+        print(f"Benchmarking miss-heavy traffic ({label})...")
+        miss_table.add_row(label, f"{benchmark_miss_heavy(fast_path):.2f}")
+
+    console.print(miss_table)
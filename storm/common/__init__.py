@@ -1,14 +1,22 @@
 from .decorators import (
     Body,
+    BodyLimit,
+    Compress,
     Controller,
     Delete,
+    ETag,
+    ETagPolicy,
+    File,
+    Form,
     Get,
     Head,
     Headers,
     Host,
+    HostParam,
     HttpCode,
     Injectable,
     Ip,
+    LastModified,
     Module,
     Optional,
     Options,
@@ -17,12 +25,14 @@ from .decorators import (
     Post,
     Put,
     Query,
+    Raw,
     Sse,
+    StreamJson,
     UseMiddleware,
     UsePipes,
     Version,
 )
-from .enums import HttpHeaders, HttpStatus, VersioningType
+from .enums import ETagMode, HttpHeaders, HttpStatus, JsonStreamFormat, VersioningType
 from .exceptions import (
     BadRequestException,
     ForbiddenException,
@@ -63,10 +73,18 @@ __all__ = [
     "Controller",
     "UseMiddleware",
     "Body",
+    "File",
+    "Form",
+    "BodyLimit",
+    "Compress",
+    "ETagPolicy",
+    "ETag",
+    "LastModified",
     "Query",
     "Headers",
     "Ip",
     "Host",
+    "HostParam",
     "Param",
     "UsePipes",
     "HttpCode",
@@ -84,6 +102,8 @@ __all__ = [
     "IPWhitelistGuard",
     "Logger",
     "Sse",
+    "StreamJson",
+    "Raw",
     "ExecutionContext",
     "OnModuleInit",
     "OnModuleDestroy",
@@ -97,5 +117,7 @@ __all__ = [
     "InternalServerErrorException",
     "Interceptor",
     "VersioningType",
+    "ETagMode",
+    "JsonStreamFormat",
     "Version",
 ]
@@ -1,17 +1,27 @@
 from .body import Body
+from .body_limit import BodyLimit
+from .compress import Compress
 from .controller import Controller
+from .etag import ETag
+from .etag_policy import ETagPolicy
+from .file import File
+from .form import Form
 from .headers import Headers
 from .host import Host
+from .host_param import HostParam
 from .http_ import Delete, Get, Head, Options, Patch, Post, Put
 from .http_code import HttpCode
 from .injectable import Injectable
 from .ip import Ip
+from .last_modified import LastModified
 from .module import Module
 from .optional import Optional
 from .param import Param
 from .query_params import Query
+from .raw import Raw
 from .request import Req, Request
 from .sse import Sse
+from .stream_json import StreamJson
 from .use_middleware import UseMiddleware
 from .use_pipes import UsePipes
 from .version import Version
@@ -31,14 +41,24 @@ __all__ = [
     "UseMiddleware",
     "Injectable",
     "Body",
+    "File",
+    "Form",
+    "BodyLimit",
+    "Compress",
+    "Raw",
+    "ETagPolicy",
+    "ETag",
+    "LastModified",
     "Query",
     "Headers",
     "Ip",
     "Host",
+    "HostParam",
     "Param",
     "UsePipes",
     "HttpCode",
     "Optional",
     "Sse",
+    "StreamJson",
     "Version",
 ]
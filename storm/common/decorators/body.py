@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from functools import wraps
 
 from storm.common.execution_context import ExecutionContext
@@ -24,10 +25,14 @@ class Body:
         request = ExecutionContext.get_request()
         if request is None:
             raise ValueError("No request found in the execution context")
+        await request.parse_body()
         body = request.get_body()
 
         # Get the specific field from the body or use the entire body
-        result = body.get(self.param_name) if self.param_name else body
+        if self.param_name:
+            result = body.get(self.param_name) if isinstance(body, Mapping) else None
+        else:
+            result = body
 
         # Apply the pipe if provided
         if self.pipe and result is not None:
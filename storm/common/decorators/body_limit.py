@@ -0,0 +1,16 @@
+def BodyLimit(max_size: int):
+    """
+    Decorator to override the maximum request body size (the `max_body_size` setting)
+    for a route handler. Larger bodies are rejected with a 413.
+
+    :param max_size: The maximum body size in bytes, 0 for no limit.
+    """
+    if max_size < 0:
+        raise ValueError("The body size limit must be a positive integer or 0.")
+
+    def decorator(func):
+        # Read by the application once the route is resolved, before the body is received
+        func._body_limit = max_size
+        return func
+
+    return decorator
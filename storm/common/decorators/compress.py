@@ -0,0 +1,21 @@
+from typing import Optional
+
+
+def Compress(enabled: bool = True, min_size: Optional[int] = None):
+    """
+    Decorator to enable or disable response compression for a route handler, overriding the
+    `compression_enabled` setting.
+
+    :param enabled: Whether the responses of the route are compressed.
+    :param min_size: The minimum body size to compress, defaults to the `compression_min_size` setting.
+    """
+    if min_size is not None and min_size < 0:
+        raise ValueError("The minimum size must be a positive integer or 0.")
+
+    def decorator(func):
+        # Read by the application once the handler has returned
+        func._compression = enabled
+        func._compression_min_size = min_size
+        return func
+
+    return decorator
@@ -1,9 +1,11 @@
-def Controller(base_path="", middleware=None):
+def Controller(base_path="", middleware=None, host=None):
     """
     A decorator for registering a controller and its routes.
 
     :param base_path: The base path for the controller's routes.
     :param middleware: Optional middleware to be applied to the controller's routes.
+    :param host: Optional host(s) the controller's routes are bound to, either exact
+        ('api.example.com') or with parameters (':tenant.example.com').
     """
 
     if middleware is None:
@@ -12,6 +14,7 @@ def Controller(base_path="", middleware=None):
     def decorator(cls):
         cls.__base_path__ = base_path
         cls.__middleware__ = middleware
+        cls.__host__ = host
         return cls
 
     return decorator
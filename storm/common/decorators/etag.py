@@ -0,0 +1,24 @@
+from typing import Any, Callable
+
+
+def ETag(validator: Callable[..., Any], weak: bool = False):
+    """
+    Decorator to give a route a cheap ETag validator, computed before the handler runs.
+
+    The validator receives the route parameters it declares as keyword arguments (and the
+    HttpRequest if it declares a `request` parameter), may be async, and returns the entity
+    tag, e.g. a row version, or None to fall back to the regular handling. A GET whose
+    If-None-Match matches is answered with a 304 without running interceptors, the handler,
+    serialization or hashing; other responses carry the ETag.
+
+    :param validator: The function computing the entity tag.
+    :param weak: Whether the entity tag is weak (default False).
+    """
+
+    def decorator(func):
+        # Read by the application once the route is resolved, before the pipeline runs
+        func._etag_validator = validator
+        func._etag_weak = weak
+        return func
+
+    return decorator
@@ -0,0 +1,18 @@
+from storm.common.enums.etag_mode import ETagMode
+
+
+def ETagPolicy(mode: ETagMode):
+    """
+    Decorator to override when the ETag of a route's responses is computed (the `etag_mode`
+    setting): always, only for conditional requests, or never.
+
+    :param mode: An ETagMode (or its value: "always", "conditional", "never").
+    """
+    mode = ETagMode(mode)
+
+    def decorator(func):
+        # Read by the application once the handler has returned
+        func._etag_mode = mode
+        return func
+
+    return decorator
@@ -0,0 +1,56 @@
+from functools import wraps
+
+from storm.common.execution_context import ExecutionContext
+
+
+class File:
+    """
+    A unified decorator and parameter resolver for the files of a multipart/form-data body.
+    Files are injected as UploadFile objects (a list when the field is repeated).
+
+    :param param_name: The name of the file field to extract. When used as a parameter
+                       default, defaults to the name of the parameter.
+    :param pipe: An optional pipe to validate or transform the UploadFile.
+    """
+
+    def __init__(self, param_name=None, pipe=None):
+        self.param_name = param_name
+        self.pipe = pipe
+
+    async def resolve(self, default_name=None):
+        """
+        Resolve the upload file from the request, optionally applying a pipe.
+
+        :param default_name: The field name to use when none was given (the parameter name).
+        """
+        request = ExecutionContext.get_request()
+        if request is None:
+            raise ValueError("No request found in the execution context")
+        _fields, files = await request.form()
+
+        name = self.param_name or default_name
+        result = files.get(name) if name else files
+
+        # Apply the pipe if provided
+        if self.pipe and result is not None:
+            # Instantiate the pipe if it's a class
+            pipe_instance = self.pipe() if isinstance(self.pipe, type) else self.pipe
+            result = await pipe_instance.transform(result, metadata={"type": "file", "data": name})
+
+        return result
+
+    def __call__(self, func=None):
+        # If called without a function, resolve the value synchronously for default arguments
+        if func is None:
+            import asyncio
+
+            return asyncio.run(self.resolve())
+
+        # If called as a decorator
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            value = await self.resolve()
+            kwargs[self.param_name or "files"] = value
+            return await func(*args, **kwargs)
+
+        return wrapper
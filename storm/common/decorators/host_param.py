@@ -0,0 +1,69 @@
+from functools import wraps
+
+from storm.common.execution_context import ExecutionContext
+
+
+class HostParam:
+    """
+    Injects a value captured by the host pattern of the controller,
+    e.g. 'tenant' for `@Controller(host=":tenant.example.com")`.
+
+    :param param_name: The name of the host parameter to inject or resolve.
+                       If None, all host parameters will be passed.
+    :param pipe: An optional class or instance of a Pipe to transform or validate the parameter.
+    """
+
+    def __init__(self, param_name=None, pipe=None):
+        self.param_name = param_name
+        self.pipe = pipe
+
+    async def resolve(self):
+        """
+        Dynamically resolve the host parameter value or all host parameters, applying the pipe if specified.
+        """
+        request = ExecutionContext.get_request()
+        if request is None:
+            raise ValueError("No request object found in execution context")
+        host_params = request.get_host_params()
+
+        # Get the parameter value or all parameters
+        if self.param_name is None:
+            result = host_params
+        else:
+            result = host_params.get(self.param_name)
+
+        # Apply the pipe if it exists
+        if self.pipe and result is not None:
+            # Instantiate the pipe if it's a class
+            pipe_instance = self.pipe() if isinstance(self.pipe, type) else self.pipe
+            result = await pipe_instance.transform(result, metadata={"param_name": self.param_name})
+        return result
+
+    def __call__(self, func=None):
+        # If called without a function, resolve the value synchronously for default arguments
+        if func is None:
+            import asyncio
+
+            return asyncio.run(self.resolve())
+
+        # If called with a function, act as a decorator
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            # Get the current request from the execution context
+            request = ExecutionContext.get_request()
+            host_params = request.get_host_params()
+
+            # Resolve the parameter value and apply the pipe if necessary
+            if self.param_name in host_params:
+                value = host_params[self.param_name]
+                if self.pipe:
+                    pipe_instance = self.pipe() if isinstance(self.pipe, type) else self.pipe
+                    value = await pipe_instance.transform(value, metadata={"param_name": self.param_name})
+                kwargs[self.param_name] = value
+            else:
+                kwargs[self.param_name or "host_params"] = host_params
+
+            # Call the original function with updated kwargs
+            return await func(*args, **kwargs)
+
+        return wrapper
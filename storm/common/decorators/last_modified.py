@@ -0,0 +1,22 @@
+from typing import Any, Callable
+
+
+def LastModified(validator: Callable[..., Any]):
+    """
+    Decorator to give a route a cheap Last-Modified validator, computed before the handler runs.
+
+    The validator receives the route parameters it declares as keyword arguments (and the
+    HttpRequest if it declares a `request` parameter), may be async, and returns a datetime
+    or a POSIX timestamp, or None to fall back to the regular handling. A GET whose
+    If-Modified-Since is not older is answered with a 304 without running interceptors, the
+    handler, serialization or hashing; other responses carry the Last-Modified header.
+
+    :param validator: The function computing the modification time.
+    """
+
+    def decorator(func):
+        # Read by the application once the route is resolved, before the pipeline runs
+        func._last_modified_validator = validator
+        return func
+
+    return decorator
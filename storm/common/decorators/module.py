@@ -1,13 +1,14 @@
 from storm.core.module import ModuleBase
 
 
-def Module(imports=None, providers=None, controllers=None):
+def Module(imports=None, providers=None, controllers=None, mounts=None):
     """
     Registers a module with its imports, providers, and controllers.
 
     :param imports: List of imported modules
     :param providers: List of providers (services)
     :param controllers: List of controllers
+    :param mounts: List of (prefix, ASGI application) mounted by the application
     :return: The decorated class as a module
     """
 
@@ -16,6 +17,7 @@ def Module(imports=None, providers=None, controllers=None):
             imports=imports or [],
             providers=providers or [],
             controllers=controllers or [],
+            mounts=mounts or [],
             module_cls=cls,
         )
         module.__name__ = cls.__name__
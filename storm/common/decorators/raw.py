@@ -0,0 +1,14 @@
+def Raw():
+    """
+    Decorator to send the result of a route handler as is, for the hottest endpoints (health
+    checks, small cached payloads). The handler returns a `RawResponse`, ideally built once,
+    or bytes / str; no default headers, ETag, conditional request handling, content
+    negotiation or compression is applied to it.
+    """
+
+    def decorator(func):
+        # Read by the application before the response is built
+        func._raw = True
+        return func
+
+    return decorator
@@ -0,0 +1,19 @@
+from storm.common.enums.json_stream_format import JsonStreamFormat
+
+
+def StreamJson(format: JsonStreamFormat = JsonStreamFormat.ARRAY):
+    """
+    Decorator to stream the collection returned by a route handler as JSON, one item at a
+    time, instead of encoding it as a whole. The handler may return a list, a generator or
+    an async generator of JSON-serializable items.
+
+    :param format: JsonStreamFormat.ARRAY for a JSON array, JsonStreamFormat.NDJSON for one object per line.
+    """
+    format = JsonStreamFormat(format)
+
+    def decorator(func):
+        # Read by the application once the handler has returned
+        func._json_stream = format
+        return func
+
+    return decorator
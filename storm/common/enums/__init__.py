@@ -1,10 +1,13 @@
 from .cache_control import CacheControl
 from .compress_algorithm import CompressionAlgorithm
+from .content_encoding import ContentEncoding
 from .content_type import ContentType
 from .corss_setting import CORSSetting
+from .etag_mode import ETagMode
 from .http_headers import HttpHeaders
 from .http_method import HttpMethod
 from .http_status import HttpStatus
+from .json_stream_format import JsonStreamFormat
 from .log_level import LogLevel
 from .mime_type import MimeType
 from .notification_type import NotificationType
@@ -27,5 +30,8 @@ __all__ = [
     "CORSSetting",
     "CompressionAlgorithm",
     "ContentType",
+    "ContentEncoding",
     "VersioningType",
+    "ETagMode",
+    "JsonStreamFormat",
 ]
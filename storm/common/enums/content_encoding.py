@@ -0,0 +1,9 @@
+from enum import StrEnum
+
+
+class ContentEncoding(StrEnum):
+    BROTLI = "br"
+    ZSTD = "zstd"
+    GZIP = "gzip"
+    DEFLATE = "deflate"
+    IDENTITY = "identity"
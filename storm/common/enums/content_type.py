@@ -11,6 +11,7 @@ class ContentType(StrEnum):
 
     # JSON & XML
     JSON = "application/json; charset=utf-8"
+    NDJSON = "application/x-ndjson"
     XML = "application/xml"
     TEXT_XML = "text/xml"
 
@@ -27,6 +28,8 @@ class ContentType(StrEnum):
     OCTET_STREAM = "application/octet-stream"
     PDF = "application/pdf"
     ZIP = "application/zip"
+    MSGPACK = "application/msgpack"
+    AVRO = "application/avro"
 
     # Audio & Video
     MP3 = "audio/mpeg"
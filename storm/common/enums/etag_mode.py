@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class ETagMode(StrEnum):
+    ALWAYS = "always"  # every response gets an ETag
+    CONDITIONAL = "conditional"  # only when the request has an If-None-Match / If-Match header
+    NEVER = "never"
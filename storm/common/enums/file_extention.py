@@ -12,6 +12,10 @@ class FileExtension(StrEnum):
     JSON = ".json"
     XML = ".xml"
     HTML = ".html"
+    CSS = ".css"
+    JS = ".js"
+    SVG = ".svg"
+    ICO = ".ico"
     JPEG = ".jpeg"
     JPG = ".jpg"
     PNG = ".png"
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class JsonStreamFormat(StrEnum):
+    ARRAY = "array"  # a single JSON array, written one item at a time
+    NDJSON = "ndjson"  # newline delimited JSON, one object per line
@@ -6,6 +6,10 @@ class MimeType(StrEnum):
     APPLICATION_XML = "application/xml"
     TEXT_HTML = "text/html"
     TEXT_PLAIN = "text/plain"
+    TEXT_CSS = "text/css"
+    TEXT_JAVASCRIPT = "text/javascript"
+    IMAGE_SVG = "image/svg+xml"
+    IMAGE_ICON = "image/x-icon"
     IMAGE_JPEG = "image/jpeg"
     IMAGE_PNG = "image/png"
     IMAGE_GIF = "image/gif"
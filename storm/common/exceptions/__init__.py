@@ -6,6 +6,7 @@ from .http import (
     InternalServerErrorException,
     MethodNotAllowedException,
     NotFoundException,
+    PayloadTooLargeException,
     TooManyRequestsException,
     UnauthorizedException,
     UnprocessableEntityException,
@@ -19,6 +20,7 @@ __all__ = [
     "InternalServerErrorException",
     "MethodNotAllowedException",
     "NotFoundException",
+    "PayloadTooLargeException",
     "UnauthorizedException",
     "BadRequestException",
     "TooManyRequestsException",
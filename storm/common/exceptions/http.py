@@ -99,6 +99,17 @@ class UnprocessableEntityException(StormHttpException):
         )
 
 
+class PayloadTooLargeException(StormHttpException):
+    """
+    Exception raised when the request body is larger than the server accepts.
+
+    :param message: Error message
+    """
+
+    def __init__(self, message="Payload too large"):
+        super().__init__(message, status_code=HttpStatus.PAYLOAD_TOO_LARGE, name="PayloadTooLarge")
+
+
 class TooManyRequestsException(StormHttpException):
     """
     Exception raised when the user has sent too many requests in a given amount of time.
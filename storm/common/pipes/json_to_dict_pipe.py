@@ -1,12 +1,11 @@
-import json
-
 from storm.common.exceptions.http import BadRequestException
 from storm.common.pipes.pipe import Pipe
+from storm.common.serializer.json_codec import get_json_codec
 
 
 class JsonToDictPipe(Pipe):
     async def transform(self, value, metadata=None):
         try:
-            return json.loads(value)
-        except json.JSONDecodeError as e:
+            return get_json_codec().loads(value)
+        except ValueError as e:
             raise BadRequestException("Invalid JSON format") from e
@@ -18,6 +18,8 @@ class ParseUUIDPipe(Pipe):
         :return: A UUID object if the value is valid.
         :raises ValueError: If the value is not a valid UUID.
         """
+        if isinstance(value, uuid.UUID):  # Already converted by a ':param<uuid>' route
+            return value
         try:
             return uuid.UUID(value)
         except ValueError as e:
@@ -0,0 +1,156 @@
+import json
+from contextvars import ContextVar, Token
+from importlib.util import find_spec
+from typing import Any, Dict, Optional, Type, Union
+
+
+class JsonCodec:
+    """
+    The JSON encoder/decoder used by the framework for request and response bodies. Every
+    codec encodes to UTF-8 bytes and raises ValueError on invalid input, so the backends are
+    interchangeable.
+    """
+
+    name = None
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encodes an object.
+
+        :param obj: The object to encode, typically a dictionary or list
+        :return: The UTF-8 encoded JSON document
+        """
+        raise NotImplementedError
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decodes a JSON document.
+
+        :param data: The document, as bytes or str
+        :return: The decoded object
+        :raises ValueError: If the document is not valid JSON
+        """
+        raise NotImplementedError
+
+
+class StdlibJsonCodec(JsonCodec):
+    """
+    The codec backed by the standard library `json` module.
+    """
+
+    name = "stdlib"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    The codec backed by orjson (pip install orjson). Output is compact, e.g. {"a":1}.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self.dumps = orjson.dumps
+        self.loads = orjson.loads
+
+
+class MsgspecJsonCodec(JsonCodec):
+    """
+    The codec backed by msgspec (pip install msgspec). Output is compact, e.g. {"a":1}.
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._msgspec = msgspec
+        self.dumps = msgspec.json.encode
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            # Normalize to ValueError like the other backends
+            raise ValueError(str(e)) from e
+
+
+JSON_CODECS: Dict[str, Type[JsonCodec]] = {
+    StdlibJsonCodec.name: StdlibJsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecJsonCodec.name: MsgspecJsonCodec,
+}
+
+# Backends tried, in order, when the codec is set to "auto"
+AUTO_CODEC_ORDER = ("orjson", "msgspec", "stdlib")
+
+# The process-wide codec, and the one bound by the application handling the current request
+_json_codec: JsonCodec = StdlibJsonCodec()
+_bound_json_codec: ContextVar[Optional[JsonCodec]] = ContextVar("json_codec", default=None)
+
+
+def create_json_codec(name: str) -> JsonCodec:
+    """
+    Creates a codec by name.
+
+    :param name: "stdlib", "orjson", "msgspec", or "auto" for the fastest installed backend
+    :return: JsonCodec object
+    :raises ValueError: If the name is unknown
+    :raises ImportError: If the backend is not installed
+    """
+    if name == "auto":
+        name = next(codec for codec in AUTO_CODEC_ORDER if codec == "stdlib" or find_spec(codec) is not None)
+    codec_class = JSON_CODECS.get(name)
+    if codec_class is None:
+        raise ValueError(f"Unknown JSON codec: {name}. Expected one of {', '.join(JSON_CODECS)} or auto.")
+    try:
+        return codec_class()
+    except ImportError as e:
+        raise ImportError(f"The {name} JSON codec requires the {name} package: pip install {name}") from e
+
+
+def get_json_codec() -> JsonCodec:
+    """
+    Get the codec used by the framework: the one bound by the current application, or the
+    process-wide one.
+    """
+    return _bound_json_codec.get() or _json_codec
+
+
+def set_json_codec(codec: Union[str, JsonCodec]) -> JsonCodec:
+    """
+    Set the process-wide codec used by the framework.
+
+    :param codec: A JsonCodec object or a codec name (see `create_json_codec`)
+    :return: The codec now in use
+    """
+    global _json_codec
+    _json_codec = create_json_codec(codec) if isinstance(codec, str) else codec
+    return _json_codec
+
+
+def bind_json_codec(codec: JsonCodec) -> Token:
+    """
+    Bind the codec of an application to the current context, e.g. while it handles a request.
+
+    :param codec: The JsonCodec object
+    :return: The token restoring the previous codec (see `unbind_json_codec`)
+    """
+    return _bound_json_codec.set(codec)
+
+
+def unbind_json_codec(token: Token) -> None:
+    """
+    Restore the codec bound before `bind_json_codec`.
+
+    :param token: The token returned by `bind_json_codec`
+    """
+    _bound_json_codec.reset(token)
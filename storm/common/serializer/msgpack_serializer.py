@@ -0,0 +1,27 @@
+import msgpack
+
+
+class MsgpackSerializer:
+    """
+    A utility class for serializing and deserializing data to and from MessagePack format.
+    """
+
+    @staticmethod
+    def serialize(data):
+        """
+        Serializes the given data into MessagePack format.
+
+        :param data: The data to be serialized, typically a dictionary or list.
+        :return: A byte array representing the serialized MessagePack data.
+        """
+        return msgpack.packb(data)
+
+    @staticmethod
+    def deserialize(data):
+        """
+        Deserializes the given MessagePack byte array into a Python object.
+
+        :param data: The MessagePack byte array to be deserialized.
+        :return: A Python object corresponding to the deserialized MessagePack data.
+        """
+        return msgpack.unpackb(data)
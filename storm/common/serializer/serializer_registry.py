@@ -0,0 +1,251 @@
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Any, Dict, Iterable, Optional, Tuple, Type
+
+from storm.common.enums.content_type import ContentType
+from storm.common.serializer.json_codec import get_json_codec
+
+
+@lru_cache(maxsize=256)
+def negotiate_media_type(accept: str, available: Tuple[str, ...]) -> Optional[str]:
+    """
+    Choose a media type from an Accept header. Each available media type gets the quality of
+    the most specific range matching it (type/subtype, then type/*, then */*); the highest
+    quality wins and ties go to the first one in the server preference order.
+
+    :param accept: The Accept header, e.g. 'application/msgpack, application/json;q=0.5'
+    :param available: The available media types, by server preference
+    :return: The media type, or None if the client accepts none of them
+    """
+    ranges = []
+    for item in accept.lower().split(","):
+        media_range, *params = item.split(";")
+        media_range = media_range.strip()
+        if not media_range:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        ranges.append((media_range, quality))
+
+    if not ranges:
+        return available[0] if available else None
+
+    best, best_quality = None, 0.0
+    for media_type in available:
+        wildcard = media_type.split("/", 1)[0] + "/*"
+        quality, specificity = 0.0, -1
+        for media_range, range_quality in ranges:
+            if media_range == media_type:
+                level = 2
+            elif media_range == wildcard:
+                level = 1
+            elif media_range == "*/*":
+                level = 0
+            else:
+                continue
+            if level > specificity:
+                specificity, quality = level, range_quality
+        if quality > best_quality:
+            best, best_quality = media_type, quality
+    return best
+
+
+class ResponseSerializer:
+    """
+    Encodes structured response content (dictionaries and lists) to one format.
+
+    Attributes:
+        media_types (tuple): The media types served by the serializer, the first one is its main type.
+        content_type (str): The Content-Type of the encoded responses.
+        requires (str): The module the serializer needs, if any.
+    """
+
+    media_types: Tuple[str, ...] = ()
+    content_type: str = None
+    requires: Optional[str] = None
+
+    def serialize(self, data: Any) -> bytes:
+        """
+        Encodes response content.
+
+        :param data: The content, typically a dictionary or list
+        :return: The encoded body
+        """
+        raise NotImplementedError
+
+
+class JsonResponseSerializer(ResponseSerializer):
+    """
+    Encodes responses to JSON with the codec used by the framework (see `set_json_codec`).
+    """
+
+    media_types = ("application/json",)
+    content_type = ContentType.JSON
+
+    def serialize(self, data: Any) -> bytes:
+        return get_json_codec().dumps(data)
+
+
+class XmlResponseSerializer(ResponseSerializer):
+    """
+    Encodes responses to XML with `XMLSerializer`.
+    """
+
+    media_types = ("application/xml", "text/xml")
+    content_type = ContentType.XML
+
+    def __init__(self):
+        from storm.common.serializer.xml_serializer import XMLSerializer
+
+        self._serializer = XMLSerializer
+
+    def serialize(self, data: Any) -> bytes:
+        return self._serializer.serialize(data).encode("utf-8")
+
+
+class YamlResponseSerializer(ResponseSerializer):
+    """
+    Encodes responses to YAML with `YamlSerializer` (pip install pyyaml).
+    """
+
+    media_types = ("application/yaml", "application/x-yaml", "text/yaml")
+    content_type = ContentType.YAML
+    requires = "yaml"
+
+    def __init__(self):
+        from storm.common.serializer.yaml_serializer import YamlSerializer
+
+        self._serializer = YamlSerializer
+
+    def serialize(self, data: Any) -> bytes:
+        return self._serializer.serialize(data).encode("utf-8")
+
+
+class MsgpackResponseSerializer(ResponseSerializer):
+    """
+    Encodes responses to MessagePack with `MsgpackSerializer` (pip install msgpack).
+    """
+
+    media_types = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+    content_type = ContentType.MSGPACK
+    requires = "msgpack"
+
+    def __init__(self):
+        from storm.common.serializer.msgpack_serializer import MsgpackSerializer
+
+        self._serializer = MsgpackSerializer
+
+    def serialize(self, data: Any) -> bytes:
+        return self._serializer.serialize(data)
+
+
+class AvroResponseSerializer(ResponseSerializer):
+    """
+    Encodes responses to Avro with `AvroSerializer` (pip install fastavro). Avro needs a
+    schema, so this serializer is registered by the application rather than by name:
+
+        app.serializers.register(AvroResponseSerializer("schemas/user.avsc"))
+
+    :param schema_path: The file path to the Avro schema (.avsc file)
+    """
+
+    media_types = ("application/avro", "avro/binary")
+    content_type = ContentType.AVRO
+    requires = "fastavro"
+
+    def __init__(self, schema_path):
+        from storm.common.serializer.avro_serializer import AvroSerializer
+
+        self._serializer = AvroSerializer(schema_path)
+
+    def serialize(self, data: Any) -> bytes:
+        return self._serializer.serialize(data)
+
+
+RESPONSE_SERIALIZERS: Dict[str, Type[ResponseSerializer]] = {
+    "json": JsonResponseSerializer,
+    "xml": XmlResponseSerializer,
+    "yaml": YamlResponseSerializer,
+    "msgpack": MsgpackResponseSerializer,
+}
+
+
+class SerializerRegistry:
+    """
+    The response serializers of an application, keyed by media type.
+
+    The serializer of a request is chosen from its Accept header; the result of the
+    negotiation is cached per distinct header value. The first registered serializer is
+    the default, used when the request has no Accept header or accepts none of the types.
+
+    :param serializers: The serializers, by preference
+    """
+
+    def __init__(self, serializers: Iterable[ResponseSerializer] = ()):
+        self._serializers: Dict[str, ResponseSerializer] = {}
+        self.media_types: Tuple[str, ...] = ()
+        for serializer in serializers:
+            self.register(serializer)
+
+    @classmethod
+    def from_settings(cls, settings) -> "SerializerRegistry":
+        """
+        Creates the registry from the response_serializers setting. Serializers whose
+        package is not installed are left out.
+
+        :raises ValueError: If a serializer name is unknown
+        """
+        serializers = []
+        for name in settings.response_serializers:
+            serializer_class = RESPONSE_SERIALIZERS.get(name)
+            if serializer_class is None:
+                raise ValueError(f"Unknown response serializer: {name}. Expected one of {', '.join(RESPONSE_SERIALIZERS)}.")
+            if serializer_class.requires is None or find_spec(serializer_class.requires) is not None:
+                serializers.append(serializer_class())
+        return cls(serializers)
+
+    @property
+    def default(self) -> Optional[ResponseSerializer]:
+        """
+        Get the serializer used when no other one is negotiated.
+        """
+        return self._serializers[self.media_types[0]] if self.media_types else None
+
+    def register(self, serializer: ResponseSerializer, media_types: Optional[Iterable[str]] = None) -> None:
+        """
+        Register a serializer. A media type that is already registered keeps its place in
+        the preference order and is served by the new serializer.
+
+        :param serializer: The serializer
+        :param media_types: The media types to serve, those of the serializer by default
+        """
+        for media_type in media_types or serializer.media_types:
+            self._serializers[media_type.lower()] = serializer
+        self.media_types = tuple(self._serializers)
+
+    def get(self, media_type: str) -> Optional[ResponseSerializer]:
+        """
+        Get the serializer of a media type.
+
+        :param media_type: The media type, e.g. 'application/xml'
+        :return: The serializer or None
+        """
+        return self._serializers.get(media_type.lower())
+
+    def select(self, accept: Optional[str]) -> Optional[ResponseSerializer]:
+        """
+        Choose the serializer of a request.
+
+        :param accept: The Accept header of the request
+        :return: The serializer of the preferred media type, or the default one
+        """
+        if not accept:
+            return self.default
+        media_type = negotiate_media_type(accept, self.media_types)
+        return self._serializers[media_type] if media_type else self.default
@@ -1,4 +1,5 @@
 from .application import StormApplication
 from .repl.repl import StormRepl, start_repl
+from .static_module import StaticModule
 
-__all__ = ["StormApplication", "StormRepl", "start_repl"]
+__all__ = ["StormApplication", "StormRepl", "StaticModule", "start_repl"]
@@ -0,0 +1,163 @@
+import asyncio
+import gzip
+import zlib
+from functools import lru_cache, partial
+from importlib.util import find_spec
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from storm.common.enums.content_encoding import ContentEncoding
+from storm.common.enums.http_headers import HttpHeaders
+from storm.common.enums.http_status import HttpStatus
+
+# Levels of the encodings the compression_level setting does not apply to
+BROTLI_QUALITY = 4
+ZSTD_LEVEL = 3
+
+
+def _compressors(level: int) -> Dict[str, Callable[[bytes], bytes]]:
+    """
+    Get the compress functions of the encodings available in this environment.
+
+    :param level: The gzip/deflate compression level
+    """
+    compressors = {}
+    if find_spec("brotli") is not None:
+        import brotli
+
+        compressors[ContentEncoding.BROTLI] = partial(brotli.compress, quality=BROTLI_QUALITY)
+    if find_spec("zstandard") is not None:
+        import zstandard
+
+        compressors[ContentEncoding.ZSTD] = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress
+    # mtime=0 keeps the output of identical bodies identical
+    compressors[ContentEncoding.GZIP] = partial(gzip.compress, compresslevel=level, mtime=0)
+    compressors[ContentEncoding.DEFLATE] = partial(zlib.compress, level=level)
+    return compressors
+
+
+@lru_cache(maxsize=256)
+def negotiate_encoding(accept_encoding: str, available: Tuple[str, ...]) -> Optional[str]:
+    """
+    Choose a content encoding from an Accept-Encoding header. Among the encodings the client
+    accepts (q > 0), the first one in the server preference order wins.
+
+    :param accept_encoding: The Accept-Encoding header, e.g. 'gzip, deflate, br;q=0.5'
+    :param available: The available encodings, by server preference
+    :return: The encoding or None to send the body as is
+    """
+    accepted = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    for encoding in available:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+class Compression:
+    """
+    Compresses response bodies with the best encoding the client accepts.
+
+    Only bodies of an allowed content type and at least the minimum size are compressed;
+    bodies from the executor threshold up are compressed in the default executor so that
+    the event loop keeps serving other connections meanwhile.
+
+    :param min_size: The minimum body size, in bytes
+    :param content_types: The compressible content types (prefixes, e.g. 'text/')
+    :param encodings: The encodings to use, by preference; unavailable ones are ignored
+    :param level: The gzip/deflate compression level
+    :param executor_threshold: The body size from which compression runs in the executor
+    """
+
+    def __init__(
+        self,
+        min_size: int = 1024,
+        content_types: Iterable[str] = ("application/json", "text/"),
+        encodings: Iterable[str] = ("br", "zstd", "gzip", "deflate"),
+        level: int = 6,
+        executor_threshold: int = 64 * 1024,
+    ):
+        self.min_size = min_size
+        self.content_types = tuple(content_type.lower() for content_type in content_types)
+        self.compressors = _compressors(level)
+        self.encodings = tuple(encoding for encoding in encodings if encoding in self.compressors)
+        self.executor_threshold = executor_threshold
+
+    @classmethod
+    def from_settings(cls, settings) -> "Compression":
+        """
+        Create the compression layer configured by the application settings.
+        """
+        return cls(
+            min_size=settings.compression_min_size,
+            content_types=settings.compression_content_types,
+            encodings=settings.compression_encodings,
+            level=settings.compression_level,
+            executor_threshold=settings.compression_executor_threshold,
+        )
+
+    def is_compressible(self, response, min_size: Optional[int] = None) -> bool:
+        """
+        Check if a response qualifies for compression, whatever the client accepts.
+
+        :param response: The HttpResponse
+        :param min_size: A minimum size overriding the configured one
+        """
+        if (
+            response.streaming
+            or response.status_code in (HttpStatus.NO_CONTENT, HttpStatus.NOT_MODIFIED)
+            or HttpHeaders.CONTENT_ENCODING in response.headers
+        ):
+            return False
+        content_type = str(response.headers.get(HttpHeaders.CONTENT_TYPE, "")).lower()
+        if not content_type.startswith(self.content_types):
+            return False
+        return len(response.body) >= (self.min_size if min_size is None else min_size)
+
+    async def compress(self, request, response, min_size: Optional[int] = None) -> Optional[str]:
+        """
+        Compress the body of a response, if it qualifies and the client accepts an encoding.
+        Sets Content-Encoding and Content-Length, and adds Accept-Encoding to Vary.
+
+        :param request: The HttpRequest
+        :param response: The HttpResponse
+        :param min_size: A minimum size overriding the configured one (per route)
+        :return: The encoding used, or None
+        """
+        if not self.is_compressible(response, min_size):
+            return None
+
+        # The representation now depends on Accept-Encoding, whether compressed or not
+        response.add_vary(HttpHeaders.ACCEPT_ENCODING)
+
+        encoding = negotiate_encoding(request.get_header(HttpHeaders.ACCEPT_ENCODING, ""), self.encodings)
+        if encoding is None:
+            return None
+
+        body = response.body
+        compress = self.compressors[encoding]
+        if len(body) >= self.executor_threshold:
+            compressed = await asyncio.get_running_loop().run_in_executor(None, compress, body)
+        else:
+            compressed = compress(body)
+
+        response.update_content(compressed)
+        response.set_header(HttpHeaders.CONTENT_ENCODING, encoding)
+        # A strong ETag identifies the uncompressed bytes, the compressed ones only match weakly
+        etag = response.get_etag()
+        if etag and not etag.startswith("W/"):
+            response.set_header(HttpHeaders.ETAG, f"W/{etag}")
+        return encoding
@@ -1,9 +1,15 @@
-import json
+import tempfile
 from enum import StrEnum
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import parse_qs
 
 from storm.common.enums.http_headers import HttpHeaders
+from storm.common.exceptions.http import BadRequestException, PayloadTooLargeException
+from storm.common.serializer.json_codec import get_json_codec
+from storm.core.adapters.multipart import MultipartParser, UploadFile, parse_header_params
+
+# Size of the chunks read back from a spooled body
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class HttpRequestEnums(StrEnum):
@@ -14,8 +20,10 @@ class HttpRequestEnums(StrEnum):
     CONTENT_TYPE = "content-type"
     APPLICATION_JSON = "application/json"
     APPLICATION_FORM = "application/x-www-form-urlencoded"
+    MULTIPART_FORM = "multipart/form-data"
     COOKIE = "cookie"
     HTTP_REQUEST = "http.request"
+    HTTP_DISCONNECT = "http.disconnect"
     METHOD = "method"
     PATH = "path"
     RAW_PATH = "raw_path"
@@ -36,6 +44,10 @@ class HttpRequest:
     """
     A class to parse and encapsulate HTTP request details
     from ASGI scope, receive, and send.
+
+    Headers, query parameters and cookies are parsed from the raw scope on first access,
+    so requests whose handlers never read them do not pay for it. Likewise the body is only
+    received when `parse_body`, `read_body` or `stream` is awaited.
     """
 
     def __init__(
@@ -55,6 +67,8 @@ class HttpRequest:
         self.receive: Callable[[], Any] = receive
         self.send: Callable[[Dict[str, Any]], None] = send
         self.params: Optional[Dict[str, Any]] = None
+        # Values captured by the host pattern of the matched controller (e.g. ':tenant.example.com')
+        self.host_params: Optional[Dict[str, Any]] = None
 
         # Basic request info
         self.method: Optional[str] = scope.get(HttpRequestEnums.METHOD)
@@ -63,10 +77,10 @@ class HttpRequest:
         self.scheme: str = scope.get(HttpRequestEnums.SCHEME, "http")
         self.http_version: str = scope.get(HttpRequestEnums.HTTP_VERSION, "1.1")
 
-        # Headers, query params, and cookies
-        self.headers: Dict[str, str] = self._parse_headers(scope.get(HttpRequestEnums.HEADERS, []))
-        self.query_params: Dict[str, Union[str, List[str]]] = self._parse_query_params(scope.get(HttpRequestEnums.QUERY_STRING, b""))
-        self.cookies: Dict[str, str] = self._parse_cookies(self.headers.get(HttpRequestEnums.COOKIE, ""))
+        # Headers, query params, and cookies (parsed lazily, see the properties below)
+        self._headers: Optional[Dict[str, str]] = None
+        self._query_params: Optional[Dict[str, Union[str, List[str]]]] = None
+        self._cookies: Optional[Dict[str, str]] = None
 
         # Client and server information
         self.client: Tuple[Optional[str], Optional[int]] = scope.get(HttpRequestEnums.CLIENT, (None, None))
@@ -87,21 +101,250 @@ class HttpRequest:
         self.user: Optional[Any] = scope.get(HttpRequestEnums.USER)
         self.auth: Optional[Any] = scope.get(HttpRequestEnums.AUTH)
 
-        # Request body
-        self.body: Optional[Union[str, Dict[str, Any], List[Any]]] = None
+        # Request body, read on demand
+        self.body: Optional[Union[str, Dict[str, Any], List[Any], BinaryIO]] = None
+        self._raw_body: Optional[bytes] = None
+        self._body_file: Optional[BinaryIO] = None
+        self._form: Optional[MultipartParser] = None
+        self._body_parsed = False
+        self._stream_consumed = False
+        self._body_complete = False
 
-    async def parse_body(self) -> None:
+        # Body limits, set by the application once the route is known (None: no limit)
+        self.max_body_size: Optional[int] = None
+        self.spool_threshold: Optional[int] = None
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """
+        The request headers, keyed by lower case name.
+        """
+        headers = self._headers
+        if headers is None:
+            headers = self._headers = self._parse_headers(self.scope.get(HttpRequestEnums.HEADERS, []))
+        return headers
+
+    @headers.setter
+    def headers(self, headers: Dict[str, str]):
+        self._headers = headers
+
+    @property
+    def query_params(self) -> Dict[str, Union[str, List[str]]]:
+        """
+        The query parameters; repeated parameters are lists.
         """
-        Asynchronously parse the body from the receive channel.
+        query_params = self._query_params
+        if query_params is None:
+            query_params = self._query_params = self._parse_query_params(self.scope.get(HttpRequestEnums.QUERY_STRING, b""))
+        return query_params
+
+    @query_params.setter
+    def query_params(self, query_params: Dict[str, Union[str, List[str]]]):
+        self._query_params = query_params
+
+    @property
+    def cookies(self) -> Dict[str, str]:
         """
-        body_content: bytes = b""
+        The cookies sent in the Cookie header.
+        """
+        cookies = self._cookies
+        if cookies is None:
+            cookies = self._cookies = self._parse_cookies(self.headers.get(HttpRequestEnums.COOKIE, ""))
+        return cookies
+
+    @cookies.setter
+    def cookies(self, cookies: Dict[str, str]):
+        self._cookies = cookies
+
+    def get_content_length(self) -> Optional[int]:
+        """
+        Get the body size announced by the Content-Length header.
+        :return: The announced size, or None if the header is missing or invalid
+        """
+        value = self.get_header(HttpHeaders.CONTENT_LENGTH)
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            return None
+
+    @property
+    def body_received(self) -> bool:
+        """
+        Whether the client has no more body to send: the body has been received as a whole,
+        or the request announces none (no Content-Length nor Transfer-Encoding). Until then,
+        the receive channel belongs to the body readers.
+        """
+        if self._body_complete:
+            return True
+        if self.get_header(HttpHeaders.TRANSFER_ENCODING) is not None:
+            return False
+        return not self.get_content_length()
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        """
+        Iterate over the body chunks as they are received, without buffering them.
+        If the body has already been read, it is yielded from memory or from its spool file.
+
+        :raises RuntimeError: If the body has already been streamed
+        :raises PayloadTooLargeException: If the body exceeds `max_body_size`
+        """
+        if self._raw_body is not None:
+            if self._raw_body:
+                yield self._raw_body
+            return
+        if self._body_file is not None:
+            self._body_file.seek(0)
+            while chunk := self._body_file.read(STREAM_CHUNK_SIZE):
+                yield chunk
+            self._body_file.seek(0)
+            return
+        if self._stream_consumed:
+            raise RuntimeError("The request body has already been streamed.")
+        self._stream_consumed = True
+
+        limit = self.max_body_size
+        received = 0
         while True:
             event: Dict[str, Any] = await self.receive()
             if event["type"] == HttpRequestEnums.HTTP_REQUEST:
-                body_content += event.get("body", b"")
+                chunk = event.get("body", b"")
+                if chunk:
+                    received += len(chunk)
+                    if limit and received > limit:
+                        raise PayloadTooLargeException()
+                    yield chunk
                 if not event.get("more_body", False):
-                    break
-        self.body = self._decode_body(body_content)
+                    self._body_complete = True
+                    return
+            elif event["type"] == HttpRequestEnums.HTTP_DISCONNECT:
+                self._body_complete = True
+                return
+
+    async def _receive_body(self) -> None:
+        """
+        Receive the whole body, if not done yet: in memory, or in a temporary file once it
+        grows over `spool_threshold`.
+        """
+        if self._raw_body is not None or self._body_file is not None:
+            return
+
+        threshold = self.spool_threshold
+        chunks: List[bytes] = []
+        size = 0
+        spool = None
+        try:
+            async for chunk in self.stream():
+                if spool is not None:
+                    spool.write(chunk)
+                    continue
+                chunks.append(chunk)
+                size += len(chunk)
+                if threshold and size > threshold:
+                    spool = tempfile.TemporaryFile()
+                    spool.writelines(chunks)
+                    chunks = []
+        except BaseException:
+            if spool is not None:
+                spool.close()
+            raise
+
+        if spool is not None:
+            spool.seek(0)
+            self._body_file = spool
+        else:
+            self._raw_body = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    async def read_body(self) -> bytes:
+        """
+        Receive the whole body, if not done yet.
+
+        Note that a body spooled to disk is loaded in memory; use `stream` or `get_body_file`
+        to read it in chunks.
+
+        :return: The raw body bytes
+        """
+        await self._receive_body()
+        if self._body_file is not None:
+            self._body_file.seek(0)
+            content = self._body_file.read()
+            self._body_file.seek(0)
+            return content
+        return self._raw_body
+
+    async def get_body_file(self) -> Optional[BinaryIO]:
+        """
+        Receive the whole body, if not done yet, and get its spool file.
+
+        :return: The temporary file holding the body, positioned at its start, or None if the
+            body fits in memory
+        """
+        await self._receive_body()
+        if self._body_file is not None:
+            self._body_file.seek(0)
+        return self._body_file
+
+    async def form(self) -> Tuple[Dict[str, Union[str, List[str]]], Dict[str, Union[UploadFile, List[UploadFile]]]]:
+        """
+        Parse a multipart/form-data body, if not done yet, as it is received.
+
+        Upload files are written to UploadFile objects that move to disk above the spool
+        threshold, so no file is ever held in memory as a whole.
+
+        :return: A tuple (fields, files); repeated names are lists
+        :raises BadRequestException: If the body is not valid multipart data
+        """
+        if self._form is None:
+            _, params = parse_header_params(self.headers.get(HttpRequestEnums.CONTENT_TYPE, ""))
+            boundary = params.get("boundary")
+            if not boundary:
+                raise BadRequestException("Missing multipart boundary")
+            parser = MultipartParser(boundary.encode("latin-1"), self.spool_threshold)
+            try:
+                async for chunk in self.stream():
+                    await parser.feed(chunk)
+                parser.finish()
+            except BaseException:
+                parser.close()
+                raise
+            self._form = parser
+        return self._form.fields, self._form.files
+
+    def is_multipart(self) -> bool:
+        """
+        Check if the request body is multipart/form-data.
+        """
+        return self.headers.get(HttpRequestEnums.CONTENT_TYPE, "").lower().startswith(HttpRequestEnums.MULTIPART_FORM)
+
+    async def parse_body(self) -> None:
+        """
+        Asynchronously read the body from the receive channel, if not done yet, and decode it.
+        Bodies spooled to disk are not decoded: the body is then the spool file itself.
+        Multipart bodies are decoded to a dictionary of their fields and UploadFile objects.
+        """
+        if self._body_parsed:
+            return
+        if self.is_multipart():
+            fields, files = await self.form()
+            self.body = {**fields, **files}
+            self._body_parsed = True
+            return
+        await self._receive_body()
+        if self._body_file is not None:
+            self.body = self._body_file
+        else:
+            self.body = self._decode_body(self._raw_body)
+        self._body_parsed = True
+
+    def close(self) -> None:
+        """
+        Release the resources held by the request, i.e. the body spool file.
+        """
+        if self._body_file is not None:
+            self._body_file.close()
+        if self._form is not None:
+            self._form.close()
 
     def _parse_headers(self, raw_headers: List[Tuple[bytes, bytes]]) -> Dict[str, str]:
         """
@@ -117,6 +360,8 @@ class HttpRequest:
         :param query_string: Query string as bytes
         :return: Dictionary of query parameters
         """
+        if not query_string:
+            return {}
         return {k: v[0] if len(v) == 1 else v for k, v in parse_qs(query_string.decode("utf-8")).items()}
 
     def _parse_cookies(self, cookie_header: str) -> Dict[str, str]:
@@ -142,8 +387,8 @@ class HttpRequest:
         content_type: str = self.headers.get(HttpRequestEnums.CONTENT_TYPE, "").lower()
         if HttpRequestEnums.APPLICATION_JSON in content_type:
             try:
-                return json.loads(body_content.decode("utf-8")) if body_content else {}
-            except json.JSONDecodeError:
+                return get_json_codec().loads(body_content) if body_content else {}
+            except ValueError:
                 return body_content.decode("utf-8")
         elif HttpRequestEnums.APPLICATION_FORM in content_type:
             return parse_qs(body_content.decode("utf-8"))
@@ -171,6 +416,7 @@ class HttpRequest:
             "user": self.user,
             "auth": self.auth,
             "params": self.params or {},
+            "host_params": self.host_params or {},
         }
         return self.method, self.path, request_kwargs
 
@@ -237,8 +483,22 @@ class HttpRequest:
     def get_body(self):
         """
         Get the request body.
-        :return: Body content
+
+        The body is received and parsed on demand: it is only available once `parse_body`
+        has been awaited, which the framework does for Body/File/Form parameters, handler
+        parameters only the body can provide, and before registered middleware and
+        interceptors run. Other code reading the body must await `parse_body` first:
+
+            await request.parse_body()
+            body = request.get_body()
+
+        A body spooled to disk is its temporary file, positioned at its start each time it is
+        handed out.
+
+        :return: Body content, None until `parse_body` has been awaited
         """
+        if self._body_file is not None and self.body is self._body_file:
+            self._body_file.seek(0)
         return self.body
 
     def set_body(self, body):
@@ -247,6 +507,7 @@ class HttpRequest:
         :param body: New body content
         """
         self.body = body
+        self._body_parsed = True
 
     def get_client_info(self):
         """
@@ -294,6 +555,26 @@ class HttpRequest:
             return self.params or {}
         return self.params.get(key, default)
 
+    def set_host_params(self, host_params: Dict[str, Any]):
+        """
+        Set the values captured by the host pattern of the matched controller.
+
+        :param host_params: The host parameters (e.g. {'tenant': 'acme'})
+        """
+        self.host_params = host_params
+
+    def get_host_params(self, key: str = None, default: Any = None):
+        """
+        Get the value of a specific host parameter or all host parameters.
+
+        :param key: The key of the host parameter to retrieve (optional).
+        :param default: The default value to return if the key is not found.
+        :return: The value of the host parameter or all host parameters if no key is provided.
+        """
+        if key is None:
+            return self.host_params or {}
+        return (self.host_params or {}).get(key, default)
+
     def get_client_ip(self):
         """
         Get the client IP address.
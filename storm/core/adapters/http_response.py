@@ -1,20 +1,103 @@
+import asyncio
 import base64
 import hashlib
-import json
+import inspect
+import mimetypes
+import os
+import re
+import time
 from email.utils import formatdate
+from functools import lru_cache, partial
+from importlib.util import find_spec
+from urllib.parse import quote
 
 from storm.common.enums.content_type import ContentType
 from storm.common.enums.http_headers import HttpHeaders
 from storm.common.enums.http_status import HttpStatus
+from storm.common.enums.json_stream_format import JsonStreamFormat
 from storm.common.exceptions.exception import StormHttpException
-from storm.core.adapters.http_request import HttpRequest
+from storm.common.exceptions.http import MethodNotAllowedException, NotFoundException
+from storm.common.serializer.json_codec import get_json_codec
+from storm.core.adapters.http_request import HttpRequest, HttpRequestEnums
+from storm.core.helpers.conditional import format_http_date, is_not_modified, to_last_modified
+
+# Headers sent with every response built by `HttpResponse.from_request`, encoded once
+DEFAULT_HEADERS = (
+    (b"x-powered-by", b"Storm"),
+    (b"connection", b"keep-alive"),
+    (b"keep-alive", b"timeout=5"),
+)
+DEFAULT_HEADER_NAMES = (HttpHeaders.X_POWERED_BY, HttpHeaders.CONNECTION, HttpHeaders.KEEP_ALIVE, HttpHeaders.DATE)
+
+# The encoded Date header value and the second it was formatted for
+_date_cache = [0, b""]
+
+
+def http_date() -> bytes:
+    """
+    Get the current date as an encoded HTTP date. It is formatted at most once per second.
+    """
+    now = int(time.time())
+    if now != _date_cache[0]:
+        _date_cache[1] = formatdate(now, usegmt=True).encode("latin-1")
+        _date_cache[0] = now
+    return _date_cache[1]
+
+
+# Chunks smaller than this are coalesced by a StreamingResponse unless told otherwise
+DEFAULT_STREAM_CHUNK_SIZE = 16 * 1024
+# Size of the reads of a FileResponse
+FILE_READ_SIZE = 256 * 1024
+# The ASGI extension letting the server send a file by path (e.g. with sendfile)
+PATHSEND_EXTENSION = "http.response.pathsend"
+# A single byte range: 'bytes=0-499', 'bytes=500-' or 'bytes=-500'
+BYTE_RANGE_PATTERN = re.compile(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$", re.IGNORECASE)
+
+# The "auto" ETag algorithm: xxh3 when xxhash is installed, otherwise SHA-1, which current
+# CPUs accelerate in hardware and which then hashes faster than MD5 and BLAKE2
+AUTO_ETAG_ALGORITHM = "xxh3" if find_spec("xxhash") is not None else "sha1"
+
+
+@lru_cache(maxsize=None)
+def etag_hash_function(algorithm: str):
+    """
+    Get the hash constructor for an ETag algorithm.
+
+    :param algorithm: A hashlib algorithm ("md5", "sha1", "blake2b", ...), an xxhash
+                      algorithm ("xxh3", "xxh64", ...) or "auto"
+    :return: A callable taking the data and returning an object with digest() and hexdigest()
+    :raises ValueError: If the algorithm is unknown
+    """
+    if algorithm == "auto":
+        algorithm = AUTO_ETAG_ALGORITHM
+    if algorithm.startswith("xxh"):
+        import xxhash
+
+        return getattr(xxhash, "xxh3_128" if algorithm == "xxh3" else algorithm)
+    if algorithm == "blake2b":
+        # A 128-bit digest is plenty for a validator and shortens the header
+        return partial(hashlib.blake2b, digest_size=16)
+    if algorithm in hashlib.algorithms_available:
+        return getattr(hashlib, algorithm, partial(hashlib.new, algorithm))
+    raise ValueError(f"Unsupported ETag algorithm: {algorithm}")
 
 
 class HttpResponse:
     """
     A class to construct and send HTTP responses in an ASGI application.
+
+    The content is encoded to bytes once, when first needed, and the encoded body is reused
+    for the Content-Length header, the ETag and the sent body. Assigning new content resets
+    it; content mutated in place after encoding must be assigned again.
     """
 
+    # Whether the body is produced while it is sent (no Content-Length, ETag or compression)
+    streaming = False
+    # Whether DEFAULT_HEADERS and the Date header are sent along with the headers
+    default_headers = False
+    # The ResponseSerializer negotiated for dictionaries and lists, JSON when None
+    serializer = None
+
     def __init__(
         self,
         content=None,
@@ -30,6 +113,7 @@ class HttpResponse:
         :param headers: Additional headers as a dictionary
         :param content_type: Content-Type of the response
         """
+        self._body = None
         self.content = content
         self.status_code = status_code
         self.headers = headers or {}
@@ -50,32 +134,22 @@ class HttpResponse:
         :param headers: Additional headers as a dictionary
         :return: HttpResponse object
         """
-        # Default headers
         headers = headers or {}
 
-        # Add X-powered-by header
-        headers[HttpHeaders.X_POWERED_BY] = "Storm"
-
-        # Add Date header
-        headers["Date"] = formatdate(timeval=None, usegmt=True)
-
         # Add a header based on request headers
         if HttpHeaders.ACCEPT_LANGUAGE in request.headers:
             headers[HttpHeaders.ACCEPT_LANGUAGE] = request.headers[HttpHeaders.ACCEPT_LANGUAGE]
 
-        # add keep-alive header
-        headers[HttpHeaders.KEEP_ALIVE] = "keep-alive"
-
-        # Add connection header
-        headers[HttpHeaders.CONNECTION] = "timeout=5"
-
         # Create the response
-        return HttpResponse(
+        response = HttpResponse(
             content=content,
             status_code=status_code,
             headers=headers,
             content_type=ContentType.JSON,
         )
+        # X-Powered-By, Connection, Keep-Alive and Date are added, pre-encoded, when sending
+        response.default_headers = True
+        return response
 
     @staticmethod
     def from_error(error: StormHttpException, headers=None):
@@ -96,21 +170,42 @@ class HttpResponse:
             content_type=ContentType.JSON,
         )
 
+    @property
+    def content(self):
+        return self._content
+
+    @content.setter
+    def content(self, content):
+        self._content = content
+        self._body = None
+
+    @property
+    def body(self) -> bytes:
+        """
+        The encoded content, computed on first access.
+        """
+        if self._body is None:
+            self._body = self._encode_content()
+        return self._body
+
     def update_content(self, content):
         """
         Update the response content.
         :param content: New response content
         """
-        # Update Content-Length header
-        if isinstance(content, (str, bytes)):
-            self.headers[HttpHeaders.CONTENT_LENGTH] = str(len(content))
-        elif isinstance(content, (dict, list)):
-            self.headers[HttpHeaders.CONTENT_LENGTH] = str(len(json.dumps(content)))
+        self.content = content
+
+        # Structured content is sent in the negotiated format, which depends on Accept
+        if self.serializer is not None and isinstance(content, (dict, list)):
+            self.update_content_type(self.serializer.content_type)
+            self.add_vary(HttpHeaders.ACCEPT)
+
+        # Update Content-Length header, from the encoded body that is then sent as is
+        if isinstance(content, (str, bytes, dict, list)):
+            self.headers[HttpHeaders.CONTENT_LENGTH] = str(len(self.body))
         else:
             self.headers.pop(HttpHeaders.CONTENT_LENGTH, None)
 
-        self.content = content
-
     def update_status_code(self, status_code):
         """
         Update the HTTP status code.
@@ -133,6 +228,17 @@ class HttpResponse:
         """
         self.headers[header_name] = value
 
+    def add_vary(self, header_name: str):
+        """
+        Add a request header to the Vary header, i.e. declare that the response depends on it.
+        :param header_name: Request header key
+        """
+        vary = self.headers.get(HttpHeaders.VARY)
+        if not vary:
+            self.headers[HttpHeaders.VARY] = header_name
+        elif vary.strip() != "*" and header_name.lower() not in (item.strip().lower() for item in vary.split(",")):
+            self.headers[HttpHeaders.VARY] = f"{vary}, {header_name}"
+
     def update_content_type(self, content_type):
         """
         Update the Content-Type header.
@@ -148,19 +254,37 @@ class HttpResponse:
         """
         return self.headers
 
+    def encode_headers(self):
+        """
+        Encode the headers for the ASGI `http.response.start` event. Only the headers of the
+        response are encoded: the default headers are already encoded, and are left out when
+        the response sets them itself.
+
+        :return: A list of (name, value) byte pairs
+        """
+        headers = self.headers
+        encoded = [[key.encode("utf-8"), str(value).encode("utf-8")] for key, value in headers.items()]
+        if not self.default_headers:
+            return encoded
+        if any(name in headers for name in DEFAULT_HEADER_NAMES):
+            overridden = {key.lower().encode("utf-8") for key in headers}
+            defaults = [header for header in (*DEFAULT_HEADERS, (b"date", http_date())) if header[0] not in overridden]
+            return defaults + encoded
+        return [*DEFAULT_HEADERS, (b"date", http_date()), *encoded]
+
     async def send(self, send):
         """
         Send the HTTP response using the ASGI `send` channel.
 
         :param send: The ASGI send callable
         """
-        body = self._encode_content()
+        body = self.body
         # Send the response start event
         await send(
             {
                 "type": "http.response.start",
                 "status": self.status_code,
-                "headers": [[key.encode("utf-8"), value.encode("utf-8")] for key, value in self.headers.items()],
+                "headers": self.encode_headers(),
             }
         )
         # Send the response body
@@ -177,8 +301,10 @@ class HttpResponse:
 
         :return: Encoded content as bytes
         """
-        if isinstance(self.content, (dict, list)):  # JSON content
-            return json.dumps(self.content).encode("utf-8")
+        if isinstance(self.content, (dict, list)):  # JSON, or the negotiated format
+            if self.serializer is not None:
+                return self.serializer.serialize(self.content)
+            return get_json_codec().dumps(self.content)
         if isinstance(self.content, str):  # Plain text or HTML
             return self.content.encode("utf-8")
         if isinstance(self.content, bytes):  # Binary content
@@ -241,22 +367,13 @@ class HttpResponse:
 
     def _generate_etag(self, algorithm: str = "md5", encoding: str = "base64") -> str:
         """
-        Generate an ETag from the response content.
+        Generate an ETag from the encoded response body.
 
-        :param algorithm: Hash algorithm ("md5", "sha256", etc.)
+        :param algorithm: Hash algorithm ("md5", "sha256", "blake2b", "xxh3", "auto", etc.)
         :param encoding: Encoding of the digest ("hex", "base64")
         :return: Encoded ETag value (not wrapped in W/"" yet)
         """
-        if isinstance(self.content, (dict, list)):
-            raw = json.dumps(self.content, sort_keys=True).encode("utf-8")
-        elif isinstance(self.content, str):
-            raw = self.content.encode("utf-8")
-        elif isinstance(self.content, bytes):
-            raw = self.content
-        else:
-            raw = b""
-
-        hasher = getattr(hashlib, algorithm)(raw)
+        hasher = etag_hash_function(algorithm)(self.body)
 
         if encoding == "hex":
             return hasher.hexdigest()
@@ -270,7 +387,8 @@ class HttpResponse:
         algorithm: str = "md5",
         encoding: str = "base64",
         prefix: str = "c-",
-    ) -> str:
+        max_body_size: int = 0,
+    ) -> str | None:
         """
         Set the ETag header based on current content.
 
@@ -278,14 +396,539 @@ class HttpResponse:
         :param algorithm: Hashing algorithm for ETag
         :param encoding: Digest encoding ("hex", "base64")
         :param prefix: Prefix to add before the digest (e.g. "c-")
-        :return: The computed ETag
+        :param max_body_size: Bodies larger than this are not hashed, 0 for no limit
+        :return: The computed ETag, None if the body is too large
         """
+        if max_body_size and len(self.body) > max_body_size:
+            return None
         digest = self._generate_etag(algorithm=algorithm, encoding=encoding)
         tag = f"{prefix}{digest}"
         etag_value = f'W/"{tag}"' if weak else f'"{tag}"'
         self.set_header(HttpHeaders.ETAG, etag_value)
         return tag
 
+    def set_etag_value(self, value: str, weak: bool = False) -> str:
+        """
+        Set an ETag the handler already knows (e.g. a row version), so that the body is not hashed.
+
+        :param value: The entity tag, without quotes
+        :param weak: Whether the ETag is weak (default False: the value identifies the representation)
+        :return: The ETag
+        """
+        value = str(value)
+        self.set_header(HttpHeaders.ETAG, f'W/"{value}"' if weak else f'"{value}"')
+        return value
+
+    def get_etag(self) -> str | None:
+        """
+        Get the ETag header, if set.
+        """
+        return self.headers.get(HttpHeaders.ETAG)
+
+
+class StreamingResponse(HttpResponse):
+    """
+    A response whose body is sent as it is produced by an iterator, so that large bodies are
+    never held in memory. Handlers return it, or are generators themselves.
+
+    Chunks (bytes or str) are sent with `more_body=True`; chunks smaller than `chunk_size`
+    are coalesced first. The iterator is pulled only as fast as the client accepts data, and
+    is closed as soon as the client disconnects. Sync generators run in the executor, which
+    pulls them a batch of `chunk_size` bytes at a time.
+
+    :param content: A sync or async iterable of bytes or str chunks
+    :param status_code: HTTP status code (default: 200)
+    :param headers: Additional headers as a dictionary
+    :param content_type: Content-Type of the response
+    :param chunk_size: The size up to which small chunks are coalesced, 0 to send every chunk
+                       as is, None for the `stream_chunk_size` setting
+    """
+
+    streaming = True
+
+    def __init__(self, content, status_code=HttpStatus.OK, headers=None, content_type=ContentType.OCTET_STREAM, chunk_size=None):
+        super().__init__(content=content, status_code=status_code, headers=headers, content_type=content_type)
+        self.chunk_size = chunk_size
+        self.disconnected = False
+
+    def update_content(self, content):
+        """
+        Replace the iterable producing the body.
+        :param content: A sync or async iterable of bytes or str chunks
+        """
+        self.content = content
+
+    def set_etag(self, *args, **kwargs):
+        # The body is not known before it is sent
+        return None
+
+    @staticmethod
+    def _next_batch(iterator, size: int):
+        """
+        Pull chunks from a sync iterator until they add up to `size` bytes.
+
+        :return: A tuple (chunks, whether the iterator is exhausted)
+        """
+        chunks, total = [], 0
+        for chunk in iterator:
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= size:
+                return chunks, False
+        return chunks, True
+
+    async def _iterate(self):
+        content = self.content
+        if hasattr(content, "__aiter__"):
+            async for chunk in content:
+                yield chunk
+        elif inspect.isgenerator(content):
+            # Generators may block (e.g. reading a file): they are run in the executor, one
+            # batch of chunks (up to the coalescing size) per call
+            loop = asyncio.get_running_loop()
+            size = DEFAULT_STREAM_CHUNK_SIZE if self.chunk_size is None else self.chunk_size
+            done = False
+            while not done:
+                chunks, done = await loop.run_in_executor(None, self._next_batch, content, size)
+                for chunk in chunks:
+                    yield chunk
+        else:
+            for chunk in content or ():
+                yield chunk
+
+    async def _stream(self, send):
+        chunk_size = DEFAULT_STREAM_CHUNK_SIZE if self.chunk_size is None else self.chunk_size
+        buffer = bytearray()
+        async for chunk in self._iterate():
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            if not chunk:
+                continue
+            if not buffer and len(chunk) >= chunk_size:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                continue
+            buffer += chunk
+            if len(buffer) >= chunk_size:
+                await send({"type": "http.response.body", "body": bytes(buffer), "more_body": True})
+                buffer.clear()
+        await send({"type": "http.response.body", "body": bytes(buffer), "more_body": False})
+
+    async def _close_iterator(self):
+        content = self.content
+        if hasattr(content, "aclose"):
+            await content.aclose()
+        elif hasattr(content, "close"):
+            try:
+                content.close()
+            except ValueError:
+                # A generator still running in the executor after a disconnect is closed when collected
+                pass
+
+    @staticmethod
+    async def _wait_for_disconnect(receive):
+        while True:
+            message = await receive()
+            if message["type"] == HttpRequestEnums.HTTP_DISCONNECT:
+                return
+
+    async def send(self, send, receive=None):
+        """
+        Send the response start event, then the body chunks as they are produced.
+
+        :param send: The ASGI send callable
+        :param receive: The ASGI receive callable, watched for `http.disconnect` while streaming.
+                        Only pass it once the request body has been received: the watcher
+                        discards the `http.request` events it gets.
+        """
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.encode_headers(),
+            }
+        )
+        try:
+            if receive is None:
+                await self._stream(send)
+                return
+            stream_task = asyncio.ensure_future(self._stream(send))
+            disconnect_task = asyncio.ensure_future(self._wait_for_disconnect(receive))
+            done, pending = await asyncio.wait((stream_task, disconnect_task), return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if stream_task in done:
+                stream_task.result()
+            else:
+                self.disconnected = True
+        finally:
+            self._closed = True
+            await self._close_iterator()
+
+
+class JsonStreamingResponse(StreamingResponse):
+    """
+    A response streaming a collection as JSON, one item at a time, so that the encoded
+    collection is never held in memory as a whole.
+
+    Items of sync iterables are encoded in batches of about `chunk_size` bytes (in the
+    executor for generators, which may block); items of async iterables are encoded as they
+    come and coalesced by the StreamingResponse.
+
+    :param content: A list, or a sync or async iterable of JSON-serializable items
+    :param status_code: HTTP status code (default: 200)
+    :param headers: Additional headers as a dictionary
+    :param chunk_size: The size up to which items are coalesced, None for the `stream_chunk_size` setting
+    """
+
+    # Written before the first item, between two items, after each item and after the last one
+    opening = b""
+    separator = b""
+    terminator = b""
+    closing = b""
+
+    def __init__(self, content, status_code=HttpStatus.OK, headers=None, content_type=ContentType.JSON, chunk_size=None):
+        super().__init__(content, status_code=status_code, headers=headers, content_type=content_type, chunk_size=chunk_size)
+
+    def _encode_batch(self, iterator, dumps, first: bool, size: int):
+        """
+        Encode items until the batch reaches `size` bytes or the iterator is exhausted.
+
+        :param dumps: The encode function of the codec, read on the event loop since the
+                      executor does not see the codec bound by the application
+        :return: A tuple (encoded items, whether the iterator is exhausted)
+        """
+        separator, terminator = self.separator, self.terminator
+        batch = bytearray()
+        for item in iterator:
+            if not first:
+                batch += separator
+            first = False
+            batch += dumps(item)
+            batch += terminator
+            if len(batch) >= size:
+                return bytes(batch), False
+        return bytes(batch), True
+
+    async def _iterate(self):
+        content = self.content
+        size = self.chunk_size or DEFAULT_STREAM_CHUNK_SIZE
+        dumps = get_json_codec().dumps
+        yield self.opening
+        if hasattr(content, "__aiter__"):
+            first = True
+            async for item in content:
+                yield (b"" if first else self.separator) + dumps(item) + self.terminator
+                first = False
+        else:
+            iterator = iter(content or ())
+            loop = asyncio.get_running_loop() if inspect.isgenerator(content) else None
+            done, first = False, True
+            while not done:
+                if loop is None:
+                    batch, done = self._encode_batch(iterator, dumps, first, size)
+                else:
+                    batch, done = await loop.run_in_executor(None, self._encode_batch, iterator, dumps, first, size)
+                first = first and not batch
+                yield batch
+        yield self.closing
+
+
+class JsonArrayResponse(JsonStreamingResponse):
+    """
+    A response streaming a collection as a JSON array: `[`, the items separated by commas, `]`.
+    """
+
+    opening = b"["
+    separator = b","
+    closing = b"]"
+
+
+class NDJsonResponse(JsonStreamingResponse):
+    """
+    A response streaming a collection as newline delimited JSON (application/x-ndjson), one
+    item per line.
+    """
+
+    terminator = b"\n"
+
+    def __init__(self, content, status_code=HttpStatus.OK, headers=None, content_type=ContentType.NDJSON, chunk_size=None):
+        super().__init__(content, status_code=status_code, headers=headers, content_type=content_type, chunk_size=chunk_size)
+
+
+JSON_STREAM_RESPONSES = {
+    JsonStreamFormat.ARRAY: JsonArrayResponse,
+    JsonStreamFormat.NDJSON: NDJsonResponse,
+}
+
+
+class FileResponse(StreamingResponse):
+    """
+    A response sending a file from disk, never loaded in memory as a whole.
+
+    The ETag and Last-Modified validators come from `os.stat`, so conditional requests are
+    answered without reading the file. A single `Range` is answered with a 206 (honouring
+    `If-Range`); requests for several ranges get the whole file. When the server supports
+    the `http.response.pathsend` extension, whole files are handed to it by path, otherwise
+    they are read in chunks in the executor.
+
+    :param path: The path of the file
+    :param filename: If given, the file is sent as an attachment with this name
+    :param content_type: Content-Type of the response, guessed from the path by default
+    :param status_code: HTTP status code (default: 200)
+    :param headers: Additional headers as a dictionary
+    :param read_size: The size of the reads
+    :raises NotFoundException: If the path is not a file
+    """
+
+    def __init__(self, path, filename=None, content_type=None, status_code=HttpStatus.OK, headers=None, read_size=FILE_READ_SIZE):
+        self.path = os.path.abspath(path)
+        try:
+            stat_result = os.stat(self.path)
+        except OSError:
+            stat_result = None
+        if stat_result is None or not os.path.isfile(self.path):
+            raise NotFoundException(message=f"File {os.path.basename(self.path)} not found")
+        content_type = content_type or mimetypes.guess_type(self.path)[0] or ContentType.OCTET_STREAM
+        super().__init__(None, status_code=status_code, headers=headers, content_type=content_type)
+
+        self.read_size = read_size
+        self.size = stat_result.st_size
+        self.last_modified = to_last_modified(stat_result.st_mtime)
+        self._start = 0
+        self._length = self.size
+        self._send_body = True
+        self._pathsend = False
+
+        self.headers[HttpHeaders.CONTENT_LENGTH] = str(self.size)
+        self.headers[HttpHeaders.ACCEPT_RANGES] = "bytes"
+        self.headers[HttpHeaders.ETAG] = f'"{stat_result.st_mtime_ns:x}-{self.size:x}"'
+        self.headers[HttpHeaders.LAST_MODIFIED] = format_http_date(self.last_modified)
+        if filename is not None:
+            self.headers[HttpHeaders.CONTENT_DISPOSITION] = self._content_disposition(filename)
+
+    @staticmethod
+    def _content_disposition(filename: str) -> str:
+        if filename.isascii() and '"' not in filename and "\\" not in filename:
+            return f'attachment; filename="{filename}"'
+        return f"attachment; filename*=utf-8''{quote(filename)}"
+
+    def prepare(self, request):
+        """
+        Adapt the response to the request: 304 for a matching conditional GET, 206 for a
+        satisfiable Range, 416 for an unsatisfiable one, and no body for HEAD.
+
+        :param request: The HttpRequest
+        """
+        self._pathsend = PATHSEND_EXTENSION in request.scope.get("extensions", {})
+        if request.method not in ("GET", "HEAD"):
+            return
+        self._send_body = request.method == "GET"
+
+        if is_not_modified(request, self.get_etag(), self.last_modified):
+            self.status_code = HttpStatus.NOT_MODIFIED
+            self.headers.pop(HttpHeaders.CONTENT_LENGTH, None)
+            self._send_body = False
+            return
+
+        range_header = request.get_header(HttpHeaders.RANGE)
+        if not range_header or self.status_code != HttpStatus.OK or not self._if_range_matches(request.get_header(HttpHeaders.IF_RANGE)):
+            return
+        byte_range = self._parse_range(range_header)
+        if byte_range is None:
+            # Invalid or multiple ranges: the whole file is sent
+            return
+        start, end = byte_range
+        if start >= self.size:
+            self.status_code = HttpStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+            self.headers[HttpHeaders.CONTENT_RANGE] = f"bytes */{self.size}"
+            self.headers[HttpHeaders.CONTENT_LENGTH] = "0"
+            self._send_body = False
+            return
+        end = min(end, self.size - 1)
+        self.status_code = HttpStatus.PARTIAL_CONTENT
+        self._start, self._length = start, end - start + 1
+        self.headers[HttpHeaders.CONTENT_RANGE] = f"bytes {start}-{end}/{self.size}"
+        self.headers[HttpHeaders.CONTENT_LENGTH] = str(self._length)
+
+    def _if_range_matches(self, if_range) -> bool:
+        if not if_range:
+            return True
+        if_range = if_range.strip()
+        if if_range.startswith(('"', "W/")):
+            # Ranges require a strong comparison
+            return if_range == self.get_etag()
+        return if_range == self.headers[HttpHeaders.LAST_MODIFIED]
+
+    def _parse_range(self, range_header: str):
+        match = BYTE_RANGE_PATTERN.match(range_header)
+        if match is None:
+            return None
+        first, last = match.groups()
+        if not first and not last:
+            return None
+        if not first:
+            # The last N bytes
+            return max(self.size - int(last), 0), self.size - 1
+        start, end = int(first), int(last) if last else self.size - 1
+        if last and start > end:
+            # Invalid (RFC 9110 14.1.1), so the header is ignored
+            return None
+        return start, end
+
+    async def _iterate(self):
+        if not self._send_body:
+            return
+        loop = asyncio.get_running_loop()
+        file = await loop.run_in_executor(None, open, self.path, "rb")
+        try:
+            if self._start:
+                await loop.run_in_executor(None, file.seek, self._start)
+            remaining = self._length
+            while remaining > 0:
+                chunk = await loop.run_in_executor(None, file.read, min(self.read_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            file.close()
+
+    async def send(self, send, receive=None):
+        """
+        Send the file, by path when the server supports it, otherwise in chunks.
+
+        :param send: The ASGI send callable
+        :param receive: The ASGI receive callable, watched for `http.disconnect` while streaming.
+        """
+        if not (self._pathsend and self._send_body and self.status_code == HttpStatus.OK):
+            await super().send(send, receive)
+            return
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.encode_headers(),
+            }
+        )
+        await send({"type": PATHSEND_EXTENSION, "path": self.path})
+        self._closed = True
+
+
+class PreEncodedResponse:
+    """
+    A response whose headers and body are encoded once and then sent as is, for the answers
+    that never change between requests (e.g. the 404 of an unknown path).
+
+    :param status_code: HTTP status code
+    :param headers: Headers as a list of (name, value) byte pairs
+    :param body: The encoded body
+    """
+
+    __slots__ = ("status_code", "headers", "body")
+
+    streaming = False
+
+    def __init__(self, status_code, headers, body: bytes):
+        self.status_code = int(status_code)
+        self.headers = headers
+        self.body = body
+
+    def is_closed(self):
+        # Sent as many times as needed
+        return False
+
+    @classmethod
+    def from_error(cls, error: StormHttpException, headers=None):
+        """
+        Encode a structured error response, with the same body as `HttpResponse.from_error`.
+
+        :param error: The exception to encode
+        :param headers: Additional headers as a dictionary
+        :return: PreEncodedResponse object
+        """
+        body = get_json_codec().dumps(error.to_dict())
+        encoded_headers = [
+            (b"content-type", ContentType.JSON.encode("latin-1")),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+        for key, value in (headers or {}).items():
+            encoded_headers.append((key.lower().encode("latin-1"), value.encode("latin-1")))
+        return cls(error.status_code, encoded_headers, body)
+
+    async def send(self, send):
+        """
+        Send the response using the ASGI `send` channel.
+
+        :param send: The ASGI send callable
+        """
+        # The header list is copied since ASGI middleware may append to it
+        await send({"type": "http.response.start", "status": self.status_code, "headers": list(self.headers)})
+        await send({"type": "http.response.body", "body": self.body})
+
+
+class RawResponse(PreEncodedResponse):
+    """
+    The response of a @Raw route handler, sent to the ASGI server as is. Build it once (e.g.
+    at module level) and return the same object on every request: the Content-Type and
+    Content-Length headers are encoded here, the other headers must be given encoded.
+
+    :param body: The body, str bodies are encoded to UTF-8
+    :param headers: Additional headers as a list of (name, value) byte pairs
+    :param status_code: HTTP status code (default: 200)
+    :param content_type: Content-Type of the response, None to leave it out
+    """
+
+    __slots__ = ()
+
+    def __init__(self, body=b"", headers=(), status_code=HttpStatus.OK, content_type=ContentType.OCTET_STREAM):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        encoded_headers = [(b"content-length", str(len(body)).encode("latin-1"))]
+        if content_type is not None:
+            encoded_headers.insert(0, (b"content-type", content_type.encode("latin-1")))
+        encoded_headers.extend(headers)
+        super().__init__(status_code, encoded_headers, body)
+
+    @classmethod
+    def from_content(cls, content) -> "RawResponse":
+        """
+        Get the RawResponse for a @Raw handler result.
+
+        :param content: A RawResponse, bytes, str or None
+        :return: RawResponse object
+        """
+        if isinstance(content, PreEncodedResponse):
+            return content
+        if content is None:
+            return cls(b"", content_type=None)
+        if isinstance(content, str):
+            return cls(content, content_type=ContentType.PLAIN)
+        return cls(content)
+
+
+_ROUTE_MISS_RESPONSES = {}
+
+
+def route_miss_response(allowed_methods=frozenset()) -> PreEncodedResponse:
+    """
+    Get the pre-encoded answer to a request no route matches: a 404, or a 405 with an Allow
+    header when the path has routes for other methods. Responses are built once per set of
+    allowed methods.
+
+    :param allowed_methods: The methods the path has routes for
+    :return: PreEncodedResponse object
+    """
+    response = _ROUTE_MISS_RESPONSES.get(allowed_methods)
+    if response is None:
+        if allowed_methods:
+            headers = {HttpHeaders.ALLOW: ", ".join(sorted(allowed_methods))}
+            response = PreEncodedResponse.from_error(MethodNotAllowedException(), headers)
+        else:
+            response = PreEncodedResponse.from_error(NotFoundException())
+        _ROUTE_MISS_RESPONSES[allowed_methods] = response
+    return response
+
 
 # Helper methods to create common response types
 class ResponseFactory:
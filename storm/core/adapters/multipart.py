@@ -0,0 +1,257 @@
+import asyncio
+import re
+import tempfile
+from typing import Any, Dict, List, Optional, Union
+
+from storm.common.exceptions.http import BadRequestException
+
+# Upload files are kept in memory up to this size unless the application sets another threshold
+DEFAULT_SPOOL_THRESHOLD = 1024 * 1024
+# Maximum size of the headers of a single part
+MAX_PART_HEADERS_SIZE = 16 * 1024
+
+# A parameter of a Content-Disposition / Content-Type header: name="value" or name=value
+HEADER_PARAM_PATTERN = re.compile(r';\s*([\w*-]+)\s*=\s*(?:"((?:[^"\\]|\\.)*)"|([^;]*))')
+
+
+def parse_header_params(value: str) -> tuple[str, Dict[str, str]]:
+    """
+    Splits a header value such as 'form-data; name="file"; filename="a.txt"'.
+
+    :param value: The header value
+    :return: A tuple (main value, { param: value })
+    """
+    main, _, rest = value.partition(";")
+    params = {}
+    for match in HEADER_PARAM_PATTERN.finditer(";" + rest):
+        quoted, token = match.group(2), match.group(3)
+        params[match.group(1).lower()] = quoted.replace('\\"', '"') if quoted is not None else token.strip()
+    return main.strip().lower(), params
+
+
+class UploadFile:
+    """
+    A file received in a multipart/form-data request.
+
+    The content is held in memory up to the spool threshold and transparently moved to a
+    temporary file above it, so an upload is never fully loaded in memory.
+
+    Attributes:
+        filename (str): The file name sent by the client.
+        content_type (str): The Content-Type of the part.
+        headers (dict): The headers of the part, keyed by lower case name.
+        size (int): The number of bytes received.
+        spool_threshold (int): The size above which the content is moved to a temporary file.
+        file: The underlying file object (a SpooledTemporaryFile).
+    """
+
+    def __init__(self, filename: str, content_type: str = "application/octet-stream", headers=None, spool_threshold: int = None):
+        self.filename = filename
+        self.content_type = content_type
+        self.headers = headers or {}
+        self.size = 0
+        self.spool_threshold = spool_threshold or DEFAULT_SPOOL_THRESHOLD
+        self.file = tempfile.SpooledTemporaryFile(max_size=self.spool_threshold)
+
+    def __repr__(self):
+        return f"UploadFile(filename={self.filename!r}, content_type={self.content_type!r}, size={self.size})"
+
+    async def write_chunk(self, data: bytes):
+        """
+        Append received data to the file. Writes to the temporary file, including the one
+        that moves the content there, are done in the executor so as not to block the loop.
+
+        :param data: The received bytes
+        """
+        size = self.size + len(data)
+        if size <= self.spool_threshold:
+            self.file.write(data)
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, self.file.write, data)
+        self.size = size
+
+    @property
+    def in_memory(self) -> bool:
+        """
+        Check if the content is still held in memory (not rolled over to a temporary file).
+        """
+        # SpooledTemporaryFile rolls over as soon as a write goes past its max_size
+        return self.size <= self.spool_threshold
+
+    async def read(self, size: int = -1) -> bytes:
+        """
+        Read from the file.
+
+        :param size: The number of bytes to read, -1 to read the rest of the file
+        :return: The bytes read
+        """
+        return self.file.read(size)
+
+    async def seek(self, offset: int) -> None:
+        """
+        Move to a position of the file.
+
+        :param offset: The position, in bytes
+        """
+        self.file.seek(offset)
+
+    async def close(self) -> None:
+        """
+        Close the file, deleting its temporary file if any.
+        """
+        self.file.close()
+
+
+class MultipartParser:
+    """
+    An incremental multipart/form-data parser.
+
+    Chunks are fed as they are received: field values are accumulated in memory and file
+    contents are written to their UploadFile as soon as they are known not to be part of
+    a boundary, so only the bytes of a possibly incomplete boundary are ever kept back.
+
+    :param boundary: The boundary declared in the Content-Type header
+    :param spool_threshold: The size above which upload files are moved to disk
+    """
+
+    PREAMBLE, HEADERS, BODY, AFTER_BOUNDARY, DONE = range(5)
+
+    def __init__(self, boundary: bytes, spool_threshold: Optional[int] = None):
+        self.delimiter = b"\r\n--" + boundary
+        self.spool_threshold = spool_threshold
+        # A CRLF is prepended so that the first boundary looks like the following ones
+        self._buffer = bytearray(b"\r\n")
+        self._state = self.PREAMBLE
+        self._part_name: Optional[str] = None
+        self._part_file: Optional[UploadFile] = None
+        self._part_value: Optional[bytearray] = None
+        self.fields: Dict[str, Union[str, List[str]]] = {}
+        self.files: Dict[str, Union[UploadFile, List[UploadFile]]] = {}
+
+    @staticmethod
+    def _add(items: Dict[str, Any], name: str, value: Any):
+        """
+        Stores a value, turning repeated names into lists.
+        """
+        if name not in items:
+            items[name] = value
+        elif isinstance(items[name], list):
+            items[name].append(value)
+        else:
+            items[name] = [items[name], value]
+
+    async def feed(self, data: bytes) -> None:
+        """
+        Parse a chunk of the body.
+
+        :param data: The received bytes
+        :raises BadRequestException: If the body is not valid multipart data
+        """
+        buffer = self._buffer
+        buffer += data
+        delimiter = self.delimiter
+
+        while True:
+            if self._state == self.PREAMBLE:
+                index = buffer.find(delimiter)
+                if index < 0:
+                    # Keep what could be the start of the first boundary
+                    del buffer[: max(0, len(buffer) - len(delimiter) + 1)]
+                    return
+                del buffer[: index + len(delimiter)]
+                self._state = self.AFTER_BOUNDARY
+
+            elif self._state == self.AFTER_BOUNDARY:
+                if len(buffer) < 2:
+                    return
+                if buffer[:2] == b"--":
+                    self._state = self.DONE
+                    buffer.clear()
+                    return
+                index = buffer.find(b"\r\n")
+                if index < 0:
+                    return
+                del buffer[: index + 2]
+                self._state = self.HEADERS
+
+            elif self._state == self.HEADERS:
+                index = buffer.find(b"\r\n\r\n")
+                if index < 0:
+                    if len(buffer) > MAX_PART_HEADERS_SIZE:
+                        raise BadRequestException("Multipart part headers are too large")
+                    return
+                self._start_part(bytes(buffer[:index]))
+                del buffer[: index + 4]
+                self._state = self.BODY
+
+            elif self._state == self.BODY:
+                index = buffer.find(delimiter)
+                if index < 0:
+                    # Everything but a possibly incomplete delimiter belongs to the part
+                    safe = len(buffer) - len(delimiter) + 1
+                    if safe > 0:
+                        await self._write_part(buffer[:safe])
+                        del buffer[:safe]
+                    return
+                await self._write_part(buffer[:index])
+                del buffer[: index + len(delimiter)]
+                self._end_part()
+                self._state = self.AFTER_BOUNDARY
+
+            else:
+                # Epilogue, ignored
+                buffer.clear()
+                return
+
+    def finish(self) -> None:
+        """
+        Check that the whole body has been parsed.
+
+        :raises BadRequestException: If the body ended before the closing boundary
+        """
+        if self._state != self.DONE:
+            raise BadRequestException("Incomplete multipart body")
+
+    def close(self) -> None:
+        """
+        Close every upload file, e.g. when parsing failed.
+        """
+        if self._part_file is not None:
+            self._part_file.file.close()
+        for upload in self.files.values():
+            for upload_file in upload if isinstance(upload, list) else [upload]:
+                upload_file.file.close()
+
+    def _start_part(self, raw_headers: bytes):
+        headers = {}
+        for line in raw_headers.decode("utf-8", errors="replace").split("\r\n"):
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+
+        disposition, params = parse_header_params(headers.get("content-disposition", ""))
+        if disposition != "form-data" or "name" not in params:
+            raise BadRequestException("Invalid multipart part: missing form-data name")
+
+        self._part_name = params["name"]
+        if "filename" in params:
+            content_type = headers.get("content-type", "application/octet-stream")
+            self._part_file = UploadFile(params["filename"], content_type, headers, self.spool_threshold)
+        else:
+            self._part_value = bytearray()
+
+    async def _write_part(self, data: bytearray):
+        if not data:
+            return
+        if self._part_file is not None:
+            await self._part_file.write_chunk(bytes(data))
+        else:
+            self._part_value += data
+
+    def _end_part(self):
+        if self._part_file is not None:
+            self._part_file.file.seek(0)
+            self._add(self.files, self._part_name, self._part_file)
+        else:
+            self._add(self.fields, self._part_name, self._part_value.decode("utf-8", errors="replace"))
+        self._part_name = self._part_file = self._part_value = None
@@ -0,0 +1,249 @@
+import asyncio
+import mimetypes
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from storm.common.enums.content_encoding import ContentEncoding
+from storm.common.enums.content_type import ContentType
+from storm.common.enums.file_extention import FileExtension
+from storm.common.enums.http_headers import HttpHeaders
+from storm.common.enums.http_status import HttpStatus
+from storm.common.enums.mime_type import MimeType
+from storm.core.adapters.compression import negotiate_encoding
+from storm.core.adapters.http_request import HttpRequest
+from storm.core.adapters.http_response import FileResponse, route_miss_response
+from storm.core.helpers.conditional import format_http_date, is_not_modified, to_last_modified
+
+EXTENSION_MIME_TYPES = {
+    FileExtension.TXT: MimeType.TEXT_PLAIN,
+    FileExtension.HTML: MimeType.TEXT_HTML,
+    FileExtension.CSS: MimeType.TEXT_CSS,
+    FileExtension.JS: MimeType.TEXT_JAVASCRIPT,
+    FileExtension.JSON: MimeType.APPLICATION_JSON,
+    FileExtension.XML: MimeType.APPLICATION_XML,
+    FileExtension.SVG: MimeType.IMAGE_SVG,
+    FileExtension.ICO: MimeType.IMAGE_ICON,
+    FileExtension.JPEG: MimeType.IMAGE_JPEG,
+    FileExtension.JPG: MimeType.IMAGE_JPEG,
+    FileExtension.PNG: MimeType.IMAGE_PNG,
+    FileExtension.GIF: MimeType.IMAGE_GIF,
+    FileExtension.MP3: MimeType.AUDIO_MPEG,
+    FileExtension.MP4: MimeType.VIDEO_MP4,
+}
+
+# Precompressed siblings, e.g. app.js.br, by server preference
+PRECOMPRESSED_SUFFIXES = {ContentEncoding.BROTLI: ".br", ContentEncoding.GZIP: ".gz"}
+
+
+def guess_content_type(path: str) -> str:
+    """
+    Get the Content-Type of a file from its extension.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    content_type = EXTENSION_MIME_TYPES.get(extension) or mimetypes.guess_type(path)[0] or ContentType.OCTET_STREAM
+    if content_type.startswith("text/") or content_type in (MimeType.APPLICATION_JSON, MimeType.IMAGE_SVG):
+        return f"{content_type}; charset=utf-8"
+    return content_type
+
+
+class StaticVariant:
+    """
+    One representation of a static file: the file itself or a precompressed sibling.
+    """
+
+    __slots__ = ("path", "size", "etag", "headers")
+
+    def __init__(self, path: str, size: int, etag: str, headers: List[Tuple[bytes, bytes]]):
+        self.path = path
+        self.size = size
+        self.etag = etag
+        # Encoded once: every response of the variant has the same headers
+        self.headers = headers
+
+
+class StaticEntry:
+    """
+    An indexed static file with its validators and representations.
+    """
+
+    __slots__ = ("content_type", "last_modified", "variants")
+
+    def __init__(self, content_type: str, last_modified, variants: Dict[str, StaticVariant]):
+        self.content_type = content_type
+        self.last_modified = last_modified
+        # ContentEncoding -> variant, ContentEncoding.IDENTITY being the file itself
+        self.variants = variants
+
+
+class StaticFiles:
+    """
+    An ASGI application serving the files of a directory, to be mounted under a prefix
+    (see `StormApplication.serve_static`), so requests never reach the router, middleware,
+    interceptors or controllers.
+
+    The directory is indexed when the application is created: size, modification time,
+    Content-Type, ETag and precompressed `.br`/`.gz` siblings, which are sent to clients
+    accepting them. Conditional GETs are answered from the index without touching the disk,
+    and small files are kept in memory in a size-bounded LRU cache. Hidden files are not
+    served. Call `refresh()` after changing the directory.
+
+    :param directory: The directory to serve
+    :param cache_max_size: The total size of the cached files, in bytes, 0 to disable the cache
+    :param cache_max_file_size: The size up to which a file is cached
+    :param html: Whether 'dir/' serves 'dir/index.html'
+    :param cache_control: An optional Cache-Control header for every file
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        cache_max_size: int = 16 * 1024 * 1024,
+        cache_max_file_size: int = 256 * 1024,
+        html: bool = True,
+        cache_control: Optional[str] = None,
+    ):
+        self.directory = os.path.abspath(directory)
+        if not os.path.isdir(self.directory):
+            raise ValueError(f"Static directory {directory} does not exist.")
+        self.cache_max_size = cache_max_size
+        self.cache_max_file_size = cache_max_file_size
+        self.html = html
+        self.cache_control = cache_control
+        self.files: Dict[str, StaticEntry] = {}
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._cache_size = 0
+        self.refresh()
+
+    def refresh(self):
+        """
+        Index the directory again and empty the cache.
+        """
+        files = {}
+        for root, directories, names in os.walk(self.directory):
+            directories[:] = [name for name in directories if not name.startswith(".")]
+            present = set(names)
+            for name in names:
+                if name.startswith("."):
+                    continue
+                # A precompressed sibling belongs to its file
+                if any(name.endswith(suffix) and name[: -len(suffix)] in present for suffix in PRECOMPRESSED_SUFFIXES.values()):
+                    continue
+                path = os.path.join(root, name)
+                entry = self._index_file(path, present)
+                if entry is not None:
+                    relative = os.path.relpath(path, self.directory).replace(os.sep, "/")
+                    files["/" + relative] = entry
+        self.files = files
+        self._cache.clear()
+        self._cache_size = 0
+
+    def _index_file(self, path: str, siblings) -> Optional[StaticEntry]:
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+        content_type = guess_content_type(path)
+        last_modified = to_last_modified(stat_result.st_mtime)
+        etag = f"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"
+
+        variants = {ContentEncoding.IDENTITY: self._variant(path, stat_result.st_size, f'"{etag}"', content_type, last_modified)}
+        name = os.path.basename(path)
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES.items():
+            if name + suffix in siblings:
+                try:
+                    size = os.stat(path + suffix).st_size
+                except OSError:
+                    continue
+                variants[encoding] = self._variant(path + suffix, size, f'"{etag}-{encoding}"', content_type, last_modified, encoding)
+        return StaticEntry(content_type, last_modified, variants)
+
+    def _variant(self, path, size, etag, content_type, last_modified, encoding=None) -> StaticVariant:
+        headers = {
+            HttpHeaders.CONTENT_TYPE: content_type,
+            HttpHeaders.CONTENT_LENGTH: str(size),
+            HttpHeaders.ETAG: etag,
+            HttpHeaders.LAST_MODIFIED: format_http_date(last_modified),
+            HttpHeaders.ACCEPT_RANGES: "bytes",
+        }
+        if encoding is not None:
+            headers[HttpHeaders.CONTENT_ENCODING] = encoding
+        if self.cache_control:
+            headers[HttpHeaders.CACHE_CONTROL] = self.cache_control
+        return StaticVariant(path, size, etag, [(key.lower().encode("latin-1"), value.encode("latin-1")) for key, value in headers.items()])
+
+    def lookup(self, path: str) -> Optional[StaticEntry]:
+        """
+        Find the indexed file for a request path.
+
+        :param path: The request path, relative to the mount prefix
+        """
+        entry = self.files.get(path)
+        if entry is None and self.html and (path == "" or path.endswith("/")):
+            entry = self.files.get(path.rstrip("/") + "/index.html")
+        return entry
+
+    async def _read(self, variant: StaticVariant) -> bytes:
+        body = self._cache.get(variant.path)
+        if body is not None:
+            self._cache.move_to_end(variant.path)
+            return body
+        body = await asyncio.get_running_loop().run_in_executor(None, self._read_file, variant.path)
+        if variant.path not in self._cache:
+            self._cache[variant.path] = body
+            self._cache_size += len(body)
+            while self._cache_size > self.cache_max_size:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_size -= len(evicted)
+        return body
+
+    @staticmethod
+    def _read_file(path: str) -> bytes:
+        with open(path, "rb") as file:
+            return file.read()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+        entry = self.lookup(scope["path"])
+        if entry is None:
+            await route_miss_response().send(send)
+            return
+        if scope["method"] not in ("GET", "HEAD"):
+            await route_miss_response(frozenset({"GET", "HEAD"})).send(send)
+            return
+
+        request = HttpRequest(scope, receive, send)
+        encoding = ContentEncoding.IDENTITY
+        extra_headers = []
+        if len(entry.variants) > 1:
+            extra_headers.append((b"vary", b"Accept-Encoding"))
+            accept_encoding = request.get_header(HttpHeaders.ACCEPT_ENCODING)
+            if accept_encoding:
+                encoding = negotiate_encoding(accept_encoding, tuple(entry.variants)) or ContentEncoding.IDENTITY
+        variant = entry.variants[encoding]
+
+        if is_not_modified(request, variant.etag, entry.last_modified):
+            headers = [(key, value) for key, value in variant.headers if key in (b"etag", b"last-modified", b"cache-control")]
+            await send({"type": "http.response.start", "status": HttpStatus.NOT_MODIFIED, "headers": headers + extra_headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        cacheable = self.cache_max_size and variant.size <= self.cache_max_file_size
+        if not cacheable or request.get_header(HttpHeaders.RANGE):
+            # Large files and ranges are streamed from the disk
+            response = FileResponse(variant.path, content_type=entry.content_type)
+            response.headers[HttpHeaders.ETAG] = variant.etag
+            if encoding != ContentEncoding.IDENTITY:
+                response.headers[HttpHeaders.CONTENT_ENCODING] = encoding
+            for key, value in extra_headers:
+                response.headers[key.decode("latin-1")] = value.decode("latin-1")
+            if self.cache_control:
+                response.headers[HttpHeaders.CACHE_CONTROL] = self.cache_control
+            response.prepare(request)
+            await response.send(send, receive)
+            return
+
+        body = b"" if scope["method"] == "HEAD" else await self._read(variant)
+        await send({"type": "http.response.start", "status": HttpStatus.OK, "headers": variant.headers + extra_headers})
+        await send({"type": "http.response.body", "body": body})
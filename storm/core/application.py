@@ -1,9 +1,11 @@
 import inspect
+from contextlib import contextmanager
 from functools import wraps
 
 from rich import print
 
 from storm.common.enums.content_type import ContentType
+from storm.common.enums.etag_mode import ETagMode
 from storm.common.enums.http_headers import HttpHeaders
 from storm.common.enums.http_method import HttpMethod
 from storm.common.enums.http_status import HttpStatus
@@ -11,17 +13,31 @@ from storm.common.enums.versioning_type import VersioningType
 from storm.common.exceptions.exception import StormHttpException
 from storm.common.exceptions.http import (
     InternalServerErrorException,
+    MethodNotAllowedException,
     NotFoundException,
+    PayloadTooLargeException,
     PreconditionFailedException,
 )
 from storm.common.execution_context import ExecutionContext
+from storm.common.serializer.json_codec import bind_json_codec, create_json_codec, set_json_codec, unbind_json_codec
+from storm.common.serializer.serializer_registry import SerializerRegistry
 from storm.common.services.logger import Logger
+from storm.core.adapters.compression import Compression
 from storm.core.adapters.http_request import HttpRequest
-from storm.core.adapters.http_response import HttpResponse
+from storm.core.adapters.http_response import (
+    JSON_STREAM_RESPONSES,
+    FileResponse,
+    HttpResponse,
+    RawResponse,
+    StreamingResponse,
+    route_miss_response,
+)
+from storm.core.adapters.static_files import StaticFiles
 from storm.core.appliction_config import ApplicationConfig
 from storm.core.context import AppContext
 from storm.core.exceptions.exception_handler import ExceptionHandler
 from storm.core.exceptions.traceback_handler import TracebackHandler
+from storm.core.helpers.conditional import call_validator, format_etag, format_http_date, is_not_modified, to_last_modified
 from storm.core.helpers.helpers import strip_etag_quotes
 from storm.core.interceptor_pipeline import InterceptorPipeline
 from storm.core.interfaces.version_options_interface import VersioningOptions
@@ -29,6 +45,7 @@ from storm.core.middleware_pipeline import MiddlewarePipeline
 from storm.core.repl.repl_manager import ReplManager
 from storm.core.resolvers.route_resolver import RouteExplorer, RouteResolver
 from storm.core.router import Router
+from storm.core.router.mount_table import MountedLifespan, MountTable
 from storm.core.services.system_monitor import SystemMonitor
 from storm.core.settings import AppSettings as Settings
 from storm.core.settings import get_settings
@@ -45,6 +62,9 @@ class StormApplication:
         - logger: A Logger instance for application-level logging.
         - middleware_pipeline: The pipeline that handles middleware execution.
         - interceptor_pipeline: The pipeline that handles interceptor execution.
+        - mounts: The ASGI applications mounted under a path prefix.
+        - compression: The response compression layer.
+        - serializers: The response serializers, negotiated from the Accept header.
     """
 
     def __init__(self, root_module, settings: Settings | None = None):
@@ -56,17 +76,36 @@ class StormApplication:
         """
         if not settings:
             settings = get_settings()
-        AppContext.set_settings(settings)
+        self.settings = settings
+        self.json_codec = create_json_codec(settings.json_codec)
+        if not AppContext.has_settings():
+            # The first application also provides the settings and codec used outside of its requests
+            AppContext.set_settings(settings)
+            set_json_codec(self.json_codec)
+        with self.bound_context():
+            self._setup(root_module)
+
+    def _setup(self, root_module):
+        """
+        Create the components of the application, with its settings bound.
+
+        :param root_module: The root module containing controllers, providers, and imports.
+        """
+        settings = self.settings
         self.app_config = ApplicationConfig()
         self._exception_handler = ExceptionHandler()
         self._traceback_handler = TracebackHandler()
         self.middleware_pipeline = MiddlewarePipeline()
         self.interceptor_pipeline = InterceptorPipeline(global_interceptors=[])
         self.router = Router(self.app_config)
+        self.mounts = MountTable()
+        self.compression = Compression.from_settings(settings)
+        self.serializers = SerializerRegistry.from_settings(settings)
         self._logger = Logger(self.__class__.__name__)
         self.root_module = root_module
-        self.settings = settings
         self.modules = {root_module.__name__: root_module}
+        self._shutdown_called = False
+        self.repl_manager = None
         self._print_banner()
         self._logger.info("Starting up Storm application.")
         if self.settings.sys_monitoring_enabled:
@@ -75,6 +114,20 @@ class StormApplication:
         else:
             self.system_monitor = None
 
+    @contextmanager
+    def bound_context(self):
+        """
+        Bind the settings and JSON codec of the application to the current context, so that
+        several applications can share a process (e.g. when one is mounted in another).
+        """
+        settings_token = AppContext.bind(self.settings)
+        codec_token = bind_json_codec(self.json_codec)
+        try:
+            yield self
+        finally:
+            unbind_json_codec(codec_token)
+            AppContext.unbind(settings_token)
+
     def add_global_interceptor(self, interceptor_cls):
         """
         Add a global interceptor to the application.
@@ -111,6 +164,36 @@ class StormApplication:
         """
         self.app_config.set_global_prefix(self.router.normalize_path(prefix))
 
+    def mount(self, prefix: str, app):
+        """
+        Mount an ASGI application (e.g. another StormApplication, a metrics exporter)
+        under a path prefix.
+
+        Requests under the prefix are handed to the application before any parsing, with
+        the prefix moved from `scope["path"]` to `scope["root_path"]` and the raw receive
+        and send channels. The longest mounted prefix wins. Mounted ASGI applications get
+        the lifespan startup and shutdown events of the application; mounted
+        StormApplications are started and shut down along with it.
+
+        :param prefix: The path prefix (e.g. '/metrics').
+        :param app: The ASGI application to mount.
+        """
+        self.mounts.add(self.router.normalize_path(prefix), app)
+
+    def serve_static(self, prefix: str, directory: str, **options) -> StaticFiles:
+        """
+        Serve the files of a directory under a path prefix. The directory is indexed now and
+        requests are answered by a mounted StaticFiles application, outside of the router.
+
+        :param prefix: The path prefix (e.g. '/static').
+        :param directory: The directory to serve.
+        :param options: The StaticFiles options (cache_max_size, cache_max_file_size, html, cache_control).
+        :return: The StaticFiles application, e.g. to refresh its index.
+        """
+        static_files = StaticFiles(directory, **options)
+        self.mount(prefix, static_files)
+        return static_files
+
     def _load_modules(self):
         """
         Load and initialize modules from the root module.
@@ -122,6 +205,9 @@ class StormApplication:
             self.modules[module.__name__] = module
             self._logger.info(f"{module.__name__} dependencies initialized")
             self._initialize_module(module)
+        for module in self.modules.values():
+            for prefix, app in getattr(module, "mounts", ()):
+                self.mount(prefix, app)
 
     def _load_controllers(self):
         """
@@ -232,29 +318,56 @@ class StormApplication:
 
         resolver.register_routes(controller, controller.__base_path__, explorer)
 
-    async def handle_request(self, method, path, request, response, **request_kwargs):
+    async def handle_request(self, method, path, request, response, route=None, **request_kwargs):
         """
         Handle an incoming HTTP request by resolving the route and executing middleware and interceptors.
 
         :param method: The HTTP method (e.g., GET, POST).
         :param path: The URL path of the request.
         :param request: The HttpRequest object representing the incoming request.
-        :param response: The HttpResponse object to build the response.
+        :param response: The HttpResponse object to build the response, None for a @Raw route.
+        :param route: The (handler, params) already matched for the request, if any.
         :param request_kwargs: Additional request parameters.
         :return: A tuple containing the response and its status code.
         """
         try:
-            handler, params = self.router.resolve(method, path, request=request)
-            if not handler:
-                raise NotFoundException()
+            if route is None:
+                route = self.router.match(method, path, request=request)
+                if not route:
+                    if route.allowed_methods:
+                        raise MethodNotAllowedException(message=f"Cannot {method} {path}")
+                    raise NotFoundException(message=f"Cannot {method} {path}")
+            handler, params = route
 
             request.set_params(params)
 
             ExecutionContext.set({"request": request, "response": response})
 
-            await self.middleware_pipeline.execute(request_kwargs, lambda req: req)
+            # The request details are only gathered for the middleware that read them
+            if not self.middleware_pipeline.is_empty():
+                if not request_kwargs:
+                    await request.parse_body()
+                    _, _, request_kwargs = request.get_request_info()
+                await self.middleware_pipeline.execute(request_kwargs, lambda req: req)
+            # Interceptors read the body through get_body(), so it is parsed before they run
+            if not self.interceptor_pipeline.is_empty():
+                await request.parse_body()
             content = await self.interceptor_pipeline.execute(handler)
 
+            # @Raw routes have no HttpResponse: the handler result is sent as is
+            if response is None:
+                response = RawResponse.from_content(content)
+                return response, response.status_code
+
+            # @StreamJson routes send their collection one item at a time
+            json_stream = getattr(handler, "_json_stream", None)
+            if json_stream and (isinstance(content, (list, tuple)) or inspect.isasyncgen(content) or inspect.isgenerator(content)):
+                content = JSON_STREAM_RESPONSES[json_stream](content, status_code=response.status_code)
+
+            if isinstance(content, StreamingResponse) or inspect.isasyncgen(content) or inspect.isgenerator(content):
+                response = self._streaming_response(request, response, content)
+                return response, response.status_code
+
             response.update_content(content)
             return response, response.status_code
 
@@ -269,43 +382,170 @@ class StormApplication:
         finally:
             ExecutionContext.clear()
 
+    def _streaming_response(self, request, response, content):
+        """
+        Get the StreamingResponse for a handler result: the one it returned, or one streaming
+        the generator it returned. The default headers of the application response are kept.
+
+        :param request: The HttpRequest object.
+        :param response: The HttpResponse of the request.
+        :param content: A StreamingResponse, or a sync or async generator.
+        :return: The StreamingResponse to send.
+        """
+        if isinstance(content, StreamingResponse):
+            stream = content
+        else:
+            stream = StreamingResponse(content, status_code=response.status_code)
+        for key, value in response.headers.items():
+            stream.headers.setdefault(key, value)
+        stream.default_headers = response.default_headers
+        if stream.chunk_size is None:
+            stream.chunk_size = self.settings.stream_chunk_size
+        if isinstance(stream, FileResponse):
+            stream.prepare(request)
+        return stream
+
+    async def _check_validators(self, request, response, handler, params):
+        """
+        Compute the @ETag / @LastModified validators of a route, if any, and set them on the
+        response. They are computed from the route parameters only, before the pipeline runs.
+
+        :param request: The HttpRequest object.
+        :param response: The HttpResponse object.
+        :param handler: The route handler.
+        :param params: The route parameters.
+        :return: True if the response became a 304 Not Modified and the handler must not run.
+        """
+        etag_validator = getattr(handler, "_etag_validator", None)
+        last_modified_validator = getattr(handler, "_last_modified_validator", None)
+        if etag_validator is None and last_modified_validator is None:
+            return False
+
+        etag = last_modified = None
+        if etag_validator is not None:
+            value = await call_validator(etag_validator, request, params)
+            if value is not None:
+                etag = format_etag(value, getattr(handler, "_etag_weak", False))
+                response.set_header(HttpHeaders.ETAG, etag)
+        if last_modified_validator is not None:
+            value = await call_validator(last_modified_validator, request, params)
+            if value is not None:
+                last_modified = to_last_modified(value)
+                response.set_header(HttpHeaders.LAST_MODIFIED, format_http_date(last_modified))
+
+        if request.method not in (HttpMethod.GET, HttpMethod.HEAD) or not is_not_modified(request, etag, last_modified):
+            return False
+        response.update_status_code(HttpStatus.NOT_MODIFIED)
+        response.update_content(None)  # No body for 304
+        response.update_headers({HttpHeaders.CONTENT_TYPE: ContentType.PLAIN})
+        return True
+
+    def _get_etag(self, response, mode=None, client_etag=None):
+        """
+        Get the ETag of a response: the one the handler set, if any, or the hash of the body
+        when the ETag mode asks for it and the body is not too large.
+
+        :param response: The HttpResponse returned by the handler.
+        :param mode: The ETagMode of the route, defaults to the etag_mode setting.
+        :param client_etag: The If-None-Match / If-Match header of the request, if any.
+        :return: The ETag or None.
+        """
+        current_etag = response.get_etag()
+        if current_etag is not None:
+            return current_etag
+        mode = mode or self.settings.etag_mode
+        if mode == ETagMode.NEVER or (mode == ETagMode.CONDITIONAL and not client_etag):
+            return None
+        return response.set_etag(algorithm=self.settings.etag_algorithm, max_body_size=self.settings.etag_max_body_size)
+
     async def __call__(self, scope, receive, send):
         """
-        ASGI application entry point to handle incoming connections.
+        ASGI application entry point to handle incoming connections. The settings and JSON
+        codec of the application are bound while the connection is handled.
 
         :param scope: The ASGI scope dictionary containing connection information.
         :param receive: The receive callable for the connection.
         :param send: The send callable for the connection.
         """
+        settings_token = AppContext.bind(self.settings)
+        codec_token = bind_json_codec(self.json_codec)
+        try:
+            await self._dispatch(scope, receive, send)
+        finally:
+            unbind_json_codec(codec_token)
+            AppContext.unbind(settings_token)
+
+    async def _dispatch(self, scope, receive, send):
+        """
+        Handle a connection: hand it to a mounted application, or serve the http or
+        lifespan scope.
+        """
+        if self.mounts and scope["type"] in ("http", "websocket"):
+            mounted = self.mounts.match(scope["path"])
+            if mounted is not None:
+                prefix, app = mounted
+                await app(MountTable.child_scope(scope, prefix), receive, send)
+                return
+
         if scope["type"] == "http":
+            request = response = None
             try:
                 request = HttpRequest(scope, receive, send)
-                await request.parse_body()
 
-                method, path, request_kwargs = request.get_request_info()
+                # Unknown paths are answered without raising. The body is only read
+                # when the handler or one of its parameters needs it.
+                route = self.router.match(request.method, request.path, request=request)
+                if not route:
+                    await route_miss_response(route.allowed_methods).send(send)
+                    return
+
+                request.max_body_size = getattr(route[0], "_body_limit", self.settings.max_body_size)
+                request.spool_threshold = self.settings.body_spool_threshold
+                content_length = request.get_content_length()
+                if request.max_body_size and content_length is not None and content_length > request.max_body_size:
+                    raise PayloadTooLargeException()
+
+                if getattr(route[0], "_raw", False):
+                    response, _ = await self.handle_request(request.method, request.path, request, None, route=route)
+                    return
+
                 response = HttpResponse.from_request(request=request)
+                if self.settings.content_negotiation_enabled:
+                    response.serializer = self.serializers.select(request.get_header(HttpHeaders.ACCEPT))
 
-                response, _ = await self.handle_request(method, path, request, response, **request_kwargs)
+                # A matching @ETag / @LastModified validator answers 304 before the pipeline runs
+                if await self._check_validators(request, response, *route):
+                    return
 
-                current_etag = response.set_etag()
+                response, _ = await self.handle_request(request.method, request.path, request, response, route=route)
 
+                # Responses without an ETag (mode "never" or a body above etag_max_body_size) skip the preconditions
+                etag_mode = getattr(route[0], "_etag_mode", None)
                 if request.method in (
                     HttpMethod.PUT,
                     HttpMethod.PATCH,
                     HttpMethod.DELETE,
                 ):
                     client_etag = request.get_if_match()
-                    if client_etag and strip_etag_quotes(client_etag) != strip_etag_quotes(current_etag):
+                    current_etag = self._get_etag(response, etag_mode, client_etag)
+                    if client_etag and current_etag and strip_etag_quotes(client_etag) != strip_etag_quotes(current_etag):
                         raise PreconditionFailedException()
 
                 # If-None-Match (for cache validation on GET)
                 elif request.method == HttpMethod.GET:
                     client_etag = request.get_if_none_match()
-                    if client_etag and strip_etag_quotes(client_etag) == strip_etag_quotes(current_etag):
+                    current_etag = self._get_etag(response, etag_mode, client_etag)
+                    if client_etag and current_etag and strip_etag_quotes(client_etag) == strip_etag_quotes(current_etag):
                         response.update_status_code(HttpStatus.NOT_MODIFIED)
                         response.update_content(None)  # No body for 304
                         response.update_headers({HttpHeaders.CONTENT_TYPE: ContentType.PLAIN})
 
+                else:
+                    self._get_etag(response, etag_mode)
+
+                if getattr(route[0], "_compression", self.settings.compression_enabled):
+                    await self.compression.compress(request, response, getattr(route[0], "_compression_min_size", None))
+
             except StormHttpException as exc:
                 # self.__exception_handler.handle_exception(exc)
                 if exc.status_code == HttpStatus.INTERNAL_SERVER_ERROR:
@@ -317,14 +557,32 @@ class StormApplication:
                 response = HttpResponse.from_error(InternalServerErrorException())
             finally:
                 if response and not response.is_closed():
-                    await response.send(send)
+                    if response.streaming:
+                        # Watching for a disconnect would consume the body chunks no one has read yet
+                        await response.send(send, receive if request is None or request.body_received else None)
+                    else:
+                        await response.send(send)
+                if request is not None:
+                    request.close()
         elif scope["type"] == "lifespan":
-            # Handle startup and shutdown events
+            # Handle startup and shutdown events, forwarded to the mounted applications
+            mounted = [MountedLifespan(app, scope) for _prefix, app in self.mounts]
             while True:
                 message = await receive()
                 if message["type"] == "lifespan.startup":
+                    try:
+                        for lifespan in mounted:
+                            await lifespan.startup()
+                    except RuntimeError as exc:
+                        await send({"type": "lifespan.startup.failed", "message": str(exc)})
+                        return
                     await send({"type": "lifespan.startup.complete"})
                 elif message["type"] == "lifespan.shutdown":
+                    for lifespan in reversed(mounted):
+                        try:
+                            await lifespan.shutdown()
+                        except RuntimeError as exc:
+                            self._logger.error(f"Error during shutdown of a mounted application: {exc}")
                     self.shutdown()
                     await send({"type": "lifespan.shutdown.complete"})
                     break
@@ -373,8 +631,10 @@ class StormApplication:
         This method performs the following steps:
         1. Loads application modules.
         2. Loads application controllers.
-        3. Initializes the REPL (Read-Eval-Print Loop) manager if REPL is enabled in settings.
-        4. Logs the successful startup of the application.
+        3. Compiles the router lookup table from the registered routes.
+        4. Initializes the mounted Storm applications.
+        5. Initializes the REPL (Read-Eval-Print Loop) manager if REPL is enabled in settings.
+        6. Logs the successful startup of the application.
 
         Attributes:
             self._shutdown_called (bool): Indicates whether the application shutdown has been called.
@@ -383,8 +643,10 @@ class StormApplication:
         Raises:
             Any exceptions raised during module or controller loading will propagate.
         """
-        self._load_modules()
-        self._load_controllers()
+        self._load_routes()
+        for _prefix, app in self.mounts:
+            if isinstance(app, StormApplication):
+                app._load_routes()
         self._shutdown_called = False
 
         # Initialize REPL Manager
@@ -395,6 +657,65 @@ class StormApplication:
             self.repl_manager = None
         self._logger.info("Storm application succefully started")
 
+    def _load_routes(self):
+        """
+        Loads the modules and controllers and compiles the router lookup table.
+        """
+        with self.bound_context():
+            self._load_modules()
+            self._load_controllers()
+            self.router.compile()
+
+    def add_controller(self, controller, module=None):
+        """
+        Register a controller while the application is serving. Requests keep being served by
+        the current routes until the new route table is swapped in.
+
+        :param controller: The controller class to add.
+        :param module: The module providing its dependencies (default is the root module).
+        :return: The controller instance.
+        """
+        module = module or self.root_module
+        self._inject_init_dependencies(controller, module)
+        controller_instance = controller()
+        self._inject_dependencies(controller_instance, module)
+        module.controllers[controller.__name__] = controller_instance
+        with self.router.update():
+            self._register_controller(controller_instance, module)
+        return controller_instance
+
+    def remove_controller(self, controller):
+        """
+        Unregister a controller and its routes while the application is serving.
+
+        :param controller: The controller class, instance, or class name.
+        :return: The number of routes removed.
+        """
+        name = controller if isinstance(controller, str) else getattr(controller, "__name__", controller.__class__.__name__)
+        for module in self.modules.values():
+            controller_instance = module.controllers.get(name)
+            if controller_instance is not None:
+                break
+        else:
+            raise ValueError(f"Controller {name} not found.")
+
+        with self.router.update():
+            removed = RouteResolver(self.router).unregister_routes(controller_instance)
+        del module.controllers[name]
+        return removed
+
+    def reload_routes(self):
+        """
+        Rebuild the routes from the registered controllers and swap them in at once.
+        """
+        explorer = RouteExplorer()
+        resolver = RouteResolver(self.router)
+        with self.router.update():
+            self.router.clear_routes()
+            for module in self.modules.values():
+                for controller in module.controllers.values():
+                    resolver.register_routes(controller, controller.__base_path__, explorer)
+
     def _handle_shutdown(self, signal_number, frame):
         """
         Handle shutdown signals like SIGINT and SIGTERM.
@@ -418,6 +739,10 @@ class StormApplication:
                 except Exception as e:
                     self._logger.error(f"Error during onDestroy of module {module_name}: {e}")
 
+        for _prefix, app in self.mounts:
+            if isinstance(app, StormApplication):
+                app.shutdown()
+
         # Stop the REPL manager
 
         if self.repl_manager:
@@ -5,6 +5,7 @@ from storm.core.interfaces.version_options_interface import (
     VERSIONING_CLASS_MAP,
     VersioningOptions,
 )
+from storm.core.versioning_strategy import VersioningStrategy, create_versioning_strategy
 
 
 class ApplicationConfig:
@@ -19,11 +20,16 @@ class ApplicationConfig:
 
         get_versioning() -> Optional[VersioningOptions]:
             Retrieves the current versioning options if they are set, otherwise returns None.
+
+        get_versioning_strategy() -> VersioningStrategy:
+            Retrieves the version extraction strategy built from the versioning options
+            and the global prefix.
     """
 
     def __init__(self):
         self._versioning_options: Optional[VersioningOptions] = None
         self._global_prefix: Optional[str] = None
+        self._versioning_strategy: VersioningStrategy = create_versioning_strategy(None)
 
     def enable_versioning(self, options: VersioningOptions):
         """
@@ -43,6 +49,7 @@ class ApplicationConfig:
         if hasattr(options, "default_version") and isinstance(options.default_version, list):
             options.default_version = list(dict.fromkeys(options.default_version))
         self._versioning_options = self._init_versioning(options)
+        self._versioning_strategy = create_versioning_strategy(self._versioning_options, self._global_prefix)
 
     def get_versioning(self) -> Optional[VersioningOptions]:
         """
@@ -55,6 +62,16 @@ class ApplicationConfig:
         if self._versioning_options:
             return self._versioning_options
 
+    def get_versioning_strategy(self) -> VersioningStrategy:
+        """
+        Retrieve the version extraction strategy, compiled when versioning is enabled
+        or the global prefix is set.
+
+        Returns:
+            VersioningStrategy: The strategy used to extract the version of each request.
+        """
+        return self._versioning_strategy
+
     @staticmethod
     def _init_versioning(versioning_options: Dict[str, Any]) -> VersioningOptions:
         versioning_type = versioning_options.get("type")
@@ -79,6 +96,7 @@ class ApplicationConfig:
             raise AttributeError("Global prefix is already set.")
         # remove leading and trailing slashes
         self._global_prefix = prefix.strip("/")
+        self._versioning_strategy = create_versioning_strategy(self._versioning_options, self._global_prefix)
 
     def get_global_prefix(self) -> Optional[str]:
         """
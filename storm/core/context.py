@@ -1,4 +1,4 @@
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 
 from .settings import AppSettings
 
@@ -20,6 +20,10 @@ class AppContext:
         get_settings() -> AppSettings:
             Retrieves the application settings for the current context. Raises a RuntimeError
             if the settings have not been set.
+
+        bind(settings: AppSettings) -> Token / unbind(token: Token):
+            Binds the settings of one application (e.g. while it handles a request, when
+            several applications share the process) and restores the previous ones.
     """
 
     _settings_ctx: ContextVar[AppSettings] = ContextVar("app_settings", default=None)
@@ -36,3 +40,15 @@ class AppContext:
         if settings is None:
             raise RuntimeError("Settings have not been set in AppContext.")
         return settings
+
+    @classmethod
+    def has_settings(cls) -> bool:
+        return cls._settings_ctx.get() is not None
+
+    @classmethod
+    def bind(cls, settings: AppSettings) -> Token:
+        return cls._settings_ctx.set(settings)
+
+    @classmethod
+    def unbind(cls, token: Token):
+        cls._settings_ctx.reset(token)
@@ -1,4 +1,5 @@
 from .add_params import add_params
+from .conditional import is_not_modified
 from .helpers import strip_etag_quotes
 
-__all__ = ["add_params", "strip_etag_quotes"]
+__all__ = ["add_params", "is_not_modified", "strip_etag_quotes"]
@@ -0,0 +1,102 @@
+import inspect
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from storm.common.enums.http_headers import HttpHeaders
+from storm.core.helpers.helpers import strip_etag_quotes
+
+
+@lru_cache(maxsize=None)
+def _validator_arguments(validator: Callable) -> Tuple[Tuple[str, ...], bool]:
+    """
+    Get the parameter names a validator declares, and whether it accepts any keyword.
+    """
+    parameters = inspect.signature(validator).parameters.values()
+    names = tuple(p.name for p in parameters if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY))
+    return names, any(p.kind == p.VAR_KEYWORD for p in parameters)
+
+
+async def call_validator(validator: Callable, request, params: Dict[str, Any]) -> Any:
+    """
+    Call an @ETag / @LastModified validator with the route parameters it declares.
+
+    :param validator: The validator function, sync or async
+    :param request: The HttpRequest, passed as `request` if the validator declares it
+    :param params: The route parameters
+    :return: The validator result
+    """
+    names, any_keyword = _validator_arguments(validator)
+    values = {**params, "request": request}
+    kwargs = values if any_keyword else {name: values[name] for name in names if name in values}
+    result = validator(**kwargs)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def format_etag(value: Any, weak: bool = False) -> str:
+    """
+    Format an entity tag as a header value, e.g. '"42"' or 'W/"42"'.
+    """
+    return f'W/"{value}"' if weak else f'"{value}"'
+
+
+def to_last_modified(value: Any) -> datetime:
+    """
+    Convert a validator result (datetime or POSIX timestamp) to an aware UTC datetime,
+    truncated to the second as HTTP dates are.
+    """
+    if not isinstance(value, datetime):
+        value = datetime.fromtimestamp(value, timezone.utc)
+    elif value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def format_http_date(value: datetime) -> str:
+    """
+    Format a datetime as an HTTP date, e.g. 'Sun, 06 Nov 1994 08:49:37 GMT'.
+    """
+    return format_datetime(value, usegmt=True)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an entity tag, with the weak comparison.
+
+    :param if_none_match: The header value: '*' or a comma-separated list of entity tags
+    :param etag: The formatted entity tag of the resource
+    """
+    if if_none_match.strip() == "*":
+        return True
+    current = strip_etag_quotes(etag)
+    return any(strip_etag_quotes(candidate) == current for candidate in if_none_match.split(","))
+
+
+def is_not_modified(request, etag: Optional[str], last_modified: Optional[datetime]) -> bool:
+    """
+    Evaluate If-None-Match, or If-Modified-Since when the former is absent, against the
+    validators of the resource.
+
+    :param request: The HttpRequest
+    :param etag: The formatted entity tag, if any
+    :param last_modified: The modification time, if any
+    :return: True if a 304 can be answered
+    """
+    if_none_match = request.get_if_none_match()
+    if if_none_match:
+        return etag is not None and etag_matches(if_none_match, etag)
+
+    if_modified_since = request.get_header(HttpHeaders.IF_MODIFIED_SINCE)
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        # Invalid dates are ignored
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified <= since
@@ -1,5 +1,5 @@
 import inspect
-import queue
+from collections import deque
 from typing import Any, Awaitable, Callable, List, Optional, Type, Union
 
 from rx import Observable
@@ -60,18 +60,20 @@ class InterceptorPipeline:
         else:
             raise TypeError("interceptor must be a subclass or instance of Interceptor")
 
-    def _merge_interceptors(self) -> queue.Queue:
+    def is_empty(self) -> bool:
         """
-        Merges the global and route interceptor lists into a single queue.
+        Check if no interceptor is registered.
+        """
+        return not self.global_interceptors and not self.route_interceptors
+
+    def _merge_interceptors(self) -> deque:
+        """
+        Merges the global and route interceptor lists into a single queue. A deque is used
+        rather than a (thread-safe, lock-based) queue.Queue: it is only used by one request.
 
         :return: A queue of all interceptors in the pipeline.
         """
-        all_interceptors = queue.Queue()
-        for interceptor in self.global_interceptors:
-            all_interceptors.put(interceptor)
-        for interceptor in self.route_interceptors:
-            all_interceptors.put(interceptor)
-        return all_interceptors
+        return deque((*self.global_interceptors, *self.route_interceptors))
 
     async def execute(self, handler: Callable[..., Awaitable[Any]]) -> Any:
         """
@@ -83,7 +85,7 @@ class InterceptorPipeline:
         all_interceptors = self._merge_interceptors()
         return await self._execute_interceptors(handler, all_interceptors)
 
-    async def _execute_interceptors(self, handler: Callable[..., Awaitable[Any]], interceptor_queue: queue.Queue) -> Any:
+    async def _execute_interceptors(self, handler: Callable[..., Awaitable[Any]], interceptor_queue: deque) -> Any:
         """
         Recursively processes the context through each interceptor in the list.
 
@@ -91,15 +93,18 @@ class InterceptorPipeline:
         :param interceptor_queue: The queue of interceptors to process the context through.
         :return: The response after processing by interceptors and handler.
         """
-        if interceptor_queue.empty():
+        if not interceptor_queue:
             # Resolve arguments for the handler using the Resolver
             resolved_args = await ParamsResolver.resolve(handler, ExecutionContext.get_request())
-            response = await handler(**resolved_args)
+            response = handler(**resolved_args)
+            # Generator handlers give their generator, which the application streams
+            if inspect.isawaitable(response):
+                response = await response
             if isinstance(response, Observable):
                 return await self._execute_observable(response)
             return response
 
-        current_interceptor: Interceptor = interceptor_queue.get()
+        current_interceptor: Interceptor = interceptor_queue.popleft()
 
         async def next_interceptor():
             return await self._execute_interceptors(handler, interceptor_queue)
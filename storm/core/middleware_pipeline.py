@@ -45,6 +45,12 @@ class MiddlewarePipeline:
         """
         self.global_middleware.put(middleware_cls())
 
+    def is_empty(self):
+        """
+        Check if no middleware is registered.
+        """
+        return self.global_middleware.empty() and self.route_middleware.empty()
+
     async def execute(self, request, handler):
         """
         Executes the middleware pipeline, processing the request through all middleware.
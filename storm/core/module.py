@@ -6,6 +6,7 @@ class ModuleBase:
         providers=None,
         imports=None,
         middleware=None,
+        mounts=None,
         module_cls=None,
     ):
         """
@@ -15,12 +16,14 @@ class ModuleBase:
         :param providers: List of provider (service) classes.
         :param imports: List of other modules to be imported.
         :param middleware: List of middleware classes.
+        :param mounts: List of (prefix, ASGI application) mounted by the application.
         :param module_cls: Optional custom module class with lifecycle hooks.
         """
         self.controllers = self._initialize_map(controllers)
         self.providers = self._initialize_map(providers)
         self.imports = imports or []
         self.middleware = middleware or []
+        self.mounts = mounts or []
         self._module_cls = module_cls
 
         # self._invoke_lifecycle_hook("onInit")
@@ -14,6 +14,11 @@ def help():
         "help()": "Show this help message",
         "list_services()": "List all registered services in the application",
         "list_controllers()": "List all registered controllers in the application",
+        "show_routes()": "List all registered routes in the application",
+        "reload()": "Rebuild the routes from the registered controllers",
+        "add_controller(cls)": "Register a controller while serving",
+        "remove_controller(name)": "Unregister a controller and its routes while serving",
+        "remove_route(method, path)": "Unregister a route while serving",
     }
     logger.info("Displaying help commands.")
     for command, description in commands.items():
@@ -42,14 +47,66 @@ def list_controllers(app):
             print(f" - {ctrl.__class__.__name__}")
 
 
+def _timed_rebuild(app, action):
+    """
+    Runs a route change and reports how long rebuilding the route table took.
+    """
+    start_time = time.perf_counter()
+    result = action()
+    elapsed = (time.perf_counter() - start_time) * 1000
+    routes = len(app.router.get_routes())
+    logger.info(f"Route table rebuilt in {elapsed:.2f} ms ({routes} routes)")
+    print(f"Route table rebuilt in {elapsed:.2f} ms ({routes} routes)")
+    return result
+
+
 def reload(app):
     """
-    Reloads the application’s modules and services.
+    Rebuilds the application routes from the registered controllers.
+    Requests keep being served by the previous routes until the new table is swapped in.
+    """
+    logger.info("Reloading the application routes.")
+    print("Reloading routes...")
+    _timed_rebuild(app, app.reload_routes)
+    print("Routes reloaded.")
+
+
+def add_controller(app, controller, module=None):
+    """
+    Registers a controller and its routes while the application is serving.
+    """
+    logger.info(f"Adding controller: {controller.__name__}")
+    instance = _timed_rebuild(app, lambda: app.add_controller(controller, module))
+    print(f"Controller '{controller.__name__}' added.")
+    return instance
+
+
+def remove_controller(app, controller):
+    """
+    Unregisters a controller and its routes while the application is serving.
+    """
+    logger.info(f"Removing controller: {controller}")
+    try:
+        removed = _timed_rebuild(app, lambda: app.remove_controller(controller))
+    except ValueError as e:
+        logger.warning(str(e))
+        print(str(e))
+        return
+    print(f"Controller removed ({removed} routes).")
+
+
+def remove_route(app, method, path, version=None):
+    """
+    Unregisters a route while the application is serving.
     """
-    logger.info("Reloading the application.")
-    print("Reloading application...")
-    app._load_modules()
-    print("Application reloaded.")
+    logger.info(f"Removing route: {method} {path}")
+
+    def remove():
+        with app.router.update():
+            return app.router.remove_route(method.upper(), path, version)
+
+    removed = _timed_rebuild(app, remove)
+    print(f"{removed} route(s) removed.")
 
 
 def show_routes(app):
@@ -58,7 +115,7 @@ def show_routes(app):
     """
     logger.info("Displaying registered routes.")
     print("Registered Routes:")
-    for route in app.router.routes:
+    for route in app.router.get_routes():
         print(f" - {route.method} {route.path}")
 
 
@@ -107,7 +164,7 @@ def inspect_route(app, path):
     Inspects a specific route by its path, showing handlers and middleware.
     """
     logger.info(f"Inspecting route: {path}")
-    route = next((route for route in app.router.routes if route.path == path), None)
+    route = next((route for route in app.router.get_routes() if route.path == path), None)
     if not route:
         logger.warning(f"No route found for path: {path}")
         print(f"No route found for path: {path}")
@@ -116,10 +173,9 @@ def inspect_route(app, path):
     print(f"Inspecting Route: {path}")
     print(f"Method: {route.method}")
     print(f"Handler: {route.handler.__name__}")
-    if route.middleware:
-        print("Middleware:")
-        for mw in route.middleware:
-            print(f" - {mw.__class__.__name__}")
+    print(f"Version: {route.version}")
+    if route.host:
+        print(f"Host: {route.host}")
 
 
 def benchmark(command, context):
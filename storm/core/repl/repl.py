@@ -8,7 +8,7 @@ import sys
 # from storm.core.repl.repl_logger import ReplLogger
 from storm.common.services.logger import Logger as ReplLogger
 
-from .commands import help, list_controllers, list_services, reload, show_routes
+from .commands import add_controller, help, list_controllers, list_services, reload, remove_controller, remove_route, show_routes
 
 
 class StormRepl:
@@ -27,6 +27,9 @@ class StormRepl:
             "list_controllers": lambda: list_controllers(app),
             "reload": lambda: reload(app),
             "show_routes": lambda: show_routes(app),
+            "add_controller": lambda controller, module=None: add_controller(app, controller, module),
+            "remove_controller": lambda controller: remove_controller(app, controller),
+            "remove_route": lambda method, path, version=None: remove_route(app, method, path, version),
         }
         self.banner = "Storm REPL - Type 'help()' for a list of available commands."
         # self.setup_history()
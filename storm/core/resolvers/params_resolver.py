@@ -1,16 +1,40 @@
+from collections.abc import Mapping
 from inspect import Parameter, signature
 
 from storm.common.decorators.body import Body
+from storm.common.decorators.file import File
+from storm.common.decorators.form import Form
 from storm.common.decorators.headers import Headers
+from storm.common.decorators.host_param import HostParam
 from storm.common.decorators.optional import OptionalMeta
 from storm.common.decorators.param import Param
 from storm.common.decorators.query_params import Query
 from storm.common.execution_context import ExecutionContext
 
 
+def handler_parameters(handler):
+    """
+    Get the parameters of a handler. They are computed once and kept on the underlying
+    function, so they go away with it (e.g. when a controller is removed).
+
+    :param handler: The handler function or bound method
+    :return: The parameters, by name
+    """
+    func = getattr(handler, "__func__", handler)
+    parameters = getattr(func, "__storm_params__", None)
+    if parameters is None:
+        parameters = signature(handler).parameters
+        try:
+            func.__storm_params__ = parameters
+        except AttributeError:
+            # Builtins and other callables without a __dict__ are inspected on every call
+            pass
+    return parameters
+
+
 class ParamsResolver:
     """
-    A class responsible for resolving handler arguments, including instances of Param, Query, Body, and Optional.
+    A class responsible for resolving handler arguments, including instances of Param, HostParam, Query, Body, File, Form, and Optional.
     """
 
     @staticmethod
@@ -26,11 +50,19 @@ class ParamsResolver:
         request = ExecutionContext.get_request()
         if request is None:
             raise ValueError("Request object is missing")
+        parameters = handler_parameters(handler)
+        if not parameters:
+            # Nothing to resolve: leave the query string unparsed
+            return resolved_args
         route_params = request.get_params()
         query_params = request.get_query_params()
         body = request.get_body()
 
-        for param_name, param in signature(handler).parameters.items():
+        for param_name, param in parameters.items():
+            if body is None and param.default is Parameter.empty and param_name not in route_params and param_name not in query_params:
+                # The body is only received when a parameter can only come from it
+                await request.parse_body()
+                body = request.get_body()
             resolved_args[param_name] = await ParamsResolver._resolve_param(param, route_params, query_params, body)
 
         return resolved_args
@@ -61,7 +93,9 @@ class ParamsResolver:
         :param body: Body content from the request.
         :return: The resolved value for the parameter.
         """
-        if isinstance(param.default, (Param, Query, Body, Headers)):
+        if isinstance(param.default, (File, Form)):
+            return await param.default.resolve(param.name)
+        if isinstance(param.default, (Param, Query, Body, Headers, HostParam)):
             return await param.default.resolve()
         if isinstance(param.default, OptionalMeta):
             return param.default.default
@@ -82,6 +116,7 @@ class ParamsResolver:
             return route_params[param_name]
         if param_name in query_params:
             return query_params[param_name]
-        if param_name in body:
+        # Only decoded bodies have fields; a spooled body is a file and raw bodies are bytes
+        if isinstance(body, Mapping) and param_name in body:
             return body[param_name]
         return None
@@ -1,4 +1,6 @@
+from storm.common.constants import HOST_METADATA
 from storm.common.services.logger import Logger
+from storm.core.di.reflect import Reflect
 from storm.core.router.router import Router
 from storm.core.wrappers.sse_wrapper import _wrap_sse_handler
 
@@ -66,7 +68,11 @@ class RouteResolver:
         normilized_prefix = self.router.get_prefix() or ""
         normilized_path = self.router.normalize_path(base_path)
         path = normilized_prefix + normilized_path
-        self.logger.info(f"{controller.__class__.__name__} {{{Router.normalize_path(path)}}}")
+        host = self.get_host(controller)
+        if host:
+            self.logger.info(f"{controller.__class__.__name__} {{{Router.normalize_path(path)}}} (host: {host})")
+        else:
+            self.logger.info(f"{controller.__class__.__name__} {{{Router.normalize_path(path)}}}")
 
         for attr_name in dir(controller):
             route_info = explorer.explore_route(controller, attr_name, path)
@@ -75,11 +81,41 @@ class RouteResolver:
 
                 if route_info.get("is_sse"):
                     sse_handler = _wrap_sse_handler(route_info["handler"])
-                    self.router.add_sse_route(route_info["method"], route_info["path"], sse_handler, version)
+                    self.router.add_sse_route(route_info["method"], route_info["path"], sse_handler, version, host)
                 else:
                     self.router.add_route(
                         route_info["method"],
                         route_info["path"],
                         route_info["handler"],
                         version,
+                        host,
                     )
+
+    def unregister_routes(self, controller) -> int:
+        """
+        Remove the routes of a controller from the router.
+
+        :param controller: The controller instance whose routes are removed.
+        :return: The number of routes removed.
+        """
+
+        def belongs_to_controller(route):
+            handler = getattr(route.handler, "__wrapped__", route.handler) if route.is_sse else route.handler
+            return getattr(handler, "__self__", None) is controller
+
+        removed = self.router.remove_routes(belongs_to_controller)
+        self.logger.info(f"{controller.__class__.__name__} routes removed ({removed})")
+        return removed
+
+    @staticmethod
+    def get_host(controller):
+        """
+        Get the host(s) a controller is bound to, from `@Controller(host=...)`.
+
+        :param controller: The controller instance.
+        :return: The host, a list of hosts, or None if the controller answers any host.
+        """
+        host = getattr(controller, "__host__", None)
+        if host is None:
+            host = Reflect.get_metadata(HOST_METADATA, type(controller))
+        return host
@@ -0,0 +1,121 @@
+import re
+import uuid
+from typing import Any, Dict
+
+
+class Converter:
+    """
+    Base class for typed path parameter converters, e.g. '/users/:id<int>'.
+
+    Attributes:
+        name (str): The type name used in route paths.
+        regex (str): The pattern matched by the parameter, used when the route needs a regex.
+        weight (int): How selective the converter is; typed parameters rank above plain ones
+            when several routes match the same path.
+    """
+
+    name = "str"
+    regex = r"[^/]+"
+    weight = 0
+
+    def to_python(self, value: str) -> Any:
+        """
+        Converts a path segment.
+
+        :param value: The raw path segment
+        :return: The converted value
+        :raises ValueError: If the segment does not match the converter
+        """
+        return value
+
+
+class StringConverter(Converter):
+    """
+    Matches any non-empty segment. This is what an untyped ':param' does.
+    """
+
+
+class IntConverter(Converter):
+    """
+    Matches integers, e.g. '42' or '-1'.
+    """
+
+    name = "int"
+    regex = r"-?\d+"
+    weight = 1
+    _pattern = re.compile(regex)
+
+    def to_python(self, value: str) -> int:
+        if not self._pattern.fullmatch(value):
+            raise ValueError(f"Invalid integer: {value}")
+        return int(value)
+
+
+class FloatConverter(Converter):
+    """
+    Matches decimal numbers, e.g. '3.14' or '-2'.
+    """
+
+    name = "float"
+    regex = r"-?\d+(?:\.\d+)?"
+    weight = 1
+    _pattern = re.compile(regex)
+
+    def to_python(self, value: str) -> float:
+        if not self._pattern.fullmatch(value):
+            raise ValueError(f"Invalid float: {value}")
+        return float(value)
+
+
+class UUIDConverter(Converter):
+    """
+    Matches canonical UUIDs, e.g. '123e4567-e89b-12d3-a456-426614174000'.
+    """
+
+    name = "uuid"
+    regex = r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    weight = 1
+    _pattern = re.compile(regex)
+
+    def to_python(self, value: str) -> uuid.UUID:
+        if not self._pattern.fullmatch(value):
+            raise ValueError(f"Invalid UUID: {value}")
+        return uuid.UUID(value)
+
+
+class PathConverter(Converter):
+    """
+    Matches the rest of the path, slashes included, e.g. ':file<path>' on '/docs/a/b.md'.
+    """
+
+    name = "path"
+    regex = r".+"
+    weight = -1
+
+
+CONVERTERS: Dict[str, Converter] = {
+    converter.name: converter
+    for converter in (
+        StringConverter(),
+        IntConverter(),
+        FloatConverter(),
+        UUIDConverter(),
+        PathConverter(),
+    )
+}
+
+
+def get_converter(type_name: str | None) -> Converter:
+    """
+    Get the converter of a typed path parameter.
+
+    :param type_name: The type declared in the path (e.g. 'int'), None for an untyped parameter
+    :return: The Converter instance
+    :raises ValueError: If the type is unknown
+    """
+    if type_name is None:
+        return CONVERTERS["str"]
+    converter = CONVERTERS.get(type_name)
+    if converter is None:
+        raise ValueError(f"Unknown path parameter type '{type_name}'. Expected one of: {', '.join(CONVERTERS)}")
+    return converter
@@ -0,0 +1,139 @@
+import asyncio
+from typing import Any, Callable, Dict, Optional, Tuple
+
+ASGIApp = Callable[[Dict[str, Any], Callable, Callable], Any]
+
+
+class MountTable:
+    """
+    The ASGI applications mounted under a path prefix of the application.
+
+    Prefixes are kept in a dictionary and a request path is matched by trying its own
+    prefixes from the longest to the shortest ('/a/b/c', '/a/b', '/a'), so dispatching
+    costs one dictionary lookup per path segment whatever the number of mounts, and the
+    longest mounted prefix always wins. Prefixes only match on segment boundaries:
+    '/metrics' matches '/metrics' and '/metrics/cpu' but not '/metricsx'.
+    """
+
+    __slots__ = ("_apps",)
+
+    def __init__(self):
+        self._apps: Dict[str, ASGIApp] = {}
+
+    def __len__(self):
+        return len(self._apps)
+
+    def __iter__(self):
+        return iter(self._apps.items())
+
+    def add(self, prefix: str, app: ASGIApp):
+        """
+        Mounts an application.
+
+        :param prefix: The normalized path prefix (e.g. '/metrics')
+        :param app: The ASGI application
+        :raises ValueError: If the prefix is the root path or is already mounted
+        """
+        if prefix == "/":
+            raise ValueError("Cannot mount an application at the root path.")
+        if prefix in self._apps:
+            raise ValueError(f"An application is already mounted at {prefix}")
+        self._apps[prefix] = app
+
+    def match(self, path: str) -> Optional[Tuple[str, ASGIApp]]:
+        """
+        Finds the application mounted at the longest prefix of a path.
+
+        :param path: The request path
+        :return: A tuple (prefix, app) or None when no mounted application matches
+        """
+        apps = self._apps
+        candidate = path
+        while candidate:
+            app = apps.get(candidate)
+            if app is not None:
+                return candidate, app
+            candidate = candidate[: candidate.rfind("/")]
+        return None
+
+    @staticmethod
+    def child_scope(scope: Dict[str, Any], prefix: str) -> Dict[str, Any]:
+        """
+        Builds the scope seen by a mounted application: the prefix moves from the path to
+        the root path.
+
+        :param scope: The ASGI scope of the request
+        :param prefix: The prefix the application is mounted at
+        :return: A shallow copy of the scope with the rewritten path, raw path and root path
+        """
+        child = dict(scope)
+        child["path"] = scope["path"][len(prefix) :] or "/"
+        child["root_path"] = scope.get("root_path", "") + prefix
+        raw_path = scope.get("raw_path")
+        if raw_path:
+            raw_prefix = prefix.encode("utf-8")
+            if raw_path.startswith(raw_prefix):
+                child["raw_path"] = raw_path[len(raw_prefix) :] or b"/"
+        return child
+
+
+class MountedLifespan:
+    """
+    Runs the ASGI lifespan protocol of a mounted application alongside the one of the
+    application, so that its startup and shutdown hooks run.
+
+    Applications that do not support the protocol (they return or raise instead of
+    answering `lifespan.startup`) are started without it, as ASGI servers do.
+
+    :param app: The mounted ASGI application
+    :param scope: The lifespan scope received by the application
+    """
+
+    def __init__(self, app: ASGIApp, scope: Dict[str, Any]):
+        self.app = app
+        self.scope = scope
+        self.supported = False
+        self._receive_queue: asyncio.Queue = asyncio.Queue()
+        self._send_queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Future] = None
+
+    async def _run(self):
+        try:
+            await self.app(self.scope, self._receive_queue.get, self._send_queue.put)
+        except Exception:
+            # Treated as no lifespan support when raised before answering the startup
+            pass
+        finally:
+            # Unblocks a startup or shutdown waiting for an answer that will never come
+            self._send_queue.put_nowait(None)
+
+    async def _send(self, event_type: str) -> Optional[Dict[str, Any]]:
+        await self._receive_queue.put({"type": event_type})
+        return await self._send_queue.get()
+
+    async def startup(self) -> None:
+        """
+        Send `lifespan.startup` and wait for the application to start.
+
+        :raises RuntimeError: If the application reports `lifespan.startup.failed`
+        """
+        self._task = asyncio.ensure_future(self._run())
+        message = await self._send("lifespan.startup")
+        if message is None:
+            return
+        if message["type"] == "lifespan.startup.failed":
+            raise RuntimeError(message.get("message", "") or "Mounted application failed to start")
+        self.supported = True
+
+    async def shutdown(self) -> None:
+        """
+        Send `lifespan.shutdown` and wait for the application to stop.
+
+        :raises RuntimeError: If the application reports `lifespan.shutdown.failed`
+        """
+        if self.supported:
+            message = await self._send("lifespan.shutdown")
+            if message is not None and message["type"] == "lifespan.shutdown.failed":
+                raise RuntimeError(message.get("message", "") or "Mounted application failed to stop")
+        if self._task is not None:
+            await self._task
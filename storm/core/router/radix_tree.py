@@ -0,0 +1,249 @@
+import re
+from bisect import insort
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from storm.core.router.converters import Converter, get_converter
+
+# ':name' or ':name<type>' anywhere in a path
+PARAM_PATTERN = re.compile(r":(\w+)(?:<(\w+)>)?")
+PARAM_SEGMENT = re.compile(r"^:(\w+)(?:<(\w+)>)?$")
+
+# (specificity, path) - the same ordering key the router has always used for dynamic routes
+RouteKey = Tuple[Any, str]
+
+
+class RadixNode:
+    """
+    A single node of the route tree. Each node represents one path segment.
+
+    Attributes:
+        static_children: Children keyed by their literal segment.
+        param_child: The child matching any non-empty segment (a `:param` segment).
+        typed_children: Children of typed segments (e.g. `:id<int>`), keyed by type name.
+        catch_all: The route consuming the rest of the path (a trailing `:name<path>` segment).
+        route: The winning route that terminates at this node, as (key, param_names, handler).
+    """
+
+    __slots__ = ("static_children", "param_child", "typed_children", "catch_all", "route")
+
+    def __init__(self):
+        self.static_children: Dict[str, "RadixNode"] = {}
+        self.param_child: Optional["RadixNode"] = None
+        self.typed_children: Dict[str, Tuple[Converter, "RadixNode"]] = {}
+        self.catch_all: Optional[Tuple[RouteKey, List[str], Callable]] = None
+        self.route: Optional[Tuple[RouteKey, List[str], Callable]] = None
+
+
+class RadixTree:
+    """
+    A segment based radix tree used to resolve dynamic routes.
+
+    Static segments are looked up in a dictionary and `:param` segments share a single
+    wildcard edge per node, so resolving a path costs time proportional to its depth rather
+    than to the number of registered routes. When several routes match the same path, the one
+    with the highest (specificity, path) key wins, exactly like the former linear regex scan.
+
+    Typed segments (`:id<int>`, `:id<uuid>`...) only match when their converter accepts the
+    segment, and the converted value is what ends up in the params. A segment rejected by a
+    converter simply falls through to the other candidates.
+
+    Routes that embed a parameter inside a segment (e.g. '/files/:name.json') cannot be
+    expressed as tree edges; they are kept in a small ordered regex list and checked after
+    the tree lookup.
+    """
+
+    def __init__(self):
+        self.root = RadixNode()
+        # Kept in ascending key order and scanned from the end
+        self._fallback: List[Tuple[RouteKey, re.Pattern, Dict[str, Converter], Callable]] = []
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @staticmethod
+    def _split(path: str) -> List[str]:
+        """
+        Splits a path into its segments, ignoring the leading and a single trailing slash.
+
+        :param path: The URL path
+        :return: The list of path segments
+        """
+        segments = path.split("/")[1:]
+        if segments and segments[-1] == "":
+            segments.pop()
+        return segments
+
+    @classmethod
+    def supports(cls, path: str) -> bool:
+        """
+        Check if every segment of a path can be held as a tree edge, i.e. parameters only
+        appear as whole `:name` segments and a `<path>` parameter is the last segment.
+
+        :param path: The route path
+        :return: True if the route can be inserted without a regex
+        """
+        segments = cls._split(path)
+        for index, segment in enumerate(segments):
+            if ":" not in segment:
+                continue
+            match = PARAM_SEGMENT.match(segment)
+            if not match:
+                return False
+            if get_converter(match.group(2)).name == "path" and index != len(segments) - 1:
+                return False
+        return True
+
+    def insert(self, path: str, handler: Callable, specificity: Any, path_regex: Optional[re.Pattern] = None):
+        """
+        Inserts a dynamic route into the tree.
+
+        :param path: The normalized route path (e.g., '/users/:id' or '/users/:id<int>')
+        :param handler: The function handling the route
+        :param specificity: The specificity score of the route
+        :param path_regex: The compiled regex of the route, required when `supports(path)` is False
+        """
+        key = (specificity, path)
+        segments = self._split(path)
+        self._size += 1
+
+        if not self.supports(path):
+            if path_regex is None:
+                raise ValueError(f"A regex is required for route {path}")
+            converters = {name: get_converter(type_name) for name, type_name in PARAM_PATTERN.findall(path) if type_name}
+            insort(self._fallback, (key, path_regex, converters, handler), key=itemgetter(0))
+            return
+
+        node = self.root
+        param_names = []
+        for segment in segments:
+            match = PARAM_SEGMENT.match(segment) if segment.startswith(":") else None
+            if match is None:
+                child = node.static_children.get(segment)
+                if child is None:
+                    child = node.static_children[segment] = RadixNode()
+                node = child
+                continue
+
+            name, converter = match.group(1), get_converter(match.group(2))
+            param_names.append(name)
+            if converter.name == "path":
+                if node.catch_all is None or key >= node.catch_all[0]:
+                    node.catch_all = (key, param_names, handler)
+                return
+            if converter.name == "str":
+                if node.param_child is None:
+                    node.param_child = RadixNode()
+                node = node.param_child
+            else:
+                typed = node.typed_children.get(converter.name)
+                if typed is None:
+                    typed = node.typed_children[converter.name] = (converter, RadixNode())
+                node = typed[1]
+
+        # Every route ending on this node matches the exact same set of paths,
+        # so only the one ranked first can ever be resolved.
+        if node.route is None or key >= node.route[0]:
+            node.route = (key, param_names, handler)
+
+    def lookup(self, path: str) -> Optional[Tuple[Callable, Dict[str, Any]]]:
+        """
+        Finds the best matching route for a path.
+
+        :param path: The request path
+        :return: A tuple (handler, params) or None when no route matches
+        """
+        best = self._match(self.root, self._split(path), 0, [])
+
+        if self._fallback:
+            for fallback_key, path_regex, converters, fallback_handler in reversed(self._fallback):
+                if best is not None and fallback_key <= best[0]:
+                    break
+                match = path_regex.match(path)
+                if match:
+                    params = match.groupdict()
+                    try:
+                        for name, converter in converters.items():
+                            params[name] = converter.to_python(params[name])
+                    except ValueError:
+                        continue
+                    return fallback_handler, params
+
+        if best is None:
+            return None
+        return best[2], best[1]
+
+    def _match(self, node: RadixNode, segments: List[str], index: int, values: List[Any]):
+        """
+        Walks the tree along the path segments. Static edges are followed directly; the search
+        only branches when a node offers several candidate edges for a segment, in which case
+        the match with the highest key is kept.
+
+        :param node: The node to start from
+        :param segments: The request path segments
+        :param index: The index of the segment to match against the children of `node`
+        :param values: The parameter values captured so far (may be extended in place)
+        :return: A tuple (key, params, handler) or None
+        """
+        count = len(segments)
+        while index < count:
+            if node.typed_children or node.catch_all is not None:
+                return self._match_branches(node, segments, index, values)
+
+            segment = segments[index]
+            child = node.static_children.get(segment)
+            param_child = node.param_child if segment else None
+            index += 1
+
+            if child is not None:
+                if param_child is not None:
+                    candidate = self._match(param_child, segments, index, values + [segment])
+                    best = self._match(child, segments, index, values)
+                    if candidate is not None and (best is None or candidate[0] > best[0]):
+                        return candidate
+                    return best
+                node = child
+            elif param_child is not None:
+                values.append(segment)
+                node = param_child
+            else:
+                return None
+
+        if node.route is None:
+            return None
+        key, param_names, handler = node.route
+        return key, dict(zip(param_names, values, strict=True)), handler
+
+    def _match_branches(self, node: RadixNode, segments: List[str], index: int, values: List[Any]):
+        """
+        Tries every edge of a node having typed or catch-all children and keeps the best match.
+        """
+        segment = segments[index]
+        candidates = []
+
+        child = node.static_children.get(segment)
+        if child is not None:
+            candidates.append(self._match(child, segments, index + 1, list(values)))
+
+        if segment:
+            if node.param_child is not None:
+                candidates.append(self._match(node.param_child, segments, index + 1, values + [segment]))
+            for converter, typed_child in node.typed_children.values():
+                try:
+                    value = converter.to_python(segment)
+                except ValueError:
+                    continue
+                candidates.append(self._match(typed_child, segments, index + 1, values + [value]))
+
+        if node.catch_all is not None:
+            rest = "/".join(segments[index:])
+            if rest:
+                key, param_names, handler = node.catch_all
+                candidates.append((key, dict(zip(param_names, values + [rest], strict=True)), handler))
+
+        best = None
+        for candidate in candidates:
+            if candidate is not None and (best is None or candidate[0] > best[0]):
+                best = candidate
+        return best
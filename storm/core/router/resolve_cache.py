@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class ResolveCache:
+    """
+    A size-bounded LRU cache of resolved routes.
+
+    Entries map a request key (method, raw path, version-relevant header, host) to the resolved
+    handler and private copies of its params and host params; callers always receive fresh
+    copies so they can mutate them freely. Only successful resolutions are stored, so random
+    paths from scanners cannot evict the hot entries with misses.
+
+    Attributes:
+        max_size (int): The maximum number of entries kept.
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups that had to go through the route table.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        if max_size <= 0:
+            raise ValueError("The resolve cache size must be a positive integer.")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Callable, Dict[str, Any], Optional[Dict[str, Any]]]]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Tuple[Callable, Dict[str, Any], Optional[Dict[str, Any]]]]:
+        """
+        Get a cached resolution and mark it as recently used.
+
+        :param key: The request key
+        :return: A tuple (handler, params, host_params) or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        handler, params, host_params = entry
+        return handler, dict(params), dict(host_params) if host_params else None
+
+    def put(self, key: Hashable, handler: Callable, params: Dict[str, Any], host_params: Optional[Dict[str, Any]] = None):
+        """
+        Store a resolution, evicting the least recently used entry when full.
+
+        :param key: The request key
+        :param handler: The resolved handler
+        :param params: The resolved route params
+        :param host_params: The values captured by the host pattern, if any
+        """
+        self._entries[key] = (handler, dict(params), dict(host_params) if host_params else None)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the cache counters.
+
+        :return: A dictionary with hits, misses, size, max_size and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
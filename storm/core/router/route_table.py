@@ -0,0 +1,186 @@
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from storm.core.router.radix_tree import RadixTree
+
+
+def normalize_host(host: str) -> str:
+    """
+    Normalizes a request host: lower case, without port nor trailing dot.
+
+    :param host: The Host header value (e.g. 'Acme.Example.com:8000')
+    :return: The normalized host (e.g. 'acme.example.com')
+    """
+    host = host.lower()
+    if not host.endswith("]"):  # keep IPv6 literals such as '[::1]' intact
+        name, sep, port = host.rpartition(":")
+        if sep and port.isdigit():
+            host = name
+    return host.rstrip(".")
+
+
+class HostTable:
+    """
+    The route tables of the controllers bound to a host.
+
+    Exact hosts are found with a single dictionary lookup. Parameterised patterns such as
+    ':tenant.example.com' are stored label by label, from the top level domain down, in a
+    RadixTree, so matching costs time proportional to the number of labels of the host
+    rather than to the number of registered patterns.
+
+    Attributes:
+        exact: host -> RouteTable
+        patterns: RadixTree of the parameterised host patterns, resolving to their RouteTable.
+    """
+
+    __slots__ = ("exact", "patterns")
+
+    def __init__(self, exact: Dict[str, "RouteTable"], patterns: Optional[RadixTree]):
+        self.exact = exact
+        self.patterns = patterns
+
+    @staticmethod
+    def pattern_to_path(pattern: str) -> str:
+        """
+        Converts a host pattern to the path stored in the pattern tree.
+
+        :param pattern: The host pattern (e.g. ':tenant.example.com')
+        :return: The tree path (e.g. '/com/example/:tenant')
+        """
+        return "/" + "/".join(reversed(pattern.split(".")))
+
+    def match(self, host: str) -> Optional[Tuple["RouteTable", Dict[str, Any]]]:
+        """
+        Finds the table of a host.
+
+        :param host: The normalized request host
+        :return: A tuple (table, host_params) or None if no controller is bound to the host
+        """
+        table = self.exact.get(host)
+        if table is not None:
+            return table, {}
+        if self.patterns is not None:
+            return self.patterns.lookup(self.pattern_to_path(host))
+        return None
+
+
+class RouteTable:
+    """
+    An immutable snapshot of the lookup structures used by the Router.
+
+    A table is built in a single pass from the routes registered on the router and is never
+    mutated afterwards; changing the routes means building a new table.
+
+    Attributes:
+        static_routes: method -> version -> { path: handler }, SSE routes taking precedence.
+        route_trees: method -> version -> RadixTree of the dynamic routes.
+        size: The number of routes held by the table.
+        hosts: The tables of the host-bound controllers, or None when there are none.
+        methods: The HTTP methods having at least one route in the table.
+    """
+
+    __slots__ = ("static_routes", "route_trees", "size", "hosts", "methods")
+
+    def __init__(
+        self,
+        static_routes: Dict[str, Dict[Any, Dict[str, Callable]]],
+        route_trees: Dict[str, Dict[Any, RadixTree]],
+        size: int,
+        hosts: Optional[HostTable] = None,
+    ):
+        self.static_routes = static_routes
+        self.route_trees = route_trees
+        self.size = size
+        self.hosts = hosts
+        self.methods = frozenset(static_routes) | frozenset(route_trees)
+
+    @classmethod
+    def build(cls, static_routes, sse_routes, dynamic_routes, host_routes=None) -> "RouteTable":
+        """
+        Builds a table from the router registries.
+
+        :param static_routes: method -> version -> { path: handler }
+        :param sse_routes: method -> version -> { path: handler }
+        :param dynamic_routes: method -> version -> list of (specificity, path, regex, handler)
+        :param host_routes: host pattern -> (static_routes, sse_routes, dynamic_routes)
+        :return: The new RouteTable
+        """
+        static_table: Dict[str, Dict[Any, Dict[str, Callable]]] = {}
+        size = 0
+
+        for registry in (static_routes, sse_routes):
+            for method, versions in registry.items():
+                for version, routes in versions.items():
+                    # SSE routes are registered second so they override plain routes on the same path
+                    static_table.setdefault(method, {}).setdefault(version, {}).update(routes)
+                    size += len(routes)
+
+        tree_table: Dict[str, Dict[Any, RadixTree]] = {}
+        for method, versions in dynamic_routes.items():
+            for version, routes in versions.items():
+                tree = RadixTree()
+                for specificity, path, path_regex, handler in routes:
+                    tree.insert(path, handler, specificity, path_regex)
+                tree_table.setdefault(method, {})[version] = tree
+                size += len(routes)
+
+        hosts = None
+        if host_routes:
+            exact: Dict[str, RouteTable] = {}
+            patterns = None
+            for pattern, registries in host_routes.items():
+                host_table = cls.build(*registries)
+                size += host_table.size
+                if ":" in pattern:
+                    if patterns is None:
+                        patterns = RadixTree()
+                    path = HostTable.pattern_to_path(pattern)
+                    static_labels = len([label for label in pattern.split(".") if not label.startswith(":")])
+                    patterns.insert(path, host_table, static_labels)
+                else:
+                    exact[pattern] = host_table
+            hosts = HostTable(exact, patterns)
+
+        return cls(static_table, tree_table, size, hosts)
+
+    def lookup(self, method: str, version: Any, path: str) -> Optional[Tuple[Callable, Dict[str, Any]]]:
+        """
+        Looks a path up for the given method and version.
+
+        :param method: The HTTP method
+        :param version: The version to look in
+        :param path: The request path
+        :return: A tuple (handler, params) or None when nothing matches
+        """
+        static = self.static_routes.get(method)
+        if static is not None:
+            routes = static.get(version)
+            if routes is not None:
+                handler = routes.get(path)
+                if handler is not None:
+                    return handler, {}
+
+        trees = self.route_trees.get(method)
+        if trees is not None:
+            tree = trees.get(version)
+            if tree is not None:
+                return tree.lookup(path)
+        return None
+
+    def allowed_methods(self, versions, path: str, exclude: Optional[str] = None) -> Set[str]:
+        """
+        Finds the methods having a route for a path, e.g. to answer a 405.
+
+        :param versions: The versions to look in
+        :param path: The request path
+        :param exclude: A method not to look up, typically the one that already missed
+        :return: The set of methods matching the path
+        """
+        allowed = set()
+        for method in self.methods:
+            if method == exclude:
+                continue
+            for version in versions:
+                if self.lookup(method, version, path) is not None:
+                    allowed.add(method)
+                    break
+        return allowed
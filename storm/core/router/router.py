@@ -1,68 +1,191 @@
 import re
-from collections import defaultdict
-from typing import Optional
+import threading
+from collections import defaultdict, namedtuple
+from contextlib import contextmanager
+from typing import Callable, List, Optional
 
-from storm.common.enums.versioning_type import VersioningType
 from storm.common.services.logger import Logger
 from storm.core.adapters.http_request import HttpRequest
 from storm.core.appliction_config import ApplicationConfig
+from storm.core.context import AppContext
 from storm.core.interfaces.version_options_interface import VERSION_NEUTRAL
+from storm.core.router.converters import get_converter
+from storm.core.router.radix_tree import PARAM_PATTERN, RadixTree
+from storm.core.router.resolve_cache import ResolveCache
+from storm.core.router.route_table import HostTable, RouteTable, normalize_host
+
+# A registered route, as listed by `Router.get_routes`
+Route = namedtuple("Route", ["method", "path", "handler", "version", "host", "is_sse"])
+
+
+class RouteMiss:
+    """
+    Returned by `Router.match` when no route matches a request. A miss is falsy.
+
+    Attributes:
+        allowed_methods (frozenset): The methods having a route for the path; when not
+            empty the request should be answered with a 405 rather than a 404.
+    """
+
+    __slots__ = ("allowed_methods",)
+
+    def __init__(self, allowed_methods: frozenset = frozenset()):
+        self.allowed_methods = allowed_methods
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return f"RouteMiss(allowed_methods={set(self.allowed_methods) or '{}'})"
+
+
+# The miss of a path no method has a route for
+NOT_FOUND = RouteMiss()
 
 
 class Router:
-    def __init__(self, app_config: ApplicationConfig | None = None):
+    def __init__(self, app_config: ApplicationConfig | None = None, cache_size: int | None = None):
+        """
+        :param app_config: The application configuration (versioning, global prefix)
+        :param cache_size: The size of the resolve cache, 0 to disable it. Defaults to the
+            `route_cache_enabled` / `route_cache_max_size` settings.
+        """
         self.logger = Logger(self.__class__.__name__)
         self.app_config = app_config
+        self._reset_registries()
+        # Lookup structures built from the registries above by `compile`
+        self._table: Optional[RouteTable] = None
+        self._frozen = False
+        # Serializes the writers of `update`; `resolve` never takes it
+        self._lock = threading.RLock()
+        self._updating = False
+
+        if cache_size is None:
+            settings = AppContext.get_settings()
+            cache_size = settings.route_cache_max_size if settings.route_cache_enabled else 0
+        self.cache: Optional[ResolveCache] = ResolveCache(cache_size) if cache_size else None
+
+    def _reset_registries(self):
+        """
+        Drops every registered route.
+        """
         self.static_routes = defaultdict(lambda: defaultdict(dict))  # method -> { path: handler }
-        # method -> list of (specificity, path, regex, handler)
+        # method -> list of (specificity, path, regex or None, handler), in registration order
         self.dynamic_routes = defaultdict(lambda: defaultdict(list))
         # method -> { path: handler }
         self.sse_routes = defaultdict(lambda: defaultdict(dict))
+        # host pattern -> (static_routes, sse_routes, dynamic_routes) of the host-bound controllers
+        self.host_routes = {}
 
-    def add_sse_route(self, method, path, handler, version=None):
+    def add_sse_route(self, method, path, handler, version=None, host=None):
         """
         Registers a new SSE route with the specified HTTP method and path.
         """
-        path = self.normalize_path(path)
-        path_regex = self._path_to_regex(path)
-
-        versions = version if isinstance(version, list) else [version or VERSION_NEUTRAL]
-
-        for v in versions:
-            if ":" in path:
-                specificity = self._specificity(path)
-                self.dynamic_routes[method][v].append((specificity, path, path_regex, handler))
-                self.dynamic_routes[method][v].sort(reverse=True)
-            else:
-                self.sse_routes[method][v][path] = handler
+        self._register(method, path, handler, version, host, sse=True)
 
-    def add_route(self, method, path, handler, version=None):
+    def add_route(self, method, path, handler, version=None, host=None):
         """
         Registers a new route with the specified HTTP method and path.
 
         :param method: The HTTP method (GET, POST, etc.)
         :param path: The URL path (e.g., '/users/:id')
         :param handler: The function to handle requests to this route
+        :param version: The version(s) of the route
+        :param host: The host(s) the route is bound to, exact ('api.example.com')
+            or parameterised (':tenant.example.com')
+        """
+        self._register(method, path, handler, version, host)
+
+    def _register(self, method, path, handler, version=None, host=None, sse=False):
+        """
+        Records a route in the registries of its hosts.
         """
+        self._ensure_mutable()
         path = self.normalize_path(path)
-        path_regex = self._path_to_regex(path)
 
         versions = version if isinstance(version, list) else [version or VERSION_NEUTRAL]
-
-        for v in versions:
-            if ":" in path:
-                specificity = self._specificity(path)
-                self.dynamic_routes[method][v].append((specificity, path, path_regex, handler))
-                self.dynamic_routes[method][v].sort(reverse=True)
-            else:
-                self.static_routes[method][v][path] = handler
+        hosts = host if isinstance(host, list) else [host]
+
+        if ":" in path:
+            specificity = self._specificity(path)
+            # Regexes are only needed for parameters the radix tree cannot express
+            path_regex = None if RadixTree.supports(path) else self._path_to_regex(path)
+
+        for h in hosts:
+            static_routes, sse_routes, dynamic_routes = self._registries(h)
+            for v in versions:
+                if ":" in path:
+                    dynamic_routes[method][v].append((specificity, path, path_regex, handler))
+                elif sse:
+                    sse_routes[method][v][path] = handler
+                else:
+                    static_routes[method][v][path] = handler
+
+    def _registries(self, host=None):
+        """
+        Returns the (static_routes, sse_routes, dynamic_routes) registries of a host.
+        """
+        if not host:
+            return self.static_routes, self.sse_routes, self.dynamic_routes
+
+        host = normalize_host(host)
+        registries = self.host_routes.get(host)
+        if registries is None:
+            if ":" in host and not RadixTree.supports(HostTable.pattern_to_path(host)):
+                raise ValueError(f"Invalid host pattern: {host}")
+            registries = self.host_routes[host] = (
+                defaultdict(lambda: defaultdict(dict)),
+                defaultdict(lambda: defaultdict(dict)),
+                defaultdict(lambda: defaultdict(list)),
+            )
+        return registries
 
     def resolve(self, method: str, path: str, request: HttpRequest = None, version=None):
         """
         Resolves a route for the given HTTP method, path, and version.
 
         If no route is found for the specific version, falls back to VERSION_NEUTRAL.
+        Routes of controllers bound to the request host are tried before the host-agnostic
+        ones, and the values captured by a host pattern are set on the request.
+
+        :return: A tuple (handler, params)
+        :raises ValueError: If no route matches
+        """
+        resolved = self.match(method, path, request, version)
+        if not resolved:
+            raise ValueError(f"No route found for {method} {path} (version={version})")
+        return resolved
+
+    def match(self, method: str, path: str, request: HttpRequest = None, version=None):
         """
+        Same as `resolve`, but returns a RouteMiss instead of raising when no route matches,
+        so that unknown paths cost no exception.
+
+        :return: A tuple (handler, params), or a (falsy) RouteMiss listing the methods the
+            path is allowed for
+        """
+        # The cache is read before the table: `replace_table` swaps the table first, so an
+        # entry resolved against a previous table can only land in a discarded cache.
+        cache = self.cache
+        table = self._table
+        if table is None:
+            table = self.compile()
+            cache = self.cache
+
+        host = None
+        if table.hosts is not None and request is not None:
+            host = normalize_host(request.get_header("host", ""))
+
+        cache_key = None
+        if cache is not None:
+            cache_key = self._cache_key(method, path, request, version, host)
+            if cache_key is not None:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    handler, params, host_params = cached
+                    if host_params:
+                        request.set_host_params(host_params)
+                    return handler, params
 
         if request:
             version, path = self.extract_version(request)
@@ -73,52 +196,248 @@ class Router:
         if version is None and version != VERSION_NEUTRAL:
             versions_to_try.append(VERSION_NEUTRAL)
 
-        for v in versions_to_try:
-            # SSE static
-            if path in self.sse_routes[method].get(v, {}):
-                return self.sse_routes[method][v][path], {}
+        tables = (table,)
+        host_params = None
+        if host:
+            host_match = table.hosts.match(host)
+            if host_match is not None:
+                host_table, host_params = host_match
+                tables = (host_table, table)
+
+        for candidate_table in tables:
+            for v in versions_to_try:
+                resolved = candidate_table.lookup(method, v, path)
+                if resolved is not None:
+                    if candidate_table is table:
+                        host_params = None
+                    if host_params:
+                        request.set_host_params(host_params)
+                    if cache_key is not None:
+                        cache.put(cache_key, *resolved, host_params)
+                    return resolved
+
+        allowed = set()
+        for candidate_table in tables:
+            allowed |= candidate_table.allowed_methods(versions_to_try, path, exclude=method)
+        return RouteMiss(frozenset(allowed)) if allowed else NOT_FOUND
+
+    def compile(self) -> RouteTable:
+        """
+        Builds the lookup structures for every registered route in a single pass.
 
-            # Normal static
-            if path in self.static_routes[method].get(v, {}):
-                return self.static_routes[method][v][path], {}
+        Routes may still be registered afterwards (unless the router is frozen): the table is
+        then discarded and rebuilt once, on the next call to `resolve`.
 
-            # Normal dynamic
-            for _specificity, _original_path, path_regex, handler in self.dynamic_routes[method].get(v, []):
-                match = path_regex.match(path)
-                if match:
-                    return handler, match.groupdict()
+        :return: The compiled RouteTable
+        """
+        table = RouteTable.build(self.static_routes, self.sse_routes, self.dynamic_routes, self.host_routes)
+        self.replace_table(table)
+        return table
 
-        raise ValueError(f"No route found for {method} {path} (version={version})")
+    def replace_table(self, table: RouteTable) -> Optional[RouteTable]:
+        """
+        Swaps in a new route table.
+
+        Tables are immutable, so the swap is a single attribute assignment: requests being
+        resolved keep using the table they started with and `resolve` needs no lock. The
+        resolve cache is replaced by an empty one right after the table.
+
+        :param table: The new RouteTable
+        :return: The previous RouteTable, or None if none was compiled
+        """
+        previous = self._table
+        self._table = table
+        self._reset_cache()
+        return previous
+
+    @contextmanager
+    def update(self):
+        """
+        Changes the routes of a serving router.
+
+        Routes added or removed inside the block are only applied to the registries; the
+        current table keeps serving requests until the block exits, at which point a new
+        table is built and swapped in once with `replace_table`. Concurrent updates are
+        serialized.
+
+        Example:
+            with router.update():
+                router.remove_route("GET", "/users/:id")
+                router.add_route("GET", "/users/:id", get_user_v2)
+        """
+        with self._lock:
+            if self._frozen:
+                raise RuntimeError("Cannot update the routes of a frozen router.")
+            nested = self._updating
+            self._updating = True
+            try:
+                yield self
+            finally:
+                self._updating = nested
+            if not nested:
+                self.compile()
+
+    def remove_route(self, method, path, version=None, host=None) -> int:
+        """
+        Removes the routes registered for a method and path.
+
+        :param method: The HTTP method
+        :param path: The URL path, as registered (e.g., '/users/:id')
+        :param version: The version(s) of the route, None for every version
+        :param host: The host the route is bound to, None for host-agnostic routes
+        :return: The number of routes removed
+        """
+        path = self.normalize_path(path)
+        versions = version if version is None or isinstance(version, list) else [version]
+        return self._remove(
+            lambda route: route.method == method and route.path == path and (versions is None or route.version in versions), host
+        )
+
+    def remove_routes(self, predicate: Callable[[Route], bool]) -> int:
+        """
+        Removes every route, whatever its host, matching a predicate.
+
+        :param predicate: Called with each Route, returns True for the routes to remove
+        :return: The number of routes removed
+        """
+        return self._remove(predicate, all_hosts=True)
+
+    def clear_routes(self):
+        """
+        Removes every route.
+        """
+        self._ensure_mutable()
+        self._reset_registries()
+
+    def _remove(self, predicate: Callable[[Route], bool], host=None, all_hosts=False) -> int:
+        """
+        Removes the routes matching a predicate from the registries of a host (or all hosts).
+        """
+        self._ensure_mutable()
+        if all_hosts:
+            hosts = [None, *self.host_routes]
+        else:
+            hosts = [normalize_host(host) if host else None]
+
+        removed = 0
+        for h in hosts:
+            if h is not None and h not in self.host_routes:
+                continue
+            static_routes, sse_routes, dynamic_routes = self._registries(h)
+            for registry, is_sse in ((static_routes, False), (sse_routes, True)):
+                for method, versions in registry.items():
+                    for v, routes in versions.items():
+                        for path in [p for p, handler in routes.items() if predicate(Route(method, p, handler, v, h, is_sse))]:
+                            del routes[path]
+                            removed += 1
+            for method, versions in dynamic_routes.items():
+                for v, routes in versions.items():
+                    kept = [route for route in routes if not predicate(Route(method, route[1], route[3], v, h, False))]
+                    removed += len(routes) - len(kept)
+                    routes[:] = kept
+        return removed
+
+    def get_routes(self) -> List[Route]:
+        """
+        Lists the registered routes.
+
+        :return: A list of Route(method, path, handler, version, host, is_sse)
+        """
+        routes = []
+        for h in [None, *self.host_routes]:
+            static_routes, sse_routes, dynamic_routes = self._registries(h)
+            for registry, is_sse in ((static_routes, False), (sse_routes, True)):
+                for method, versions in registry.items():
+                    for v, paths in versions.items():
+                        routes.extend(Route(method, path, handler, v, h, is_sse) for path, handler in paths.items())
+            for method, versions in dynamic_routes.items():
+                for v, entries in versions.items():
+                    routes.extend(Route(method, path, handler, v, h, False) for _specificity, path, _regex, handler in entries)
+        return routes
+
+    def freeze(self) -> RouteTable:
+        """
+        Compiles the route table and rejects any further route registration.
+
+        :return: The compiled RouteTable
+        """
+        table = self.compile()
+        self._frozen = True
+        return table
+
+    def is_frozen(self) -> bool:
+        """
+        Check if the router rejects new routes.
+        """
+        return self._frozen
+
+    def _ensure_mutable(self):
+        """
+        Invalidates the compiled table before a registration, or raises if the router is frozen.
+        Inside `update` the table is kept serving until the update is complete.
+        """
+        if self._frozen:
+            raise RuntimeError("Cannot register routes on a frozen router.")
+        if self._updating:
+            return
+        self._table = None
+        self._reset_cache()
+
+    def _reset_cache(self):
+        """
+        Replaces the resolve cache by an empty one, keeping its counters. The cache is
+        replaced rather than emptied so that a lookup still holding the previous one cannot
+        store a resolution made against the previous routes.
+        """
+        cache = self.cache
+        if cache is not None:
+            fresh = ResolveCache(cache.max_size)
+            fresh.hits, fresh.misses = cache.hits, cache.misses
+            self.cache = fresh
+
+    def _cache_key(self, method: str, path: str, request: HttpRequest = None, version=None, host=None):
+        """
+        Builds the resolve cache key of a request: the method, the raw path, the host when
+        some controllers are bound to one, and whatever the versioning strategy reads besides
+        the path.
+
+        :return: The cache key, or None when the resolution cannot be cached
+        """
+        if request is None:
+            return method, path, version
+
+        if not self.app_config:
+            return method, request.path, None, host
+        strategy = self.app_config.get_versioning_strategy()
+        if not strategy.cacheable:
+            return None
+        return method, request.path, strategy.cache_token(request), host
 
     def _specificity(self, path):
         """
-        Calculates the specificity of a path based on static segments.
+        Calculates the specificity of a path based on static segments, then on how
+        selective its typed parameters are (e.g. ':id<int>' ranks above ':id').
 
         :param path: The URL path
         :return: Specificity score (higher is more specific)
         """
-        return len([segment for segment in path.split("/") if not segment.startswith(":")])
+        static_segments = len([segment for segment in path.split("/") if not segment.startswith(":")])
+        selectivity = sum(get_converter(type_name).weight for _name, type_name in PARAM_PATTERN.findall(path) if type_name)
+        return static_segments, selectivity
 
     def _path_to_regex(self, path):
         """
-        Converts a path with parameters (e.g., '/users/:id') into a regular expression.
+        Converts a path with parameters (e.g., '/users/:id' or '/users/:id<int>') into a regular expression.
 
         :param path: The URL path
         :return: A regex pattern that matches the path
         """
-        pattern = re.sub(r":(\w+)", r"(?P<\1>[^/]+)", path) + r"/?$"
-        return re.compile(pattern)
 
-    def _extract_params(self, path_regex, path):
-        """
-        Extracts parameters from the URL path based on the regex pattern.
+        def replace(match):
+            return f"(?P<{match.group(1)}>{get_converter(match.group(2)).regex})"
 
-        :param path_regex: The regex pattern of the path
-        :param path: The URL path from the incoming request
-        :return: A dictionary of extracted parameters
-        """
-        match = re.match(path_regex, path)
-        return match.groupdict() if match else {}
+        pattern = PARAM_PATTERN.sub(replace, path) + r"/?$"
+        return re.compile(pattern)
 
     @staticmethod
     def normalize_path(path: str) -> str:
@@ -140,7 +459,8 @@ class Router:
             str: The normalized path.
         """
         # Collapse multiple slashes into one
-        path = re.sub(r"\/+", "/", path)
+        if "//" in path:
+            path = re.sub(r"\/+", "/", path)
         # Remove trailing slash unless it's root
         if path != "/" and path.endswith("/"):
             path = path[:-1]
@@ -153,51 +473,10 @@ class Router:
         Extracts the API version from the request according to the configured versioning strategy.
         Returns a tuple: (version, normalized_path)
         """
-        versioning = self.app_config.get_versioning()
-        if not self.app_config or not versioning:
-            return None, self.normalize_path(request.path)
-
         path = self.normalize_path(request.path)
-        version = None
-
-        if versioning.type == VersioningType.URI:
-            # Versioning: /api/v1/resource -> should become /api/resource
-            prefix = versioning.prefix if versioning.prefix is not False else "v"
-            global_prefix = self.app_config.get_global_prefix()
-
-            if global_prefix:
-                # Match /api/v1 or /api/v123
-                pattern = rf"^/({global_prefix})/({prefix})(\d+)(/|$)"
-                match = re.match(pattern, path)
-                if match:
-                    version = match.group(3)
-                    # Reconstruct path: /api/resource
-                    remaining_path = path[match.end() - 1 :] or "/"
-                    new_path = f"/{global_prefix}{remaining_path}"
-                    return version, self.normalize_path(new_path)
-            else:
-                # Match /v1 or /v123
-                pattern = rf"^/({prefix})(\d+)(/|$)"
-                match = re.match(pattern, path)
-                if match:
-                    version = match.group(2)
-                    new_path = path[match.end() - 1 :] or "/"
-                    return version, self.normalize_path(new_path)
-
+        if not self.app_config:
             return None, path
-
-        elif versioning.type == VersioningType.HEADER:
-            return request.get_header(versioning.header), path
-
-        elif versioning.type == VersioningType.MEDIA_TYPE:
-            accept = request.get_header("accept", "")
-            match = re.search(rf"{versioning.key}([\w\d]+)", accept)
-            return (match.group(1) if match else None), path
-
-        elif versioning.type == VersioningType.CUSTOM and callable(versioning.extractor):
-            return versioning.extractor(request), path
-
-        return None, path
+        return self.app_config.get_versioning_strategy().extract(request, path)
 
     def get_prefix(self) -> Optional[str]:
         """
@@ -39,6 +39,38 @@ class AppSettings(BaseSettings):
     # System information
     sys_info_enabled: bool = Field(default=False)
 
+    # Routing settings
+    route_cache_enabled: bool = Field(default=False)
+    route_cache_max_size: int = Field(default=1024)  # resolved routes kept in the LRU cache
+
+    # Request body settings
+    max_body_size: int = Field(default=0)  # in bytes, 0 for no limit (see @BodyLimit for per-route limits)
+    body_spool_threshold: int = Field(default=1024 * 1024)  # larger bodies are spooled to a temporary file
+
+    # Serialization settings
+    json_codec: str = Field(default="stdlib")  # "stdlib", "orjson", "msgspec" or "auto" for the fastest installed
+
+    # ETag settings
+    etag_mode: str = Field(default="always")  # "always", "conditional" (only for If-None-Match / If-Match requests) or "never"
+    etag_algorithm: str = Field(default="auto")  # any hashlib algorithm, "xxh3"/"xxh64" with xxhash, or "auto" for the fastest
+    etag_max_body_size: int = Field(default=1024 * 1024)  # in bytes, larger bodies get no ETag, 0 for no limit
+
+    # Streaming settings
+    stream_chunk_size: int = Field(default=16 * 1024)  # in bytes, smaller chunks of a streaming response are coalesced
+
+    # Content negotiation settings
+    content_negotiation_enabled: bool = Field(default=False)  # choose the format of dict/list responses from Accept
+    # By preference, yaml and msgpack need pyyaml/msgpack
+    response_serializers: List[str] = Field(default_factory=lambda: ["json", "xml", "yaml", "msgpack"])
+
+    # Compression settings
+    compression_enabled: bool = Field(default=False)
+    compression_min_size: int = Field(default=1024)  # in bytes, smaller bodies are sent as is
+    compression_content_types: List[str] = ["application/json", "text/", "application/javascript", "application/xml", "image/svg+xml"]
+    compression_encodings: List[str] = ["br", "zstd", "gzip", "deflate"]  # by preference, br and zstd need brotli/zstandard
+    compression_level: int = Field(default=6)  # gzip and deflate level
+    compression_executor_threshold: int = Field(default=64 * 1024)  # larger bodies are compressed off the event loop
+
     # Banner settings
     banner_enabled: bool = Field(default=False)
     banner_file: str = Field(default="banner.txt")
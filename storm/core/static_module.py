@@ -0,0 +1,20 @@
+from storm.core.adapters.static_files import StaticFiles
+from storm.core.module import ModuleBase
+
+
+class StaticModule(ModuleBase):
+    """
+    A module serving the files of a directory under a path prefix, e.g.
+    `@Module(imports=[StaticModule("/static", "public")])`.
+
+    The files are served by a StaticFiles application mounted on the prefix, outside of the
+    controller, middleware and interceptor pipelines.
+
+    :param prefix: The path prefix (e.g. '/static')
+    :param directory: The directory to serve
+    :param options: The StaticFiles options (cache_max_size, cache_max_file_size, html, cache_control)
+    """
+
+    def __init__(self, prefix: str, directory: str, **options):
+        super().__init__(mounts=[(prefix, StaticFiles(directory, **options))])
+        self.__name__ = f"StaticModule({prefix})"
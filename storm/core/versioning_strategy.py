@@ -0,0 +1,152 @@
+import re
+from typing import Any, Callable, Optional, Tuple
+
+from storm.common.enums.versioning_type import VersioningType
+from storm.core.interfaces.version_options_interface import VersioningOptions
+
+DIGITS = "0123456789"
+
+
+class VersioningStrategy:
+    """
+    Base class for the version extraction strategies.
+
+    A strategy is built once from the versioning options and the global prefix, and then
+    extracts the version of every request without building any regex or string pattern.
+
+    Attributes:
+        type (Optional[VersioningType]): The versioning type handled by the strategy.
+        cacheable (bool): Whether the version only depends on the path and `cache_token`.
+    """
+
+    type: Optional[VersioningType] = None
+    cacheable: bool = True
+
+    def extract(self, request, path: str) -> Tuple[Optional[str], str]:
+        """
+        Extracts the version of a request.
+
+        :param request: The HttpRequest
+        :param path: The normalized request path
+        :return: A tuple (version, path without the version)
+        """
+        return None, path
+
+    def cache_token(self, request) -> Any:
+        """
+        Returns what the strategy reads from the request besides the path, to be used in cache keys.
+
+        :param request: The HttpRequest
+        """
+        return None
+
+
+class NoVersioningStrategy(VersioningStrategy):
+    """
+    Used when versioning is not enabled: every request is version neutral.
+    """
+
+
+class UriVersioningStrategy(VersioningStrategy):
+    """
+    Reads the version from the path, e.g. /api/v1/users -> ('1', '/api/users').
+    """
+
+    type = VersioningType.URI
+
+    def __init__(self, prefix: str, global_prefix: Optional[str] = None):
+        self.global_prefix = f"/{global_prefix}" if global_prefix else ""
+        self.lead = f"{self.global_prefix}/{prefix}"
+        self.lead_length = len(self.lead)
+
+    def extract(self, request, path: str) -> Tuple[Optional[str], str]:
+        if not path.startswith(self.lead):
+            return None, path
+
+        rest = path[self.lead_length :]
+        remaining = rest.lstrip(DIGITS)
+        if len(remaining) == len(rest) or (remaining and remaining[0] != "/"):
+            return None, path
+
+        version = rest[: len(rest) - len(remaining)]
+        if self.global_prefix:
+            return version, self.global_prefix + remaining
+        return version, remaining or "/"
+
+
+class HeaderVersioningStrategy(VersioningStrategy):
+    """
+    Reads the version from a custom request header.
+    """
+
+    type = VersioningType.HEADER
+
+    def __init__(self, header: str):
+        self.header = header.lower()
+
+    def extract(self, request, path: str) -> Tuple[Optional[str], str]:
+        return request.get_header(self.header), path
+
+    def cache_token(self, request) -> Any:
+        return request.get_header(self.header)
+
+
+class MediaTypeVersioningStrategy(VersioningStrategy):
+    """
+    Reads the version from the Accept header, e.g. 'application/json;v=2' with key 'v='.
+    """
+
+    type = VersioningType.MEDIA_TYPE
+
+    def __init__(self, key: str):
+        self.key = key
+        self.pattern = re.compile(rf"{re.escape(key)}(\w+)")
+
+    def extract(self, request, path: str) -> Tuple[Optional[str], str]:
+        accept = request.get_header("accept", "")
+        if self.key not in accept:
+            return None, path
+        match = self.pattern.search(accept)
+        return (match.group(1) if match else None), path
+
+    def cache_token(self, request) -> Any:
+        return request.get_header("accept")
+
+
+class CustomVersioningStrategy(VersioningStrategy):
+    """
+    Delegates the extraction to a user supplied callable.
+    """
+
+    type = VersioningType.CUSTOM
+    # The extractor may read anything from the request
+    cacheable = False
+
+    def __init__(self, extractor: Callable[[Any], Any]):
+        self.extractor = extractor
+
+    def extract(self, request, path: str) -> Tuple[Optional[str], str]:
+        return self.extractor(request), path
+
+
+def create_versioning_strategy(versioning: Optional[VersioningOptions], global_prefix: Optional[str] = None) -> VersioningStrategy:
+    """
+    Builds the strategy matching the versioning options.
+
+    :param versioning: The versioning options, or None when versioning is disabled
+    :param global_prefix: The global prefix of the application, without slashes
+    :return: The VersioningStrategy to use for every request
+    """
+    if not versioning:
+        return NoVersioningStrategy()
+
+    if versioning.type == VersioningType.URI:
+        prefix = versioning.prefix if versioning.prefix is not False else "v"
+        return UriVersioningStrategy(prefix, global_prefix)
+    if versioning.type == VersioningType.HEADER:
+        return HeaderVersioningStrategy(versioning.header)
+    if versioning.type == VersioningType.MEDIA_TYPE:
+        return MediaTypeVersioningStrategy(versioning.key)
+    if versioning.type == VersioningType.CUSTOM and callable(versioning.extractor):
+        return CustomVersioningStrategy(versioning.extractor)
+    return NoVersioningStrategy()
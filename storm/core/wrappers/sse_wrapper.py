@@ -31,4 +31,6 @@ def _wrap_sse_handler(handler):
         finally:
             await response.close_sse(request.send)
 
+    # Keeps the original handler reachable, e.g. to find the controller of the route
+    sse_adapter.__wrapped__ = handler
     return sse_adapter
@@ -0,0 +1,65 @@
+import pytest
+
+from storm.common.serializer.json_codec import (
+    JSON_CODECS,
+    StdlibJsonCodec,
+    create_json_codec,
+    get_json_codec,
+    set_json_codec,
+)
+from storm.core.adapters.http_request import HttpRequest
+from storm.core.adapters.http_response import HttpResponse
+
+PAYLOAD = {"b": [1, 2.5, None, True], "a": "héllo"}
+
+
+def available_codecs():
+    codecs = []
+    for name in JSON_CODECS:
+        try:
+            codecs.append(create_json_codec(name))
+        except ImportError:
+            pass
+    return codecs
+
+
+@pytest.fixture
+def restore_codec():
+    codec = get_json_codec()
+    yield
+    set_json_codec(codec)
+
+
+@pytest.mark.parametrize("codec", available_codecs(), ids=lambda codec: codec.name)
+def test_codecs_round_trip(codec):
+    encoded = codec.dumps(PAYLOAD)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded.decode("utf-8")) == PAYLOAD
+
+
+@pytest.mark.parametrize("codec", available_codecs(), ids=lambda codec: codec.name)
+def test_codecs_raise_value_error_on_invalid_json(codec):
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_create_json_codec():
+    assert isinstance(create_json_codec("stdlib"), StdlibJsonCodec)
+    assert create_json_codec("auto").name in JSON_CODECS
+    with pytest.raises(ValueError):
+        create_json_codec("pickle")
+
+
+@pytest.mark.parametrize("codec", available_codecs(), ids=lambda codec: codec.name)
+def test_request_and_response_use_the_configured_codec(codec, restore_codec):
+    set_json_codec(codec)
+
+    response = HttpResponse()
+    response.update_content(PAYLOAD)
+    assert response._encode_content() == codec.dumps(PAYLOAD)
+    assert response.headers["Content-Length"] == str(len(codec.dumps(PAYLOAD)))
+
+    request = HttpRequest({"type": "http", "headers": [(b"content-type", b"application/json")]}, None, None)
+    assert request._decode_body(codec.dumps(PAYLOAD)) == PAYLOAD
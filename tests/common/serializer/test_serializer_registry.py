@@ -0,0 +1,115 @@
+from types import SimpleNamespace
+
+import pytest
+
+from storm.common.serializer.serializer_registry import (
+    JsonResponseSerializer,
+    MsgpackResponseSerializer,
+    ResponseSerializer,
+    SerializerRegistry,
+    XmlResponseSerializer,
+    negotiate_media_type,
+)
+from storm.core.adapters.http_response import HttpResponse
+from storm.core.settings import AppSettings
+
+AVAILABLE = ("application/json", "application/xml", "application/msgpack")
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        ("", "application/json"),
+        ("application/xml", "application/xml"),
+        ("application/xml;q=0.5, application/msgpack", "application/msgpack"),
+        ("application/xml, application/msgpack", "application/xml"),
+        ("text/html, */*;q=0.8", "application/json"),
+        ("application/*;q=0.2, application/xml", "application/xml"),
+        ("*/*, application/json;q=0", "application/xml"),
+        ("APPLICATION/XML", "application/xml"),
+        ("image/png", None),
+    ],
+)
+def test_negotiate_media_type(accept, expected):
+    assert negotiate_media_type(accept, AVAILABLE) == expected
+
+
+def test_negotiation_is_cached_per_accept_header():
+    negotiate_media_type.cache_clear()
+
+    negotiate_media_type("application/xml", AVAILABLE)
+    negotiate_media_type("application/xml", AVAILABLE)
+
+    assert negotiate_media_type.cache_info().hits == 1
+
+
+def test_registry_falls_back_to_the_default_serializer():
+    registry = SerializerRegistry([JsonResponseSerializer(), XmlResponseSerializer()])
+
+    assert isinstance(registry.select(None), JsonResponseSerializer)
+    assert isinstance(registry.select("image/png"), JsonResponseSerializer)
+    assert isinstance(registry.select("text/xml"), XmlResponseSerializer)
+
+
+def test_registered_serializer_replaces_a_media_type():
+    class CsvSerializer(ResponseSerializer):
+        media_types = ("text/csv",)
+        content_type = "text/csv"
+
+        def serialize(self, data):
+            return "\n".join(",".join(map(str, row)) for row in data).encode("utf-8")
+
+    registry = SerializerRegistry([JsonResponseSerializer()])
+    csv = CsvSerializer()
+    registry.register(csv)
+    registry.register(csv, media_types=["application/json"])
+
+    assert registry.media_types == ("application/json", "text/csv")
+    assert registry.get("APPLICATION/JSON") is csv
+
+
+def test_from_settings_skips_missing_packages_and_rejects_unknown_names(monkeypatch):
+    monkeypatch.setattr(MsgpackResponseSerializer, "requires", "storm_missing_package")
+
+    registry = SerializerRegistry.from_settings(SimpleNamespace(response_serializers=["json", "msgpack"]))
+    assert registry.media_types == ("application/json",)
+
+    with pytest.raises(ValueError):
+        SerializerRegistry.from_settings(SimpleNamespace(response_serializers=["toml"]))
+
+
+def test_negotiation_is_opt_in():
+    settings = AppSettings()
+
+    assert settings.content_negotiation_enabled is False
+    assert SerializerRegistry.from_settings(settings).media_types[0] == "application/json"
+
+
+def test_response_is_encoded_with_the_negotiated_serializer():
+    response = HttpResponse(content=None)
+    response.serializer = XmlResponseSerializer()
+
+    response.update_content({"name": "storm"})
+
+    assert response.body == b"<root><name>storm</name></root>"
+    assert response.headers["Content-Type"] == "application/xml"
+    assert response.headers["Content-Length"] == str(len(response.body))
+    assert response.headers["Vary"] == "Accept"
+
+
+def test_text_responses_ignore_the_serializer():
+    response = HttpResponse(content=None)
+    response.serializer = XmlResponseSerializer()
+
+    response.update_content("hello")
+
+    assert response.body == b"hello"
+    assert "Vary" not in response.headers
+
+
+def test_msgpack_serializer_round_trip():
+    msgpack = pytest.importorskip("msgpack")
+
+    body = MsgpackResponseSerializer().serialize({"ids": [1, 2]})
+
+    assert msgpack.unpackb(body) == {"ids": [1, 2]}
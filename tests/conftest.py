@@ -0,0 +1,5 @@
+from storm.core.context import AppContext
+from storm.core.settings import get_settings
+
+# Loggers created by the core components read their configuration from the app context
+AppContext.set_settings(get_settings())
@@ -0,0 +1,97 @@
+import pytest
+
+from storm.common.decorators.controller import Controller
+from storm.core.adapters.http_request import HttpRequest
+from storm.core.resolvers.route_resolver import RouteResolver
+from storm.core.router import Router
+from storm.core.router.route_table import normalize_host
+
+
+async def shared_home():
+    pass
+
+
+async def api_home():
+    pass
+
+
+async def tenant_home():
+    pass
+
+
+def make_request(path, host):
+    scope = {"type": "http", "method": "GET", "path": path, "headers": [(b"host", host.encode())]}
+    return HttpRequest(scope, None, None)
+
+
+@pytest.mark.parametrize(
+    ("host", "expected"),
+    [
+        ("Example.COM", "example.com"),
+        ("example.com:8000", "example.com"),
+        ("example.com.", "example.com"),
+        ("[::1]", "[::1]"),
+        ("[::1]:8000", "[::1]"),
+    ],
+)
+def test_normalize_host(host, expected):
+    assert normalize_host(host) == expected
+
+
+def test_exact_host_routes_take_precedence():
+    router = Router()
+    router.add_route("GET", "/", shared_home)
+    router.add_route("GET", "/", api_home, host="api.example.com")
+
+    assert router.resolve("GET", "/", make_request("/", "API.example.com:443")) == (api_home, {})
+    assert router.resolve("GET", "/", make_request("/", "www.example.com")) == (shared_home, {})
+
+
+def test_host_params_are_set_on_the_request():
+    router = Router()
+    router.add_route("GET", "/users/:id", tenant_home, host=":tenant.example.com")
+
+    request = make_request("/users/5", "acme.example.com")
+    assert router.resolve("GET", "/users/5", request) == (tenant_home, {"id": "5"})
+    assert request.get_host_params() == {"tenant": "acme"}
+    assert request.get_host_params("tenant") == "acme"
+
+
+def test_host_routes_fall_back_to_shared_routes():
+    router = Router()
+    router.add_route("GET", "/health", shared_home)
+    router.add_route("GET", "/", tenant_home, host=":tenant.example.com")
+
+    request = make_request("/health", "acme.example.com")
+    assert router.resolve("GET", "/health", request) == (shared_home, {})
+    assert request.get_host_params() == {}
+
+
+def test_unbound_host_does_not_reach_host_routes():
+    router = Router()
+    router.add_route("GET", "/", tenant_home, host=":tenant.example.com")
+
+    with pytest.raises(ValueError):
+        router.resolve("GET", "/", make_request("/", "example.org"))
+
+
+def test_cached_resolution_is_keyed_by_host():
+    router = Router(cache_size=8)
+    router.add_route("GET", "/", tenant_home, host=":tenant.example.com")
+
+    router.resolve("GET", "/", make_request("/", "acme.example.com"))
+    request = make_request("/", "globex.example.com")
+    router.resolve("GET", "/", request)
+    cached = make_request("/", "globex.example.com")
+    router.resolve("GET", "/", cached)
+
+    assert request.get_host_params() == cached.get_host_params() == {"tenant": "globex"}
+    assert router.cache.stats()["hits"] == 1
+
+
+def test_route_resolver_reads_controller_host():
+    @Controller("/", host=":tenant.example.com")
+    class TenantController:
+        pass
+
+    assert RouteResolver.get_host(TenantController()) == ":tenant.example.com"
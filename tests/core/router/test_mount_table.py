@@ -0,0 +1,81 @@
+import pytest
+
+from storm.common.decorators.module import Module
+from storm.core.router.mount_table import MountTable
+
+
+async def metrics_app(scope, receive, send):
+    pass
+
+
+async def admin_app(scope, receive, send):
+    pass
+
+
+async def admin_static_app(scope, receive, send):
+    pass
+
+
+def make_table():
+    table = MountTable()
+    table.add("/metrics", metrics_app)
+    table.add("/admin", admin_app)
+    table.add("/admin/static", admin_static_app)
+    return table
+
+
+def test_match_mounted_prefix():
+    table = make_table()
+
+    assert table.match("/metrics") == ("/metrics", metrics_app)
+    assert table.match("/metrics/cpu") == ("/metrics", metrics_app)
+
+
+def test_longest_prefix_wins():
+    table = make_table()
+
+    assert table.match("/admin/static/app.js") == ("/admin/static", admin_static_app)
+    assert table.match("/admin/users") == ("/admin", admin_app)
+
+
+def test_prefix_only_matches_whole_segments():
+    table = make_table()
+
+    assert table.match("/metricsx") is None
+    assert table.match("/users") is None
+    assert table.match("/") is None
+
+
+def test_root_and_duplicate_mounts_are_rejected():
+    table = make_table()
+
+    with pytest.raises(ValueError):
+        table.add("/", metrics_app)
+    with pytest.raises(ValueError):
+        table.add("/metrics", admin_app)
+
+
+def test_child_scope_moves_prefix_to_root_path():
+    scope = {"type": "http", "path": "/admin/users", "raw_path": b"/admin/users", "root_path": "/api"}
+
+    child = MountTable.child_scope(scope, "/admin")
+
+    assert child["path"] == "/users"
+    assert child["raw_path"] == b"/users"
+    assert child["root_path"] == "/api/admin"
+    assert scope["path"] == "/admin/users"
+
+
+def test_child_scope_of_the_prefix_itself_is_the_root():
+    child = MountTable.child_scope({"type": "http", "path": "/metrics"}, "/metrics")
+
+    assert child["path"] == "/"
+    assert child["root_path"] == "/metrics"
+
+
+def test_module_decorator_declares_mounts():
+    @Module(mounts=[("/metrics", metrics_app)])
+    class MetricsModule:
+        pass
+
+    assert MetricsModule.mounts == [("/metrics", metrics_app)]
@@ -0,0 +1,74 @@
+import re
+
+from storm.core.router.radix_tree import RadixTree
+
+
+def handler_a():
+    pass
+
+
+def handler_b():
+    pass
+
+
+def test_lookup_returns_handler_and_params():
+    tree = RadixTree()
+    tree.insert("/users/:id/posts/:post_id", handler_a, 3)
+
+    assert tree.lookup("/users/42/posts/7") == (handler_a, {"id": "42", "post_id": "7"})
+
+
+def test_lookup_miss_returns_none():
+    tree = RadixTree()
+    tree.insert("/users/:id", handler_a, 2)
+
+    assert tree.lookup("/users") is None
+    assert tree.lookup("/users/42/posts") is None
+    assert tree.lookup("/accounts/42") is None
+
+
+def test_trailing_slash_is_accepted():
+    tree = RadixTree()
+    tree.insert("/users/:id", handler_a, 2)
+
+    assert tree.lookup("/users/42/") == (handler_a, {"id": "42"})
+
+
+def test_empty_segment_never_matches_a_param():
+    tree = RadixTree()
+    tree.insert("/users/:id/posts", handler_a, 3)
+
+    assert tree.lookup("/users//posts") is None
+
+
+def test_more_specific_route_wins():
+    tree = RadixTree()
+    tree.insert("/:resource/:id", handler_a, 1)
+    tree.insert("/users/:id", handler_b, 2)
+
+    assert tree.lookup("/users/1") == (handler_b, {"id": "1"})
+    assert tree.lookup("/orders/1") == (handler_a, {"resource": "orders", "id": "1"})
+
+
+def test_backtracks_from_static_branch_to_param_branch():
+    tree = RadixTree()
+    tree.insert("/users/me/settings", handler_a, 4)
+    tree.insert("/users/:id/profile", handler_b, 3)
+
+    assert tree.lookup("/users/me/profile") == (handler_b, {"id": "me"})
+
+
+def test_ties_follow_reverse_path_order():
+    tree = RadixTree()
+    tree.insert("/items/:a", handler_a, 2)
+    tree.insert("/items/:b", handler_b, 2)
+
+    assert tree.lookup("/items/1") == (handler_b, {"b": "1"})
+
+
+def test_segments_with_embedded_params_use_regex_fallback():
+    tree = RadixTree()
+    tree.insert("/files/:name.json", handler_a, 2, re.compile(r"/files/(?P<name>[^/]+).json/?$"))
+
+    assert tree.lookup("/files/report.json") == (handler_a, {"name": "report"})
+    assert tree.lookup("/files/report") is None
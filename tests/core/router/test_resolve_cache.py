@@ -0,0 +1,68 @@
+from storm.core.router import Router
+from storm.core.router.resolve_cache import ResolveCache
+
+
+async def get_user():
+    pass
+
+
+async def get_order():
+    pass
+
+
+def test_cache_counts_hits_and_misses():
+    cache = ResolveCache(max_size=2)
+
+    assert cache.get(("GET", "/users/1", None)) is None
+    cache.put(("GET", "/users/1", None), get_user, {"id": "1"})
+    assert cache.get(("GET", "/users/1", None)) == (get_user, {"id": "1"}, None)
+
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "max_size": 2, "hit_rate": 0.5}
+
+
+def test_cache_returns_copies_of_params():
+    cache = ResolveCache()
+    cache.put("key", get_user, {"id": "1"})
+
+    _, params, _ = cache.get("key")
+    params["id"] = "changed"
+
+    assert cache.get("key") == (get_user, {"id": "1"}, None)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResolveCache(max_size=2)
+    cache.put("a", get_user, {})
+    cache.put("b", get_user, {})
+    cache.get("a")
+    cache.put("c", get_user, {})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_router_serves_repeated_paths_from_cache():
+    router = Router(cache_size=16)
+    router.add_route("GET", "/users/:id", get_user)
+
+    assert router.resolve("GET", "/users/1") == (get_user, {"id": "1"})
+    assert router.resolve("GET", "/users/1") == (get_user, {"id": "1"})
+
+    assert router.cache.hits == 1
+    assert router.cache.misses == 1
+
+
+def test_router_cache_is_invalidated_when_routes_change():
+    router = Router(cache_size=16)
+    router.add_route("GET", "/users/:id", get_user)
+    router.resolve("GET", "/users/1")
+
+    router.add_route("GET", "/users/1", get_order)
+
+    assert len(router.cache) == 0
+    assert router.resolve("GET", "/users/1") == (get_order, {})
+
+
+def test_router_cache_is_disabled_by_default():
+    assert Router().cache is None
@@ -0,0 +1,223 @@
+import pytest
+
+from storm.core.interfaces.version_options_interface import VERSION_NEUTRAL
+from storm.core.router import Router
+from storm.core.router.route_table import RouteTable
+from storm.core.router.router import NOT_FOUND, RouteMiss
+
+
+async def list_users():
+    pass
+
+
+async def get_user():
+    pass
+
+
+async def get_user_v2():
+    pass
+
+
+def test_resolve_static_route():
+    router = Router()
+    router.add_route("GET", "/users", list_users)
+
+    assert router.resolve("GET", "/users") == (list_users, {})
+
+
+def test_resolve_dynamic_route():
+    router = Router()
+    router.add_route("GET", "/users/:id", get_user)
+
+    assert router.resolve("GET", "/users/5") == (get_user, {"id": "5"})
+
+
+def test_static_route_takes_precedence_over_dynamic():
+    router = Router()
+    router.add_route("GET", "/users/:id", get_user)
+    router.add_route("GET", "/users/me", list_users)
+
+    assert router.resolve("GET", "/users/me") == (list_users, {})
+
+
+def test_resolve_by_version():
+    router = Router()
+    router.add_route("GET", "/users/:id", get_user, VERSION_NEUTRAL)
+    router.add_route("GET", "/users/:id", get_user_v2, "2")
+
+    assert router.resolve("GET", "/users/5", version="2") == (get_user_v2, {"id": "5"})
+    assert router.resolve("GET", "/users/5") == (get_user, {"id": "5"})
+
+
+def test_unknown_route_raises():
+    router = Router()
+    router.add_route("GET", "/users/:id", get_user)
+
+    with pytest.raises(ValueError):
+        router.resolve("GET", "/orders/5")
+    with pytest.raises(ValueError):
+        router.resolve("POST", "/users/5")
+
+
+def test_compile_builds_table_once():
+    router = Router()
+    router.add_route("GET", "/users/:id", get_user)
+
+    table = router.compile()
+
+    assert router.resolve("GET", "/users/5") == (get_user, {"id": "5"})
+    assert router._table is table
+
+
+def test_registration_after_compile_triggers_rebuild():
+    router = Router()
+    router.add_route("GET", "/users/:id", get_user)
+    router.compile()
+
+    router.add_route("GET", "/users/:id/friends", list_users)
+
+    assert router.resolve("GET", "/users/5/friends") == (list_users, {"id": "5"})
+
+
+def test_frozen_router_rejects_new_routes():
+    router = Router()
+    router.add_route("GET", "/users", list_users)
+    router.freeze()
+
+    assert router.is_frozen()
+    with pytest.raises(RuntimeError):
+        router.add_route("GET", "/users/:id", get_user)
+    with pytest.raises(RuntimeError):
+        router.add_sse_route("GET", "/events", list_users)
+    assert router.resolve("GET", "/users") == (list_users, {})
+
+
+def test_typed_params_are_converted():
+    router = Router()
+    router.add_route("GET", "/users/:id<int>", get_user)
+    router.add_route("GET", "/tokens/:token<uuid>", get_user_v2)
+
+    assert router.resolve("GET", "/users/42") == (get_user, {"id": 42})
+    handler, params = router.resolve("GET", "/tokens/123e4567-e89b-12d3-a456-426614174000")
+    assert handler is get_user_v2
+    assert str(params["token"]) == "123e4567-e89b-12d3-a456-426614174000"
+
+
+def test_typed_param_mismatch_falls_through():
+    router = Router()
+    router.add_route("GET", "/users/:id<int>", get_user)
+    router.add_route("GET", "/users/:slug", list_users)
+
+    assert router.resolve("GET", "/users/42") == (get_user, {"id": 42})
+    assert router.resolve("GET", "/users/john") == (list_users, {"slug": "john"})
+
+
+def test_typed_param_mismatch_without_alternative_is_a_miss():
+    router = Router()
+    router.add_route("GET", "/users/:id<int>", get_user)
+
+    with pytest.raises(ValueError):
+        router.resolve("GET", "/users/john")
+
+
+def test_path_param_captures_the_rest_of_the_path():
+    router = Router()
+    router.add_route("GET", "/docs/:file<path>", get_user)
+    router.add_route("GET", "/docs/:name/meta", list_users)
+
+    assert router.resolve("GET", "/docs/guides/intro.md") == (get_user, {"file": "guides/intro.md"})
+    assert router.resolve("GET", "/docs/intro/meta") == (list_users, {"name": "intro"})
+
+
+def test_typed_param_inside_a_segment_uses_regex_fallback():
+    router = Router()
+    router.add_route("GET", "/reports/:year<int>.json", get_user)
+
+    assert router.resolve("GET", "/reports/2024.json") == (get_user, {"year": 2024})
+
+
+def test_unknown_param_type_is_rejected():
+    router = Router()
+
+    with pytest.raises(ValueError):
+        router.add_route("GET", "/users/:id<number>", get_user)
+
+
+def test_update_keeps_serving_the_current_table_until_done():
+    router = Router()
+    router.add_route("GET", "/users/:id", get_user)
+    table = router.compile()
+
+    with router.update():
+        router.remove_route("GET", "/users/:id")
+        router.add_route("GET", "/users/:id", get_user_v2)
+        assert router.resolve("GET", "/users/5") == (get_user, {"id": "5"})
+        assert router._table is table
+
+    assert router._table is not table
+    assert router.resolve("GET", "/users/5") == (get_user_v2, {"id": "5"})
+
+
+def test_replace_table_returns_the_previous_table():
+    router = Router()
+    router.add_route("GET", "/users", list_users)
+    previous = router.compile()
+
+    table = RouteTable.build({"GET": {VERSION_NEUTRAL: {"/orders": get_user}}}, {}, {})
+
+    assert router.replace_table(table) is previous
+    assert router.resolve("GET", "/orders") == (get_user, {})
+
+
+def test_remove_route_only_removes_matching_version():
+    router = Router()
+    router.add_route("GET", "/users", list_users, version=["1", "2"])
+
+    assert router.remove_route("GET", "/users", version="1") == 1
+    assert [(route.path, route.version) for route in router.get_routes()] == [("/users", "2")]
+
+
+def test_remove_routes_by_handler():
+    router = Router()
+    router.add_route("GET", "/users", list_users)
+    router.add_route("GET", "/users/:id", get_user)
+    router.add_route("GET", "/users/:id", get_user, host="api.example.com")
+
+    with router.update():
+        assert router.remove_routes(lambda route: route.handler is get_user) == 2
+
+    assert [route.path for route in router.get_routes()] == ["/users"]
+    with pytest.raises(ValueError):
+        router.resolve("GET", "/users/5")
+
+
+def test_frozen_router_rejects_updates():
+    router = Router()
+    router.freeze()
+
+    with pytest.raises(RuntimeError):
+        with router.update():
+            pass
+
+
+def test_match_returns_a_falsy_miss_for_unknown_paths():
+    router = Router()
+    router.add_route("GET", "/users", list_users)
+
+    miss = router.match("GET", "/orders")
+
+    assert not miss
+    assert miss is NOT_FOUND
+    assert miss.allowed_methods == frozenset()
+
+
+def test_match_lists_allowed_methods_of_known_paths():
+    router = Router()
+    router.add_route("GET", "/users/:id", get_user)
+    router.add_route("DELETE", "/users/:id", get_user)
+    router.add_route("PUT", "/users", list_users)
+
+    miss = router.match("POST", "/users/5")
+
+    assert isinstance(miss, RouteMiss)
+    assert miss.allowed_methods == {"GET", "DELETE"}
@@ -0,0 +1,98 @@
+import asyncio
+import gzip
+import zlib
+
+import pytest
+
+from storm.common.decorators.compress import Compress
+from storm.common.enums.content_type import ContentType
+from storm.core.adapters.compression import Compression, negotiate_encoding
+from storm.core.adapters.http_request import HttpRequest
+from storm.core.adapters.http_response import HttpResponse
+
+BODY = {"items": [{"id": i, "name": "item"} for i in range(200)]}
+
+
+def make_request(accept_encoding=None):
+    headers = [(b"accept-encoding", accept_encoding.encode())] if accept_encoding is not None else []
+    return HttpRequest({"type": "http", "method": "GET", "path": "/", "headers": headers}, None, None)
+
+
+def make_response(content=BODY, content_type=ContentType.JSON):
+    response = HttpResponse(content_type=content_type)
+    response.update_content(content)
+    return response
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip, deflate", "gzip"),
+        ("deflate, gzip;q=0", "deflate"),
+        ("br;q=1.0, gzip;q=0.5", "gzip"),
+        ("*", "gzip"),
+        ("*, gzip;q=0", "deflate"),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding, ("gzip", "deflate")) == expected
+
+
+def test_json_body_is_gzipped():
+    response = make_response()
+
+    encoding = asyncio.run(Compression().compress(make_request("gzip, deflate"), response))
+
+    assert encoding == "gzip"
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["Content-Length"] == str(len(response.body))
+    assert gzip.decompress(response.body) == make_response().body
+
+
+def test_large_bodies_are_compressed_in_the_executor():
+    response = make_response()
+
+    asyncio.run(Compression(encodings=("deflate",), executor_threshold=1).compress(make_request("deflate"), response))
+
+    assert zlib.decompress(response.body) == make_response().body
+
+
+def test_small_and_excluded_bodies_are_not_compressed():
+    compression = Compression(min_size=1024)
+    small = make_response({"a": 1})
+    binary = make_response(b"\0" * 4096, ContentType.OCTET_STREAM)
+
+    assert asyncio.run(compression.compress(make_request("gzip"), small)) is None
+    assert asyncio.run(compression.compress(make_request("gzip"), binary)) is None
+    assert "Vary" not in small.headers
+    assert asyncio.run(compression.compress(make_request("gzip"), make_response({"a": 1}), min_size=0)) == "gzip"
+
+
+def test_vary_is_set_without_accept_encoding():
+    response = make_response()
+    response.set_header("Vary", "Origin")
+
+    assert asyncio.run(Compression().compress(make_request(), response)) is None
+    assert response.headers["Vary"] == "Origin, Accept-Encoding"
+    assert "Content-Encoding" not in response.headers
+
+
+def test_strong_etag_becomes_weak():
+    response = make_response()
+    response.set_etag_value("v1")
+
+    asyncio.run(Compression().compress(make_request("gzip"), response))
+
+    assert response.get_etag() == 'W/"v1"'
+
+
+def test_compress_decorator():
+    @Compress(min_size=0)
+    async def handler():
+        pass
+
+    assert handler._compression is True
+    assert handler._compression_min_size == 0
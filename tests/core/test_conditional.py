@@ -0,0 +1,89 @@
+import asyncio
+from datetime import datetime, timezone
+
+from storm.common.decorators.etag import ETag
+from storm.common.decorators.last_modified import LastModified
+from storm.core.adapters.http_request import HttpRequest
+from storm.core.adapters.http_response import HttpResponse
+from storm.core.application import StormApplication
+from storm.core.helpers.conditional import call_validator, etag_matches, is_not_modified, to_last_modified
+
+LAST_MODIFIED = datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc)
+
+
+def make_request(method="GET", headers=None):
+    scope = {"type": "http", "method": method, "path": "/", "headers": headers or []}
+    return HttpRequest(scope, None, None)
+
+
+def test_validators_receive_the_parameters_they_declare():
+    async def async_validator(id, request):
+        return f"{request.method}-{id}"
+
+    assert asyncio.run(call_validator(lambda id: id, make_request(), {"id": "5", "slug": "a"})) == "5"
+    assert asyncio.run(call_validator(async_validator, make_request(), {"id": "5"})) == "GET-5"
+    assert asyncio.run(call_validator(lambda **params: sorted(params), make_request(), {"id": "5"})) == ["id", "request"]
+
+
+def test_etag_matches():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+
+
+def test_if_modified_since():
+    fresh = make_request(headers=[(b"if-modified-since", b"Tue, 14 Nov 2023 22:13:20 GMT")])
+    stale = make_request(headers=[(b"if-modified-since", b"Tue, 14 Nov 2023 22:13:19 GMT")])
+    invalid = make_request(headers=[(b"if-modified-since", b"yesterday")])
+
+    assert is_not_modified(fresh, None, LAST_MODIFIED)
+    assert not is_not_modified(stale, None, LAST_MODIFIED)
+    assert not is_not_modified(invalid, None, LAST_MODIFIED)
+    assert to_last_modified(LAST_MODIFIED.timestamp() + 0.5) == LAST_MODIFIED
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    request = make_request(headers=[(b"if-none-match", b'"v1"'), (b"if-modified-since", b"Tue, 14 Nov 2023 22:13:20 GMT")])
+
+    assert not is_not_modified(request, '"v2"', LAST_MODIFIED)
+
+
+def check_validators(request, handler, params):
+    response = HttpResponse()
+    not_modified = asyncio.run(StormApplication._check_validators(None, request, response, handler, params))
+    return not_modified, response
+
+
+def test_matching_validator_answers_not_modified():
+    @ETag(lambda id: f"v{id}")
+    @LastModified(lambda: LAST_MODIFIED)
+    async def handler(id):
+        pass
+
+    not_modified, response = check_validators(make_request(headers=[(b"if-none-match", b'"v7"')]), handler, {"id": "7"})
+
+    assert not_modified
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"v7"'
+    assert response.headers["Last-Modified"] == "Tue, 14 Nov 2023 22:13:20 GMT"
+
+
+def test_validators_only_short_circuit_safe_methods():
+    @ETag(lambda: "v1", weak=True)
+    async def handler():
+        pass
+
+    not_modified, response = check_validators(make_request("PUT", [(b"if-none-match", b'"v1"')]), handler, {})
+
+    assert not not_modified
+    assert response.headers["ETag"] == 'W/"v1"'
+
+
+def test_routes_without_validators_are_untouched():
+    async def handler():
+        pass
+
+    not_modified, response = check_validators(make_request(headers=[(b"if-none-match", b"*")]), handler, {})
+
+    assert not not_modified
+    assert "ETag" not in response.headers
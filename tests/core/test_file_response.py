@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from storm.common.exceptions.http import NotFoundException
+from storm.core.adapters.http_request import HttpRequest
+from storm.core.adapters.http_response import FileResponse
+
+CONTENT = bytes(range(256)) * 40
+
+
+@pytest.fixture
+def path(tmp_path):
+    file_path = tmp_path / "report.bin"
+    file_path.write_bytes(CONTENT)
+    return file_path
+
+
+def make_request(headers=None, method="GET", extensions=None):
+    scope = {"type": "http", "method": method, "path": "/", "headers": headers or [], "extensions": extensions or {}}
+    return HttpRequest(scope, None, None)
+
+
+def send_file(response, request=None):
+    response.prepare(request or make_request())
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(response.send(send))
+    headers = {key.decode(): value.decode() for key, value in messages[0]["headers"]}
+    return messages[0]["status"], headers, b"".join(message.get("body", b"") for message in messages[1:]), messages
+
+
+def test_whole_file_is_streamed_in_chunks(path):
+    response = FileResponse(path, read_size=1000)
+    response.chunk_size = 0
+
+    status, headers, body, messages = send_file(response)
+
+    assert status == 200
+    assert body == CONTENT
+    assert headers["Content-Length"] == str(len(CONTENT))
+    assert headers["Accept-Ranges"] == "bytes"
+    assert headers["Last-Modified"].endswith("GMT")
+    assert len(messages) > 3
+
+
+def test_single_range_is_partial_content(path):
+    status, headers, body, _messages = send_file(FileResponse(path), make_request([(b"range", b"bytes=100-199")]))
+
+    assert status == 206
+    assert body == CONTENT[100:200]
+    assert headers["Content-Range"] == f"bytes 100-199/{len(CONTENT)}"
+    assert headers["Content-Length"] == "100"
+
+
+def test_suffix_range(path):
+    _status, _headers, body, _messages = send_file(FileResponse(path), make_request([(b"range", b"bytes=-10")]))
+
+    assert body == CONTENT[-10:]
+
+
+def test_unsatisfiable_range(path):
+    status, headers, body, _messages = send_file(FileResponse(path), make_request([(b"range", b"bytes=99999-")]))
+
+    assert status == 416
+    assert headers["Content-Range"] == f"bytes */{len(CONTENT)}"
+    assert body == b""
+
+
+def test_reversed_range_is_ignored(path):
+    status, headers, body, _messages = send_file(FileResponse(path), make_request([(b"range", b"bytes=500-100")]))
+
+    assert status == 200
+    assert "Content-Range" not in headers
+    assert body == CONTENT
+
+
+def test_stale_if_range_sends_the_whole_file(path):
+    request = make_request([(b"range", b"bytes=0-9"), (b"if-range", b'"stale"')])
+
+    status, _headers, body, _messages = send_file(FileResponse(path), request)
+
+    assert status == 200
+    assert body == CONTENT
+
+
+def test_matching_etag_is_not_modified(path):
+    etag = FileResponse(path).get_etag()
+
+    status, _headers, body, _messages = send_file(FileResponse(path), make_request([(b"if-none-match", etag.encode())]))
+
+    assert status == 304
+    assert body == b""
+
+
+def test_pathsend_hands_the_file_to_the_server(path):
+    request = make_request(extensions={"http.response.pathsend": {}})
+
+    _status, _headers, _body, messages = send_file(FileResponse(path, filename="report.bin"), request)
+
+    assert messages[1] == {"type": "http.response.pathsend", "path": str(path)}
+    assert messages[0]["headers"][-1] == [b"Content-Disposition", b'attachment; filename="report.bin"']
+
+
+def test_head_has_no_body(path):
+    _status, headers, body, _messages = send_file(FileResponse(path), make_request(method="HEAD"))
+
+    assert body == b""
+    assert headers["Content-Length"] == str(len(CONTENT))
+
+
+def test_missing_file_is_not_found(tmp_path):
+    with pytest.raises(NotFoundException):
+        FileResponse(tmp_path / "missing.bin")
+    with pytest.raises(NotFoundException):
+        FileResponse(tmp_path)
@@ -0,0 +1,224 @@
+import asyncio
+
+import pytest
+
+from storm.common.decorators import Controller, Module, Post
+from storm.common.decorators.body_limit import BodyLimit
+from storm.common.exceptions.http import PayloadTooLargeException
+from storm.common.execution_context import ExecutionContext
+from storm.common.interceptors.interceptor import Interceptor
+from storm.core.adapters.http_request import HttpRequest
+from storm.core.application import StormApplication
+from storm.core.settings import AppSettings
+
+
+def make_request(query_string=b"", headers=None):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": query_string,
+        "headers": headers or [],
+    }
+    return HttpRequest(scope, None, None)
+
+
+def test_headers_are_parsed_on_first_access():
+    request = make_request(headers=[(b"x-request-id", b"42")])
+
+    assert request._headers is None
+    assert request.get_header("X-Request-Id") == "42"
+    assert request.headers is request.headers
+
+
+def test_query_params_are_parsed_on_first_access():
+    request = make_request(query_string=b"page=2&tag=a&tag=b")
+
+    assert request._query_params is None
+    assert request.get_query_params("page") == "2"
+    assert request.get_query_params() == {"page": "2", "tag": ["a", "b"]}
+
+
+def test_cookies_are_parsed_on_first_access():
+    request = make_request(headers=[(b"cookie", b"session=abc; theme=dark")])
+
+    assert request._cookies is None
+    assert request.get_cookie("theme") == "dark"
+
+
+def test_setters_update_lazy_values():
+    request = make_request()
+
+    request.set_header("X-Trace", "1")
+    request.set_query_param("page", "3")
+    request.set_cookie("session", "xyz")
+
+    assert request.get_header("x-trace") == "1"
+    assert request.query_params == {"page": "3"}
+    assert request.cookies == {"session": "xyz"}
+
+
+def make_streaming_request(chunks):
+    events = [{"type": "http.request", "body": chunk, "more_body": index < len(chunks) - 1} for index, chunk in enumerate(chunks)]
+
+    async def receive():
+        return events.pop(0)
+
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": [(b"content-type", b"application/json")]}
+    return HttpRequest(scope, receive, None)
+
+
+def test_stream_yields_chunks_as_received():
+    request = make_streaming_request([b'{"a":', b"", b" 1}"])
+
+    async def collect():
+        return [chunk async for chunk in request.stream()]
+
+    assert asyncio.run(collect()) == [b'{"a":', b" 1}"]
+
+
+def test_stream_can_only_be_consumed_once():
+    request = make_streaming_request([b"data"])
+
+    async def consume_twice():
+        async for _chunk in request.stream():
+            pass
+        async for _chunk in request.stream():
+            pass
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(consume_twice())
+
+
+def test_body_is_read_on_demand_and_once():
+    request = make_streaming_request([b'{"a":', b" 1}"])
+
+    assert request.get_body() is None
+
+    async def read():
+        await request.parse_body()
+        await request.parse_body()
+        return await request.read_body(), [chunk async for chunk in request.stream()]
+
+    raw, chunks = asyncio.run(read())
+
+    assert raw == b'{"a": 1}'
+    assert chunks == [raw]
+    assert request.get_body() == {"a": 1}
+
+
+def test_body_is_none_until_parsed():
+    request = make_streaming_request([b'{"a": 1}'])
+
+    # Reading the body does not receive it
+    assert request.get_body() is None
+    assert request.get_body() is None
+
+    asyncio.run(request.parse_body())
+
+    assert request.get_body() == {"a": 1}
+
+
+def test_interceptors_see_the_parsed_body():
+    seen = []
+
+    class BodyInterceptor(Interceptor):
+        async def intercept(self, context: ExecutionContext, next):
+            seen.append(context.get_request().get_body())
+            return await next()
+
+    @Controller("/items")
+    class ItemsController:
+        @Post("/")
+        async def create(self):
+            return {"ok": True}
+
+    @Module(controllers=[ItemsController])
+    class ItemsModule:
+        pass
+
+    app = StormApplication(ItemsModule, settings=AppSettings())
+    app.add_global_interceptor(BodyInterceptor)
+    app._load_routes()
+    messages = [{"type": "http.request", "body": b'{"name": "a"}', "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await asyncio.sleep(3600)
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    headers = [(b"content-type", b"application/json"), (b"content-length", b"13")]
+    scope = {"type": "http", "method": "POST", "path": "/items", "raw_path": b"/items", "headers": headers, "query_string": b""}
+    asyncio.run(app(scope, receive, send))
+
+    assert sent[0]["status"] == 200
+    assert seen == [{"name": "a"}]
+
+
+def test_body_received():
+    assert make_request().body_received
+    assert not make_request(headers=[(b"content-length", b"3")]).body_received
+
+    request = make_streaming_request([b"a", b"b"])
+    request.headers = {"transfer-encoding": "chunked"}
+    assert not request.body_received
+    asyncio.run(request.read_body())
+    assert request.body_received
+
+
+def test_stream_stops_on_disconnect():
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    request = HttpRequest({"type": "http", "method": "POST", "path": "/", "headers": []}, receive, None)
+
+    assert asyncio.run(request.read_body()) == b""
+
+
+def test_body_over_the_limit_is_rejected_while_streaming():
+    request = make_streaming_request([b"x" * 10, b"x" * 10])
+    request.max_body_size = 15
+
+    with pytest.raises(PayloadTooLargeException):
+        asyncio.run(request.read_body())
+
+
+def test_body_size_is_unlimited_by_default():
+    request = make_streaming_request([b"x" * 1024] * 64)
+    request.max_body_size = AppSettings().max_body_size
+
+    assert len(asyncio.run(request.read_body())) == 64 * 1024
+    request.close()
+
+
+def test_large_body_is_spooled_to_a_file():
+    request = make_streaming_request([b"a" * 10, b"b" * 10, b"c" * 10])
+    request.spool_threshold = 15
+
+    async def read():
+        await request.parse_body()
+        return [chunk async for chunk in request.stream()], await request.read_body()
+
+    chunks, raw = asyncio.run(read())
+
+    body = request.get_body()
+    assert body is asyncio.run(request.get_body_file())
+    assert body.read() == b"a" * 10 + b"b" * 10 + b"c" * 10
+    assert b"".join(chunks) == raw == b"a" * 10 + b"b" * 10 + b"c" * 10
+    request.close()
+    assert body.closed
+
+
+def test_body_limit_decorator_marks_the_handler():
+    @BodyLimit(1024)
+    async def upload():
+        pass
+
+    assert upload._body_limit == 1024
+    with pytest.raises(ValueError):
+        BodyLimit(-1)
@@ -0,0 +1,168 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from storm.common.decorators.etag_policy import ETagPolicy
+from storm.common.enums.etag_mode import ETagMode
+from storm.common.serializer.json_codec import StdlibJsonCodec, get_json_codec, set_json_codec
+from storm.core.adapters import http_response
+from storm.core.adapters.http_response import HttpResponse, etag_hash_function, http_date, route_miss_response
+from storm.core.application import StormApplication
+from storm.core.settings import AppSettings
+
+
+def send_response(response):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(response.send(send))
+    return messages
+
+
+def test_not_found_response_is_encoded_once():
+    assert route_miss_response() is route_miss_response(frozenset())
+
+    start, body = send_response(route_miss_response())
+
+    assert start["status"] == 404
+    assert json.loads(body["body"]) == {"message": "Resource not found", "status_code": 404, "error": "NotFound"}
+    assert (b"content-length", str(len(body["body"])).encode()) in start["headers"]
+
+
+def test_method_not_allowed_response_has_allow_header():
+    start, _body = send_response(route_miss_response(frozenset({"GET", "DELETE"})))
+
+    assert start["status"] == 405
+    assert (b"allow", b"DELETE, GET") in start["headers"]
+
+
+def test_sent_headers_are_copies():
+    start, _body = send_response(route_miss_response())
+    start["headers"].append((b"x-extra", b"1"))
+
+    assert (b"x-extra", b"1") not in route_miss_response().headers
+
+
+class CountingJsonCodec(StdlibJsonCodec):
+    def __init__(self):
+        self.calls = 0
+
+    def dumps(self, obj):
+        self.calls += 1
+        return super().dumps(obj)
+
+
+def test_content_is_encoded_once():
+    codec = CountingJsonCodec()
+    previous = get_json_codec()
+    set_json_codec(codec)
+    try:
+        response = HttpResponse()
+        response.update_content({"items": list(range(10))})
+        response.set_etag()
+        start, body = send_response(response)
+    finally:
+        set_json_codec(previous)
+
+    assert codec.calls == 1
+    assert body["body"] == response.body
+    assert (b"Content-Length", str(len(response.body)).encode()) in [tuple(header) for header in start["headers"]]
+
+
+def test_new_content_resets_the_encoded_body():
+    response = HttpResponse()
+    response.update_content("héllo")
+    assert response.headers["Content-Length"] == "6"
+
+    response.update_content(None)
+    assert response.body == b""
+    assert "Content-Length" not in response.headers
+
+
+@pytest.mark.parametrize("algorithm", ["md5", "sha1", "sha256", "blake2b", "auto"])
+def test_etag_algorithms(algorithm):
+    response = HttpResponse(content="payload")
+
+    tag = response.set_etag(algorithm=algorithm, encoding="hex")
+
+    assert tag == "c-" + etag_hash_function(algorithm)(b"payload").hexdigest()
+    assert response.get_etag() == f'W/"{tag}"'
+
+
+def test_unknown_etag_algorithm_is_rejected():
+    with pytest.raises(ValueError):
+        HttpResponse(content="payload").set_etag(algorithm="crc-nope")
+
+
+def test_large_bodies_are_not_hashed():
+    response = HttpResponse(content="x" * 100)
+
+    assert response.set_etag(max_body_size=10) is None
+    assert response.get_etag() is None
+
+
+def test_etag_modes():
+    app = SimpleNamespace(settings=AppSettings(etag_mode="conditional", etag_algorithm="sha1", etag_max_body_size=0))
+
+    assert StormApplication._get_etag(app, HttpResponse(content="a")) is None
+    assert StormApplication._get_etag(app, HttpResponse(content="a"), client_etag='"x"') is not None
+    assert StormApplication._get_etag(app, HttpResponse(content="a"), ETagMode.ALWAYS) is not None
+    assert StormApplication._get_etag(app, HttpResponse(content="a"), ETagMode.NEVER, '"x"') is None
+
+
+def test_handler_supplied_etag_is_not_recomputed():
+    app = SimpleNamespace(settings=AppSettings(etag_mode="always"))
+    response = HttpResponse(content="a")
+    response.set_etag_value(42)
+
+    assert StormApplication._get_etag(app, response) == '"42"'
+
+
+def test_etag_policy_decorator():
+    @ETagPolicy("never")
+    async def handler():
+        pass
+
+    assert handler._etag_mode is ETagMode.NEVER
+    with pytest.raises(ValueError):
+        ETagPolicy("sometimes")
+
+
+def test_default_headers_are_sent_pre_encoded():
+    request = SimpleNamespace(headers={})
+    response = HttpResponse.from_request(request, {"ok": True})
+
+    assert "Date" not in response.headers
+    headers = dict(send_response(response)[0]["headers"])
+
+    assert headers[b"x-powered-by"] == b"Storm"
+    assert headers[b"connection"] == b"keep-alive"
+    assert headers[b"keep-alive"] == b"timeout=5"
+    assert headers[b"date"] == http_date()
+    assert headers[b"Content-Type"].startswith(b"application/json")
+
+
+def test_handler_headers_override_default_headers():
+    request = SimpleNamespace(headers={})
+    response = HttpResponse.from_request(request, "ok", headers={"Connection": "close"})
+
+    names = [name.lower() for name, _value in response.encode_headers()]
+
+    assert names.count(b"connection") == 1
+    assert dict(response.encode_headers())[b"Connection"] == b"close"
+
+
+def test_date_is_formatted_once_per_second(monkeypatch):
+    now = [1700000000.25]
+    monkeypatch.setattr(http_response.time, "time", lambda: now[0])
+    monkeypatch.setattr(http_response, "_date_cache", [0, b""])
+
+    first = http_date()
+    now[0] = 1700000000.75
+    assert http_date() is first
+    now[0] = 1700000001.0
+    assert http_date() == b"Tue, 14 Nov 2023 22:13:21 GMT"
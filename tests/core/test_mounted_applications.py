@@ -0,0 +1,125 @@
+import asyncio
+
+from storm.common.decorators import Controller, Get, Module
+from storm.common.serializer.json_codec import get_json_codec
+from storm.core.application import StormApplication
+from storm.core.context import AppContext
+from storm.core.settings import AppSettings
+
+
+def make_apps():
+    # modules are bound to the application that loads them, so each test declares its own
+    @Controller("/items")
+    class ParentItemsController:
+        @Get("/")
+        async def list_items(self):
+            return {"app": "parent", "items": [1, 2]}
+
+    @Controller("/items")
+    class ChildItemsController:
+        @Get("/")
+        async def list_items(self):
+            return {"app": AppContext.get_settings().app_name, "items": [1, 2]}
+
+    @Module(controllers=[ParentItemsController])
+    class ParentModule:
+        pass
+
+    @Module(controllers=[ChildItemsController])
+    class ChildModule:
+        pass
+
+    parent = StormApplication(ParentModule, settings=AppSettings(app_name="parent", json_codec="stdlib"))
+    child = StormApplication(ChildModule, settings=AppSettings(app_name="child", json_codec="orjson"))
+    parent.mount("/child", child)
+    parent._load_routes()
+    child._load_routes()
+    return parent, child
+
+
+async def get(app, path):
+    messages = []
+    received = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if received:
+            return received.pop()
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": path, "raw_path": path.encode(), "headers": [], "query_string": b""}
+    await app(scope, receive, send)
+    return messages[0]["status"], b"".join(message.get("body", b"") for message in messages[1:])
+
+
+async def lifespan(app, events):
+    queue = asyncio.Queue()
+    for event in events:
+        queue.put_nowait({"type": event})
+    sent = []
+
+    async def send(message):
+        sent.append(message["type"])
+
+    await app({"type": "lifespan"}, queue.get, send)
+    return sent
+
+
+def test_applications_keep_their_own_settings_and_codec():
+    outer_settings, outer_codec = AppContext.get_settings(), get_json_codec()
+    parent, _child = make_apps()
+
+    async def scenario():
+        return await get(parent, "/items"), await get(parent, "/child/items")
+
+    (parent_status, parent_body), (child_status, child_body) = asyncio.run(scenario())
+
+    assert parent_status == child_status == 200
+    # stdlib json for the parent, compact orjson output and the child settings for the child
+    assert parent_body == b'{"app": "parent", "items": [1, 2]}'
+    assert child_body == b'{"app":"child","items":[1,2]}'
+    assert AppContext.get_settings() is outer_settings
+    assert get_json_codec() is outer_codec
+
+
+def test_lifespan_reaches_mounted_applications():
+    parent, child = make_apps()
+    destroyed = []
+    child.root_module.onDestroy = lambda: destroyed.append("child")
+    calls = []
+
+    async def lifespan_app(scope, receive, send):
+        while True:
+            message = await receive()
+            calls.append(message["type"])
+            await send({"type": message["type"] + ".complete"})
+            if message["type"] == "lifespan.shutdown":
+                return
+
+    async def no_lifespan_app(scope, receive, send):
+        if scope["type"] == "lifespan":
+            raise ValueError("Unsupported scope")
+
+    parent.mount("/events", lifespan_app)
+    parent.mount("/legacy", no_lifespan_app)
+
+    sent = asyncio.run(lifespan(parent, ["lifespan.startup", "lifespan.shutdown"]))
+
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert calls == ["lifespan.startup", "lifespan.shutdown"]
+    assert destroyed == ["child"]
+    assert child._shutdown_called and parent._shutdown_called
+
+
+def test_failed_startup_of_a_mounted_app():
+    parent, _child = make_apps()
+
+    async def failing_app(scope, receive, send):
+        await receive()
+        await send({"type": "lifespan.startup.failed", "message": "no database"})
+
+    parent.mount("/failing", failing_app)
+
+    assert asyncio.run(lifespan(parent, ["lifespan.startup"])) == ["lifespan.startup.failed"]
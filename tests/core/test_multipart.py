@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+
+from storm.common.decorators.file import File
+from storm.common.decorators.form import Form
+from storm.common.exceptions.http import BadRequestException
+from storm.common.execution_context import ExecutionContext
+from storm.core.adapters.http_request import HttpRequest
+from storm.core.adapters.multipart import MultipartParser, parse_header_params
+
+BOUNDARY = b"----stormboundary"
+
+
+def make_body(*parts):
+    body = b""
+    for headers, content in parts:
+        body += b"--" + BOUNDARY + b"\r\n" + headers + b"\r\n\r\n" + content + b"\r\n"
+    return body + b"--" + BOUNDARY + b"--\r\n"
+
+
+BODY = make_body(
+    (b'Content-Disposition: form-data; name="title"', b"Report"),
+    (b'Content-Disposition: form-data; name="tag"', b"a"),
+    (b'Content-Disposition: form-data; name="tag"', b"b"),
+    (b'Content-Disposition: form-data; name="upload"; filename="data.bin"\r\nContent-Type: application/octet-stream', b"\r\n--x" * 100),
+)
+
+
+def make_request(body, chunk_size=7):
+    chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+    messages = [{"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+
+    async def receive():
+        return messages.pop(0)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "headers": [(b"content-type", b"multipart/form-data; boundary=" + BOUNDARY)],
+    }
+    return HttpRequest(scope, receive, None)
+
+
+def feed(parser, *chunks):
+    async def run():
+        for chunk in chunks:
+            await parser.feed(chunk)
+
+    asyncio.run(run())
+
+
+def test_parse_header_params():
+    assert parse_header_params('form-data; name="file"; filename="a \\"b\\".txt"') == (
+        "form-data",
+        {"name": "file", "filename": 'a "b".txt'},
+    )
+    assert parse_header_params("multipart/form-data; boundary=abc") == ("multipart/form-data", {"boundary": "abc"})
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 16, len(BODY)])
+def test_parser_handles_boundaries_split_across_chunks(chunk_size):
+    parser = MultipartParser(BOUNDARY)
+    feed(parser, *(BODY[i : i + chunk_size] for i in range(0, len(BODY), chunk_size)))
+    parser.finish()
+
+    assert parser.fields == {"title": "Report", "tag": ["a", "b"]}
+    upload = parser.files["upload"]
+    assert upload.filename == "data.bin"
+    assert upload.size == 500
+    assert upload.file.read() == b"\r\n--x" * 100
+
+
+def test_large_files_are_spooled_to_disk():
+    parser = MultipartParser(BOUNDARY, spool_threshold=64)
+    feed(parser, BODY)
+    parser.finish()
+
+    assert not parser.files["upload"].in_memory
+    assert parser.files["upload"].file.read() == b"\r\n--x" * 100
+    parser.close()
+
+
+def test_writes_to_disk_are_done_in_the_executor(monkeypatch):
+    parser = MultipartParser(BOUNDARY, spool_threshold=64)
+    offloaded = []
+    run_in_executor = asyncio.BaseEventLoop.run_in_executor
+
+    def record(loop, executor, func, *args):
+        offloaded.append(len(args[0]))
+        return run_in_executor(loop, executor, func, *args)
+
+    monkeypatch.setattr(asyncio.BaseEventLoop, "run_in_executor", record)
+    feed(parser, *(BODY[i : i + 16] for i in range(0, len(BODY), 16)))
+
+    upload = parser.files["upload"]
+    # The start of the file is written in memory, everything from the rollover on in the executor
+    assert upload.size - 64 <= sum(offloaded) < upload.size
+    assert upload.file.read() == b"\r\n--x" * 100
+    parser.close()
+
+
+def test_small_files_stay_in_memory():
+    parser = MultipartParser(BOUNDARY, spool_threshold=500)
+    feed(parser, BODY)
+    parser.finish()
+
+    upload = parser.files["upload"]
+    assert upload.size == upload.spool_threshold
+    assert upload.in_memory
+    parser.close()
+
+
+def test_incomplete_body_is_rejected():
+    parser = MultipartParser(BOUNDARY)
+    feed(parser, BODY[:-10])
+
+    with pytest.raises(BadRequestException):
+        parser.finish()
+
+
+def test_part_without_name_is_rejected():
+    parser = MultipartParser(BOUNDARY)
+
+    with pytest.raises(BadRequestException):
+        feed(parser, make_body((b"Content-Disposition: form-data", b"value")))
+
+
+def test_request_form_streams_the_body():
+    request = make_request(BODY)
+
+    fields, files = asyncio.run(request.form())
+
+    assert fields["title"] == "Report"
+    assert asyncio.run(files["upload"].read(4)) == b"\r\n--"
+    asyncio.run(request.parse_body())
+    assert request.get_body()["upload"] is files["upload"]
+    request.close()
+    assert files["upload"].file.closed
+
+
+def test_file_and_form_params_resolve_from_the_request():
+    request = make_request(BODY)
+    ExecutionContext.set_request(request)
+
+    async def resolve():
+        return await Form().resolve("title"), await Form("tag").resolve(), await File().resolve("upload")
+
+    title, tags, upload = asyncio.run(resolve())
+
+    assert title == "Report"
+    assert tags == ["a", "b"]
+    assert upload.size == 500
@@ -0,0 +1,71 @@
+import asyncio
+import gc
+import weakref
+
+from storm.common.decorators import Body, Controller, Module, Post
+from storm.core.application import StormApplication
+from storm.core.resolvers.params_resolver import handler_parameters
+from storm.core.settings import AppSettings
+
+
+class UsersController:
+    def find(self, user_id: int, verbose: bool = False):
+        pass
+
+
+def test_parameters_are_kept_on_the_function():
+    controller = UsersController()
+
+    parameters = handler_parameters(controller.find)
+
+    assert list(parameters) == ["user_id", "verbose"]
+    assert UsersController.find.__storm_params__ is parameters
+    assert handler_parameters(UsersController().find) is parameters
+
+
+def test_parameters_do_not_keep_controllers_alive():
+    controller = UsersController()
+    reference = weakref.ref(controller)
+    handler_parameters(controller.find)
+
+    del controller
+    gc.collect()
+
+    assert reference() is None
+
+
+def test_spooled_body_is_not_consumed_by_plain_parameters():
+    received = {}
+
+    @Controller("/uploads")
+    class UploadsController:
+        @Post("/")
+        async def upload(self, name, payload=Body(), field=Body("name")):
+            received.update(name=name, field=field, payload=payload.read())
+            return {"ok": True}
+
+    @Module(controllers=[UploadsController])
+    class UploadsModule:
+        pass
+
+    app = StormApplication(UploadsModule, settings=AppSettings(body_spool_threshold=16))
+    app._load_routes()
+    body = b'{"name": "report", "size": 1}'
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await asyncio.sleep(3600)
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "path": "/uploads", "raw_path": b"/uploads", "headers": [], "query_string": b""}
+    asyncio.run(app(scope, receive, send))
+
+    assert sent[0]["status"] == 200
+    # A body over the threshold is a file: it has no fields, and every reader gets it from its start
+    assert received == {"name": None, "field": None, "payload": body}
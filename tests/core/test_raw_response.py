@@ -0,0 +1,53 @@
+import asyncio
+from types import SimpleNamespace
+
+from storm.common.decorators.raw import Raw
+from storm.core.adapters.http_request import HttpRequest
+from storm.core.adapters.http_response import RawResponse
+from storm.core.application import StormApplication
+from storm.core.interceptor_pipeline import InterceptorPipeline
+from storm.core.middleware_pipeline import MiddlewarePipeline
+
+HEALTH = RawResponse("ok", headers=[(b"cache-control", b"no-store")], content_type="text/plain")
+
+
+def send_response(response):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(response.send(send))
+    return messages
+
+
+def test_raw_response_is_encoded_once():
+    start, body = send_response(HEALTH)
+
+    assert start["status"] == 200
+    assert start["headers"] == [(b"content-type", b"text/plain"), (b"content-length", b"2"), (b"cache-control", b"no-store")]
+    assert body == {"type": "http.response.body", "body": b"ok"}
+    # The headers of the shared response are not exposed to the server
+    assert start["headers"] is not HEALTH.headers
+
+
+def test_raw_handler_results():
+    assert RawResponse.from_content(HEALTH) is HEALTH
+    assert RawResponse.from_content(b"\x00").headers == [(b"content-type", b"application/octet-stream"), (b"content-length", b"1")]
+    assert RawResponse.from_content("hé").body == "hé".encode("utf-8")
+    assert RawResponse.from_content(None).headers == [(b"content-length", b"0")]
+
+
+def test_raw_route_skips_the_http_response():
+    @Raw()
+    async def health():
+        return HEALTH
+
+    app = SimpleNamespace(middleware_pipeline=MiddlewarePipeline(), interceptor_pipeline=InterceptorPipeline())
+    request = HttpRequest({"type": "http", "method": "GET", "path": "/health", "headers": []}, None, None)
+
+    response, status_code = asyncio.run(StormApplication.handle_request(app, "GET", "/health", request, None, route=(health, {})))
+
+    assert health._raw is True
+    assert response is HEALTH
+    assert status_code == 200
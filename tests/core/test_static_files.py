@@ -0,0 +1,115 @@
+import asyncio
+import gzip
+
+import pytest
+
+from storm.core.adapters.static_files import StaticFiles, guess_content_type
+from storm.core.static_module import StaticModule
+
+SCRIPT = b"console.log('storm');" * 50
+
+
+@pytest.fixture
+def directory(tmp_path):
+    (tmp_path / "app.js").write_bytes(SCRIPT)
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(SCRIPT))
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "index.html").write_bytes(b"<h1>Docs</h1>")
+    (tmp_path / ".env").write_bytes(b"SECRET=1")
+    (tmp_path / "large.bin").write_bytes(b"\0" * 4096)
+    return tmp_path
+
+
+def request(app, path, headers=None, method="GET"):
+    messages = []
+
+    async def receive():
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, "headers": headers or []}
+    asyncio.run(app(scope, receive, send))
+    response_headers = {key.decode().lower(): value.decode() for key, value in messages[0]["headers"]}
+    return messages[0]["status"], response_headers, b"".join(message.get("body", b"") for message in messages[1:])
+
+
+def test_guess_content_type():
+    assert guess_content_type("app.js") == "text/javascript; charset=utf-8"
+    assert guess_content_type("logo.PNG") == "image/png"
+    assert guess_content_type("archive.unknown-ext") == "application/octet-stream"
+
+
+def test_directory_is_indexed(directory):
+    app = StaticFiles(directory)
+
+    assert sorted(app.files) == ["/app.js", "/docs/index.html", "/large.bin"]
+    assert set(app.files["/app.js"].variants) == {"identity", "gzip"}
+
+
+def test_precompressed_variant_is_served(directory):
+    app = StaticFiles(directory)
+
+    status, headers, body = request(app, "/app.js", [(b"accept-encoding", b"gzip, deflate")])
+
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(body) == SCRIPT
+    assert request(app, "/app.js")[2] == SCRIPT
+
+
+def test_conditional_get_is_answered_from_the_index(directory):
+    app = StaticFiles(directory)
+    _status, headers, _body = request(app, "/app.js")
+    (directory / "app.js").unlink()
+
+    status, _headers, body = request(app, "/app.js", [(b"if-none-match", headers["etag"].encode())])
+
+    assert status == 304
+    assert body == b""
+
+
+def test_small_files_are_cached(directory):
+    app = StaticFiles(directory, cache_max_size=2048, cache_max_file_size=2048)
+    request(app, "/app.js")
+    (directory / "app.js").write_bytes(b"changed")
+
+    assert request(app, "/app.js")[2] == SCRIPT
+    assert request(app, "/large.bin")[2] == b"\0" * 4096
+    app.refresh()
+    assert request(app, "/app.js")[2] == b"changed"
+
+
+def test_cache_is_bounded(directory):
+    app = StaticFiles(directory, cache_max_size=len(SCRIPT) + 10)
+    request(app, "/app.js")
+    request(app, "/docs/index.html")
+
+    assert list(app._cache) == [str(directory / "docs" / "index.html")]
+
+
+def test_index_html_hidden_files_and_methods(directory):
+    app = StaticFiles(directory)
+
+    assert request(app, "/docs/")[2] == b"<h1>Docs</h1>"
+    assert request(app, "/.env")[0] == 404
+    assert request(app, "/app.js", method="POST")[0] == 405
+    assert request(app, "/app.js", method="HEAD")[2] == b""
+
+
+def test_ranges_are_streamed_from_disk(directory):
+    status, headers, body = request(StaticFiles(directory), "/large.bin", [(b"range", b"bytes=0-9")])
+
+    assert status == 206
+    assert headers["content-range"] == "bytes 0-9/4096"
+    assert body == b"\0" * 10
+
+
+def test_static_module_mounts_the_directory(directory):
+    module = StaticModule("/static", directory)
+
+    [(prefix, app)] = module.mounts
+    assert prefix == "/static"
+    assert isinstance(app, StaticFiles)
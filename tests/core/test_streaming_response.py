@@ -0,0 +1,190 @@
+import asyncio
+import json
+
+import pytest
+
+from storm.common.decorators import Controller, Module, Post
+from storm.common.decorators.stream_json import StreamJson
+from storm.common.enums.json_stream_format import JsonStreamFormat
+from storm.common.execution_context import ExecutionContext
+from storm.core.adapters.http_response import JsonArrayResponse, NDJsonResponse, StreamingResponse
+from storm.core.application import StormApplication
+from storm.core.settings import AppSettings
+
+
+def run_stream(response, receive=None):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(response.send(send, receive))
+    return messages[0], [(message["body"], message["more_body"]) for message in messages[1:]]
+
+
+def test_small_chunks_are_coalesced():
+    async def produce():
+        for i in range(10):
+            yield f"{i}"
+
+    start, chunks = run_stream(StreamingResponse(produce(), chunk_size=4))
+
+    assert start["status"] == 200
+    assert chunks == [(b"0123", True), (b"4567", True), (b"89", False)]
+
+
+def test_large_chunks_are_sent_as_is():
+    _start, chunks = run_stream(StreamingResponse([b"a" * 10, b"b", b"c" * 10], chunk_size=4))
+
+    assert chunks == [(b"a" * 10, True), (b"bcccccccccc", True), (b"", False)]
+
+
+def test_sync_generators_run_in_the_executor():
+    def produce():
+        yield b"x"
+        yield "y"
+
+    _start, chunks = run_stream(StreamingResponse(produce(), chunk_size=0))
+
+    assert chunks == [(b"x", True), (b"y", True), (b"", False)]
+
+
+def test_sync_generator_chunks_are_pulled_in_batches(monkeypatch):
+    batches = []
+    next_batch = StreamingResponse._next_batch
+
+    def counting_next_batch(iterator, size):
+        batches.append(size)
+        return next_batch(iterator, size)
+
+    monkeypatch.setattr(StreamingResponse, "_next_batch", staticmethod(counting_next_batch))
+
+    def produce():
+        for _ in range(100):
+            yield b"x"
+
+    _start, chunks = run_stream(StreamingResponse(produce(), chunk_size=10))
+
+    assert b"".join(chunk for chunk, _more_body in chunks) == b"x" * 100
+    # One executor call per 10 bytes, and one noticing the end of the generator
+    assert len(batches) == 11
+
+
+def test_streaming_stops_when_the_client_disconnects():
+    produced = []
+    closed = asyncio.Event()
+
+    async def produce():
+        try:
+            while True:
+                produced.append(len(produced))
+                yield b"chunk"
+                await asyncio.sleep(0.01)
+        finally:
+            closed.set()
+
+    async def receive():
+        await asyncio.sleep(0.05)
+        return {"type": "http.disconnect"}
+
+    response = StreamingResponse(produce(), chunk_size=0)
+    _start, chunks = run_stream(response, receive)
+
+    assert response.disconnected
+    assert response.is_closed()
+    assert closed.is_set()
+    assert 0 < len(produced) < 20
+    assert len(chunks) == len(produced)
+
+
+def test_unread_request_body_is_left_to_the_stream():
+    @Controller("/echo")
+    class EchoController:
+        @Post("/")
+        async def echo(self):
+            request = ExecutionContext.get_request()
+
+            async def upper():
+                async for chunk in request.stream():
+                    yield chunk.upper()
+
+            return StreamingResponse(upper(), chunk_size=0)
+
+    @Module(controllers=[EchoController])
+    class EchoModule:
+        pass
+
+    app = StormApplication(EchoModule, settings=AppSettings())
+    app._load_routes()
+    events = [{"type": "http.request", "body": chunk, "more_body": chunk != b"c"} for chunk in (b"a", b"b", b"c")]
+
+    async def receive():
+        if events:
+            await asyncio.sleep(0.01)
+            return events.pop(0)
+        await asyncio.sleep(3600)
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    headers = [(b"transfer-encoding", b"chunked")]
+    scope = {"type": "http", "method": "POST", "path": "/echo", "raw_path": b"/echo", "headers": headers, "query_string": b""}
+    asyncio.run(app(scope, receive, send))
+
+    assert sent[0]["status"] == 200
+    assert b"".join(message.get("body", b"") for message in sent[1:]) == b"ABC"
+
+
+def test_streaming_responses_have_no_etag():
+    response = StreamingResponse(iter([b"a"]))
+
+    assert response.set_etag() is None
+    assert "Content-Length" not in response.headers
+
+
+def test_json_array_is_written_one_item_at_a_time():
+    items = [{"id": i} for i in range(100)]
+
+    start, chunks = run_stream(JsonArrayResponse(iter(items), chunk_size=64))
+    body = b"".join(chunk for chunk, _more_body in chunks)
+
+    assert dict(start["headers"])[b"Content-Type"].startswith(b"application/json")
+    assert json.loads(body) == items
+    assert all(len(chunk) < 64 + 16 for chunk, _more_body in chunks)
+    assert chunks[-1][1] is False
+
+
+@pytest.mark.parametrize("content", [[], iter(()), (item for item in ())])
+def test_empty_json_array(content):
+    _start, chunks = run_stream(JsonArrayResponse(content))
+
+    assert b"".join(chunk for chunk, _more_body in chunks) == b"[]"
+
+
+def test_ndjson_from_sync_and_async_generators():
+    def produce():
+        yield {"id": 1}
+        yield {"id": 2}
+
+    async def produce_async():
+        for item in produce():
+            yield item
+
+    for content in (produce(), produce_async()):
+        start, chunks = run_stream(NDJsonResponse(content, chunk_size=0))
+
+        assert dict(start["headers"])[b"Content-Type"] == b"application/x-ndjson"
+        lines = b"".join(chunk for chunk, _more_body in chunks).splitlines()
+        assert [json.loads(line) for line in lines] == [{"id": 1}, {"id": 2}]
+
+
+def test_stream_json_decorator():
+    @StreamJson(format="ndjson")
+    def handler():
+        pass
+
+    assert handler._json_stream is JsonStreamFormat.NDJSON
+    with pytest.raises(ValueError):
+        StreamJson(format="csv")
@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+from storm.common.enums.versioning_type import VersioningType
+from storm.core.appliction_config import ApplicationConfig
+from storm.core.versioning_strategy import (
+    CustomVersioningStrategy,
+    HeaderVersioningStrategy,
+    MediaTypeVersioningStrategy,
+    NoVersioningStrategy,
+    UriVersioningStrategy,
+)
+
+
+def make_request(headers=None):
+    headers = headers or {}
+    return SimpleNamespace(get_header=lambda key, default=None: headers.get(key, default))
+
+
+def test_uri_strategy_strips_version():
+    strategy = UriVersioningStrategy("v")
+
+    assert strategy.extract(None, "/v2/users") == ("2", "/users")
+    assert strategy.extract(None, "/v12") == ("12", "/")
+    assert strategy.extract(None, "/users") == (None, "/users")
+    assert strategy.extract(None, "/v2users") == (None, "/v2users")
+    assert strategy.extract(None, "/v/users") == (None, "/v/users")
+
+
+def test_uri_strategy_with_global_prefix():
+    strategy = UriVersioningStrategy("v", "api")
+
+    assert strategy.extract(None, "/api/v1/users/5") == ("1", "/api/users/5")
+    assert strategy.extract(None, "/api/v1") == ("1", "/api")
+    assert strategy.extract(None, "/v1/users") == (None, "/v1/users")
+
+
+def test_header_strategy():
+    strategy = HeaderVersioningStrategy("X-API-Version")
+    request = make_request({"x-api-version": "3"})
+
+    assert strategy.extract(request, "/users") == ("3", "/users")
+    assert strategy.cache_token(request) == "3"
+
+
+def test_media_type_strategy():
+    strategy = MediaTypeVersioningStrategy("v=")
+
+    assert strategy.extract(make_request({"accept": "application/json;v=2"}), "/users") == ("2", "/users")
+    assert strategy.extract(make_request({"accept": "application/json"}), "/users") == (None, "/users")
+
+
+def test_custom_strategy_is_not_cacheable():
+    strategy = CustomVersioningStrategy(lambda request: "7")
+
+    assert strategy.extract(make_request(), "/users") == ("7", "/users")
+    assert not strategy.cacheable
+
+
+def test_config_compiles_strategy_once_configured():
+    config = ApplicationConfig()
+    assert isinstance(config.get_versioning_strategy(), NoVersioningStrategy)
+
+    config.enable_versioning({"type": VersioningType.URI})
+    config.set_global_prefix("/api/")
+
+    strategy = config.get_versioning_strategy()
+    assert isinstance(strategy, UriVersioningStrategy)
+    assert strategy.extract(None, "/api/v1/users") == ("1", "/api/users")